@@ -22,7 +22,9 @@ from fidesops.schemas.connection_configuration.connection_secrets import (
     ConnectionTestStatus,
 )
 
+from fidesops.graph.graph_cache import get_dataset_graph_cache
 from fidesops.service.connectors import get_connector
+from fidesops.service.connectors.connector_registry import get_connector_registry
 from fidesops.schemas.api import BulkUpdateFailed
 from fidesops.schemas.connection_configuration.connection_config import (
     ConnectionConfigurationResponse,
@@ -122,6 +124,8 @@ def patch_connections(
             connection_config = ConnectionConfig.create_or_update(
                 db, data=config.dict()
             )
+            get_connector_registry().invalidate(connection_config.key)
+            get_dataset_graph_cache().invalidate()
             created_or_updated.append(connection_config)
         except KeyOrNameAlreadyExists as exc:
             logger.warning(
@@ -162,6 +166,8 @@ def delete_connection(
     connection_config = get_connection_config_or_error(db, connection_key)
     logger.info(f"Deleting connection config with key '{connection_key}'.")
     connection_config.delete(db)
+    get_connector_registry().invalidate(connection_key)
+    get_dataset_graph_cache().invalidate()
 
 
 def validate_secrets(
@@ -244,6 +250,7 @@ async def put_connection_config_secrets(
     # Save validated secrets, regardless of whether they've been verified.
     logger.info(f"Updating connection config secrets for '{connection_key}'")
     connection_config.save(db=db)
+    get_connector_registry().invalidate(connection_key)
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -25,6 +25,7 @@ from fidesops.api.v1.urn_registry import (
     DATASET_BY_KEY,
     V1_URL_PREFIX,
 )
+from fidesops.graph.graph_cache import get_dataset_graph_cache
 from fidesops.graph.traversal import DatasetGraph, Traversal
 from fidesops.models.connectionconfig import ConnectionConfig
 from fidesops.models.datasetconfig import DatasetConfig, convert_dataset_to_graph
@@ -155,6 +156,9 @@ def patch_datasets(
                 )
             )
 
+    # invalidate only once the updates are committed, so that a privacy request starting
+    # in the meantime can't cache a graph built from the datasets before this update
+    get_dataset_graph_cache().invalidate()
     return BulkPutDataset(
         succeeded=created_or_updated,
         failed=failed,
@@ -254,3 +258,4 @@ def delete_dataset(
         f"Deleting dataset '{fides_key}' for connection '{connection_config.key}'"
     )
     dataset_config.delete(db)
+    get_dataset_graph_cache().invalidate()
@@ -1,10 +1,16 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, HTTPException
+from pydantic import conlist
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST
 
-from fidesops.api.v1.urn_registry import MASKING, MASKING_STRATEGY, V1_URL_PREFIX
+from fidesops.api.v1.urn_registry import (
+    MASKING,
+    MASKING_BATCH,
+    MASKING_STRATEGY,
+    V1_URL_PREFIX,
+)
 from fidesops.common_exceptions import ValidationError
 from fidesops.schemas.masking.masking_response import MaskingAPIResponse
 from fidesops.schemas.masking.masking_strategy_description import (
@@ -40,6 +46,32 @@ def mask_value(masking_strategy: PolicyMaskingSpec, value: str) -> MaskingAPIRes
         raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.put(MASKING_BATCH, response_model=List[MaskingAPIResponse])
+def mask_values(
+    masking_strategy: PolicyMaskingSpec = Body(...),
+    values: conlist(str, max_items=1000) = Body(...),  # type: ignore
+) -> List[MaskingAPIResponse]:
+    """Masks each of the values provided using the provided masking strategy"""
+    try:
+        strategy = get_strategy(
+            masking_strategy.strategy, masking_strategy.configuration
+        )
+        logger.info(
+            f"Starting masking of {len(values)} values with strategy {masking_strategy.strategy}"
+        )
+        masked_values = strategy.mask_batch(values, None)
+        return [
+            MaskingAPIResponse(plain=value, masked_value=masked_value)
+            for value, masked_value in zip(values, masked_values)
+        ]
+    except NoSuchStrategyException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get(MASKING_STRATEGY, response_model=List[MaskingStrategyDescription])
 def list_masking_strategies() -> List[MaskingStrategyDescription]:
     """Lists available masking strategies with instructions on how to use them"""
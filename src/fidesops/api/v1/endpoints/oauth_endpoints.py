@@ -36,7 +36,7 @@ from fidesops.models.client import ClientDetail
 from fidesops.schemas.client import ClientCreatedResponse
 
 from fidesops.schemas.oauth import AccessToken, OAuth2ClientCredentialsRequestForm
-from fidesops.util.oauth_util import verify_oauth_client
+from fidesops.util.oauth_util import get_oauth_client_cache, verify_oauth_client
 
 router = APIRouter(tags=["OAuth"], prefix=V1_URL_PREFIX)
 
@@ -115,6 +115,7 @@ def delete_client(client_id: str, db: Session = Depends(get_db)) -> None:
         return
     logging.info("Deleting client")
     client.delete(db)
+    get_oauth_client_cache().invalidate_client(client_id)
 
 
 @router.get(
@@ -155,6 +156,7 @@ def set_client_scopes(
 
     logging.info("Updating client scopes")
     client.update(db, data={"scopes": scopes})
+    get_oauth_client_cache().invalidate_client(client_id)
 
 
 @router.get(
@@ -1,21 +1,22 @@
 import logging
 from collections import defaultdict
 from datetime import date
-from typing import List, Optional, Union, DefaultDict, Dict, Set
+from typing import Any, List, Optional, Union, DefaultDict, Dict, Sequence, Set
 
 from fastapi import APIRouter, Body, Depends, Security, HTTPException
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
 from pydantic import conlist
-from sqlalchemy.orm import Session
+from redis.exceptions import RedisError
+from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_424_FAILED_DEPENDENCY,
 )
 
-from fidesops import common_exceptions
 from fidesops.api import deps
 from fidesops.api.v1 import scope_registry as scopes
 from fidesops.api.v1 import urn_registry as urls
@@ -36,13 +37,13 @@ from fidesops.models.privacy_request import (
     PrivacyRequest,
     PrivacyRequestStatus,
 )
+from fidesops.schemas.api import CursorPage
 from fidesops.schemas.dataset import DryRunDatasetResponse, CollectionAddressResponse
 from fidesops.schemas.external_https import (
     SecondPartyResponseFormat,
     PrivacyRequestResumeFormat,
 )
 from fidesops.schemas.masking.masking_configuration import MaskingConfiguration
-from fidesops.schemas.masking.masking_secrets import MaskingSecretCache
 from fidesops.schemas.policy import Rule
 from fidesops.schemas.privacy_request import (
     PrivacyRequestCreate,
@@ -59,8 +60,9 @@ from fidesops.service.masking.strategy.masking_strategy_factory import (
 from fidesops.service.privacy_request.request_runner_service import PrivacyRequestRunner
 from fidesops.task.graph_task import collect_queries, EMPTY_REQUEST
 from fidesops.task.task_resources import TaskResources
-from fidesops.util.cache import FidesopsRedis
+from fidesops.util.cache import FidesopsRedis, get_cache_index_key
 from fidesops.util.oauth_util import verify_oauth_client, verify_callback_oauth
+from fidesops.util.pagination import paginate_by_cursor
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Privacy Requests"], prefix=urls.V1_URL_PREFIX)
@@ -85,6 +87,56 @@ def get_privacy_request_or_error(
     return privacy_request
 
 
+def get_masking_strategies_with_secrets(policy: Policy) -> List[MaskingStrategy]:
+    """Returns the distinct erasure masking strategies of the policy that need secrets"""
+    erasure_rules: List[Rule] = policy.get_rules_for_action(
+        action_type=ActionType.erasure
+    )
+    unique_masking_strategies_by_name: Set[str] = set()
+    masking_strategies: List[MaskingStrategy] = []
+    for rule in erasure_rules:
+        strategy_name: str = rule.masking_strategy["strategy"]
+        if strategy_name in unique_masking_strategies_by_name:
+            continue
+        unique_masking_strategies_by_name.add(strategy_name)
+        masking_strategy = get_strategy(strategy_name, {})
+        if masking_strategy.secrets_required():
+            masking_strategies.append(masking_strategy)
+    return masking_strategies
+
+
+def create_privacy_requests(
+    db: Session,
+    to_create: Dict[int, Dict[str, Any]],
+    failed: Dict[int, Dict[str, Any]],
+) -> Dict[int, PrivacyRequest]:
+    """
+    Create the privacy requests together in one commit. If that fails, fall back to
+    creating them one at a time so only the offending items are reported in `failed`.
+    """
+    if not to_create:
+        return {}
+    try:
+        privacy_requests = PrivacyRequest.create_all(
+            db=db, data=list(to_create.values())
+        )
+        return dict(zip(to_create.keys(), privacy_requests))
+    except Exception as exc:
+        logger.warning("Bulk create failed, creating privacy requests singly: %s", exc)
+
+    created: Dict[int, PrivacyRequest] = {}
+    for position, kwargs in to_create.items():
+        try:
+            created[position] = PrivacyRequest.create(db=db, data=kwargs)
+        except Exception as exc:
+            logger.error("Exception: %s", exc)
+            failed[position] = {
+                "message": "This record could not be added",
+                "data": kwargs,
+            }
+    return created
+
+
 @router.post(
     urls.PRIVACY_REQUESTS,
     status_code=200,
@@ -105,15 +157,27 @@ def create_privacy_request(
 
     You cannot update privacy requests after they've been created.
     """
-    created = []
-    failed = []
+    created: Dict[int, PrivacyRequest] = {}
+    failed: Dict[int, Dict[str, Any]] = {}
     # Optional fields to validate here are those that are both nullable in the DB, and exist
     # on the Pydantic schema
 
     logger.info(f"Starting creation for {len(data)} privacy requests")
 
+    policy_keys: Set[str] = {
+        privacy_request_data.policy_key for privacy_request_data in data
+    }
+    logger.info(f"Finding policies with keys {sorted(policy_keys)}")
+    policies: Dict[str, Policy] = {
+        policy.key: policy
+        for policy in Policy.filter(db=db, conditions=(Policy.key.in_(policy_keys)))
+    }
+    masking_strategies: Dict[str, List[MaskingStrategy]] = {}
+
     optional_fields = ["external_id", "started_processing_at", "finished_processing_at"]
-    for privacy_request_data in data:
+    to_create: Dict[int, Dict[str, Any]] = {}
+    cache_values: Dict[str, Dict[str, Any]] = {}
+    for position, privacy_request_data in enumerate(data):
         if not any(privacy_request_data.identity.dict().values()):
             logger.warning(
                 "Create failed for privacy request with no identity provided"
@@ -122,15 +186,10 @@ def create_privacy_request(
                 "message": "You must provide at least one identity to process",
                 "data": privacy_request_data,
             }
-            failed.append(failure)
+            failed[position] = failure
             continue
 
-        logger.info(f"Finding policy with key '{privacy_request_data.policy_key}'")
-        policy = Policy.get_by(
-            db=db,
-            field="key",
-            value=privacy_request_data.policy_key,
-        )
+        policy = policies.get(privacy_request_data.policy_key)
         if policy is None:
             logger.warning(
                 f"Create failed for privacy request with invalid policy key {privacy_request_data.policy_key}'"
@@ -140,7 +199,7 @@ def create_privacy_request(
                 "message": f"Policy with key {privacy_request_data.policy_key} does not exist",
                 "data": privacy_request_data,
             }
-            failed.append(failure)
+            failed[position] = failure
             continue
 
         kwargs = {
@@ -155,66 +214,89 @@ def create_privacy_request(
                 kwargs[field] = attr
 
         try:
-            privacy_request = PrivacyRequest.create(db=db, data=kwargs)
-
-            # Store identity in the cache
-            logger.info(f"Caching identity for privacy request {privacy_request.id}")
-            privacy_request.cache_identity(privacy_request_data.identity)
-            privacy_request.cache_encryption(privacy_request_data.encryption_key)
+            if policy.key not in masking_strategies:
+                masking_strategies[policy.key] = get_masking_strategies_with_secrets(
+                    policy
+                )
+        except Exception as exc:
+            logger.error("Exception: %s", exc)
+            failed[position] = {
+                "message": "This record could not be added",
+                "data": kwargs,
+            }
+            continue
+        to_create[position] = kwargs
+
+    for position, privacy_request in create_privacy_requests(
+        db, to_create, failed
+    ).items():
+        privacy_request_data = data[position]
+        # Store identity, encryption keys and masking secrets in the cache
+        logger.info(f"Caching identity for privacy request {privacy_request.id}")
+        values = {
+            **privacy_request.get_identity_cache_values(privacy_request_data.identity),
+            **privacy_request.get_encryption_cache_values(
+                privacy_request_data.encryption_key
+            ),
+        }
+        logger.info(
+            f"Caching masking secrets for privacy request {privacy_request.id}"
+        )
+        policy_key = privacy_request_data.policy_key
+        for masking_strategy in masking_strategies[policy_key]:
+            for masking_secret in masking_strategy.generate_secrets_for_cache():
+                values.update(
+                    privacy_request.get_masking_secret_cache_values(masking_secret)
+                )
+        created[position] = privacy_request
+        cache_values[get_cache_index_key(privacy_request.id)] = values
 
-            # Store masking secrets in the cache
-            logger.info(
-                f"Caching masking secrets for privacy request {privacy_request.id}"
-            )
-            erasure_rules: List[Rule] = policy.get_rules_for_action(
-                action_type=ActionType.erasure
-            )
-            unique_masking_strategies_by_name: Set[str] = set()
-            for rule in erasure_rules:
-                strategy_name: str = rule.masking_strategy["strategy"]
-                if strategy_name in unique_masking_strategies_by_name:
-                    continue
-                unique_masking_strategies_by_name.add(strategy_name)
-                masking_strategy = get_strategy(strategy_name, {})
-                if masking_strategy.secrets_required():
-                    masking_secrets: List[
-                        MaskingSecretCache
-                    ] = masking_strategy.generate_secrets_for_cache()
-                    for masking_secret in masking_secrets:
-                        privacy_request.cache_masking_secret(masking_secret)
+    try:
+        cache.set_all_with_autoexpire(cache_values)
+    except RedisError as exc:
+        logger.error("RedisError: %s", exc)
+        # The created privacy requests can't run without their cached identities
+        for privacy_request in created.values():
+            privacy_request.error_processing(db)
+        raise HTTPException(
+            status_code=HTTP_424_FAILED_DEPENDENCY,
+            detail=f"Unable to cache privacy request data. Fidesops is unable to accept PrivacyRequests: {exc}",
+        )
+    except Exception as exc:
+        logger.error("Exception: %s", exc)
+        for position in list(created):
+            failed[position] = {
+                "message": "This record could not be added",
+                "data": to_create[position],
+            }
+            del created[position]
 
+    for position, privacy_request in list(created.items()):
+        try:
             PrivacyRequestRunner(
                 cache=cache,
                 privacy_request=privacy_request,
             ).submit()
-
-        except common_exceptions.RedisConnectionError as exc:
-            logger.error("RedisConnectionError: %s", exc)
-            # Thrown when cache.ping() fails on cache connection retrieval
-            raise HTTPException(
-                status_code=HTTP_424_FAILED_DEPENDENCY,
-                detail=exc.args[0],
-            )
         except Exception as exc:
             logger.error("Exception: %s", exc)
-            failure = {
+            failed[position] = {
                 "message": "This record could not be added",
-                "data": kwargs,
+                "data": to_create[position],
             }
-            failed.append(failure)
-        else:
-            created.append(privacy_request)
+            del created[position]
 
     return BulkPostPrivacyRequests(
-        succeeded=created,
-        failed=failed,
+        succeeded=[created[position] for position in sorted(created)],
+        failed=[failed[position] for position in sorted(failed)],
     )
 
 
 @router.get(
     urls.PRIVACY_REQUESTS,
     dependencies=[Security(verify_oauth_client, scopes=[scopes.PRIVACY_REQUEST_READ])],
-    response_model=Page[Union[PrivacyRequestVerboseResponse, PrivacyRequestResponse]],
+    response_model=CursorPage[
+        Union[PrivacyRequestVerboseResponse, PrivacyRequestResponse]
+    ],
 )
 def get_request_status(
     *,
@@ -232,11 +314,17 @@ def get_request_status(
     errored_gt: Optional[date] = None,
     external_id: Optional[str] = None,
     verbose: Optional[bool] = False,
-) -> AbstractPage[PrivacyRequest]:
-    """Returns PrivacyRequest information. Supports a variety of optional query params.
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+) -> CursorPage[PrivacyRequest]:
+    """Returns PrivacyRequest information, newest first. Supports a variety of optional query params.
 
     To fetch a single privacy request, use the id query param `?id=`.
     To see individual execution logs, use the verbose query param `?verbose=True`.
+    To fetch the next page, pass the `next_cursor` from this page as `?cursor=`. This is
+    fast at any depth, unlike `?page=`, which is ignored when a cursor is given.
+    The total number of matching privacy requests is always counted for pages fetched by
+    `?page=`. Pages fetched by cursor are only counted with `?include_total=True`.
     """
 
     if any([completed_lt, completed_gt]) and any([errored_lt, errored_gt]):
@@ -285,39 +373,67 @@ def get_request_status(
             PrivacyRequest.finished_processing_at > errored_gt,
         )
 
+    try:
+        page = paginate_by_cursor(
+            query,
+            params,
+            order_by=(PrivacyRequest.created_at, PrivacyRequest.id),
+            cursor=cursor,
+            include_total=include_total,
+            descending=True,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(exc))
+
     # Conditionally embed execution log details in the response.
     if verbose:
         logger.info(f"Finding execution log details")
-        PrivacyRequest.execution_logs_by_dataset = property(
-            execution_logs_by_dataset_name
-        )
-    else:
-        PrivacyRequest.execution_logs_by_dataset = property(lambda self: None)
+        embed_execution_logs_by_dataset_name(db, page.items)
 
-    return paginate(query, params)
+    return page
 
 
-def execution_logs_by_dataset_name(
-    self: PrivacyRequest,
-) -> DefaultDict[str, List["ExecutionLog"]]:
+def embed_execution_logs_by_dataset_name(
+    db: Session, privacy_requests: Sequence[PrivacyRequest]
+) -> None:
     """
-    Returns a truncated list of ExecutionLogs for each dataset name associated with
-    a PrivacyRequest. Added as a conditional property to the PrivacyRequest class at runtime to
-    show optionally embedded execution logs.
+    Sets `execution_logs_by_dataset` on each PrivacyRequest to a truncated list of its ExecutionLogs
+    for each dataset name, to show optionally embedded execution logs.
+
+    The logs for every privacy request are fetched together, with a single query that numbers
+    each dataset's logs and keeps only the first EMBEDDED_EXECUTION_LOG_LIMIT of them.
 
     An example response might include your execution logs from your mongo db in one group, and execution logs from
     your postgres db in a different group.
     """
+    execution_logs: Dict[str, DefaultDict[str, List[ExecutionLog]]] = {
+        privacy_request.id: defaultdict(list) for privacy_request in privacy_requests
+    }
+
+    if execution_logs:
+        row_number = (
+            func.row_number()
+            .over(
+                partition_by=(ExecutionLog.privacy_request_id, ExecutionLog.dataset_name),
+                order_by=(ExecutionLog.updated_at.asc(), ExecutionLog.id),
+            )
+            .label("row_number")
+        )
+        numbered = (
+            db.query(ExecutionLog, row_number)
+            .filter(ExecutionLog.privacy_request_id.in_(list(execution_logs)))
+            .subquery()
+        )
+        numbered_log = aliased(ExecutionLog, numbered)
+        for log in (
+            db.query(numbered_log)
+            .filter(numbered.c.row_number <= EMBEDDED_EXECUTION_LOG_LIMIT)
+            .order_by(numbered.c.dataset_name, numbered.c.row_number)
+        ):
+            execution_logs[log.privacy_request_id][log.dataset_name].append(log)
 
-    execution_logs: DefaultDict[str, List["ExecutionLog"]] = defaultdict(list)
-
-    for log in self.execution_logs.order_by(
-        ExecutionLog.dataset_name, ExecutionLog.updated_at.asc()
-    ):
-        if len(execution_logs[log.dataset_name]) > EMBEDDED_EXECUTION_LOG_LIMIT - 1:
-            continue
-        execution_logs[log.dataset_name].append(log)
-    return execution_logs
+    for privacy_request in privacy_requests:
+        privacy_request.execution_logs_by_dataset = execution_logs[privacy_request.id]
 
 
 @router.get(
@@ -392,10 +508,10 @@ def get_request_preview_queries(
             k: "something" for k in dataset_graph.identity_keys.values()
         }
         traversal: Traversal = Traversal(dataset_graph, identity_seed)
-        queries: Dict[CollectionAddress, str] = collect_queries(
-            traversal,
-            TaskResources(EMPTY_REQUEST, Policy(), connection_configs),
-        )
+        with TaskResources(EMPTY_REQUEST, Policy(), connection_configs) as resources:
+            queries: Dict[CollectionAddress, str] = collect_queries(
+                traversal, resources
+            )
         return [
             DryRunDatasetResponse(
                 collectionAddress=CollectionAddressResponse(
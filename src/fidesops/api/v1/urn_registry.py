@@ -18,6 +18,7 @@ ENCRYPTION_KEY = "/cryptography/encryption/key"
 
 # Masking URLs
 MASKING = "/masking/mask"
+MASKING_BATCH = "/masking/mask/batch"
 MASKING_STRATEGY = "/masking/strategy"
 
 # Storage URLs
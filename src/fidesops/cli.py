@@ -1,7 +1,7 @@
 """Sets up a simple fidesops CLI"""
 import click
 
-from fidesops.main import start_webserver
+from fidesops.main import start_webserver, start_worker
 
 
 @click.group()
@@ -18,3 +18,12 @@ def webserver(ctx: click.Context) -> None:
     Runs any pending DB migrations and starts the webserver.
     """
     start_webserver()
+
+
+@cli.command()
+@click.pass_context
+def worker(ctx: click.Context) -> None:
+    """
+    Runs any pending DB migrations and runs queued privacy requests.
+    """
+    start_worker()
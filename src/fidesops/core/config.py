@@ -91,6 +91,22 @@ class ExecutionSettings(FidesSettings):
     TASK_RETRY_COUNT: int
     TASK_RETRY_DELAY: int  # In seconds
     TASK_RETRY_BACKOFF: int
+    MAX_TASK_WORKERS: int = 8
+    MAX_TASKS_PER_CONNECTION: int = 4
+    RESULT_BATCH_SIZE: int = 1000
+    MASKING_BATCH_SIZE: int = 500
+    MASKING_BATCH_SIZES: Dict[str, int] = {}
+    CONNECTION_POOL_SIZE: int = 5
+    CONNECTION_POOL_MAX_OVERFLOW: int = 10
+    CONNECTOR_IDLE_TIMEOUT_SECONDS: int = 600
+    EXECUTION_LOG_BATCH_SIZE: int = 100
+    EXECUTION_LOG_FLUSH_SECONDS: float = 1.0
+    PRIVACY_REQUEST_WORKERS: int = 2
+    PRIVACY_REQUEST_LEASE_SECONDS: int = 300
+    PRIVACY_REQUEST_HEARTBEAT_SECONDS: int = 60
+    PRIVACY_REQUEST_POLL_SECONDS: int = 5
+    PRIVACY_REQUEST_MAX_ATTEMPTS: int = 3
+    EMBEDDED_WORKER: bool = True
 
     class Config:
         env_prefix = "FIDESOPS__EXECUTION__"
@@ -106,6 +122,9 @@ class RedisSettings(FidesSettings):
     DECODE_RESPONSES: bool = True
     DEFAULT_TTL_SECONDS: int = 3600
     DB_INDEX: int
+    BINARY_OBJECTS: bool = True
+    COMPRESSION_THRESHOLD_BYTES: Optional[int] = None
+    HEALTH_CHECK_INTERVAL_SECONDS: int = 30
 
     class Config:
         env_prefix = "FIDESOPS__REDIS__"
@@ -116,6 +135,7 @@ class SecuritySettings(FidesSettings):
 
     AES_ENCRYPTION_KEY_LENGTH: int = 16
     AES_GCM_NONCE_LENGTH: int = 12
+    AES_CIPHER_CACHE_SIZE: int = 128
     APP_ENCRYPTION_KEY: str
 
     @validator("APP_ENCRYPTION_KEY")
@@ -147,6 +167,8 @@ class SecuritySettings(FidesSettings):
     OAUTH_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
     OAUTH_CLIENT_ID_LENGTH_BYTES = 16
     OAUTH_CLIENT_SECRET_LENGTH_BYTES = 16
+    OAUTH_CLIENT_CACHE_SIZE: int = 1024
+    OAUTH_CLIENT_CACHE_TTL_SECONDS: int = 60
 
     @validator("OAUTH_ROOT_CLIENT_SECRET_HASH", pre=True)
     def assemble_root_access_token(
@@ -267,16 +289,38 @@ CONFIG_KEY_ALLOWLIST = {
         "DECODE_RESPONSES",
         "DEFAULT_TTL_SECONDS",
         "DB_INDEX",
+        "BINARY_OBJECTS",
+        "COMPRESSION_THRESHOLD_BYTES",
+        "HEALTH_CHECK_INTERVAL_SECONDS",
     ],
     "security": [
+        "AES_CIPHER_CACHE_SIZE",
         "CORS_ORIGINS",
         "ENCODING",
         "OAUTH_ACCESS_TOKEN_EXPIRE_MINUTES",
+        "OAUTH_CLIENT_CACHE_SIZE",
+        "OAUTH_CLIENT_CACHE_TTL_SECONDS",
     ],
     "execution": [
         "TASK_RETRY_COUNT",
         "TASK_RETRY_DELAY",
         "TASK_RETRY_BACKOFF",
+        "MAX_TASK_WORKERS",
+        "MAX_TASKS_PER_CONNECTION",
+        "RESULT_BATCH_SIZE",
+        "MASKING_BATCH_SIZE",
+        "MASKING_BATCH_SIZES",
+        "CONNECTION_POOL_SIZE",
+        "CONNECTION_POOL_MAX_OVERFLOW",
+        "CONNECTOR_IDLE_TIMEOUT_SECONDS",
+        "EXECUTION_LOG_BATCH_SIZE",
+        "EXECUTION_LOG_FLUSH_SECONDS",
+        "PRIVACY_REQUEST_WORKERS",
+        "PRIVACY_REQUEST_LEASE_SECONDS",
+        "PRIVACY_REQUEST_HEARTBEAT_SECONDS",
+        "PRIVACY_REQUEST_POLL_SECONDS",
+        "PRIVACY_REQUEST_MAX_ATTEMPTS",
+        "EMBEDDED_WORKER",
     ],
 }
 
@@ -82,7 +82,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Set, Dict, Literal, Any, Callable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from fidesops.common_exceptions import FidesopsException
 from fidesops.graph.data_type import (
@@ -368,6 +368,17 @@ class MaskingOverride:
     length: Optional[int]
 
 
+@dataclass(frozen=True)
+class FieldIndexes:
+    """Flattened views of the fields of a collection, computed together in a single pass"""
+
+    field_dict: Dict[FieldPath, Field]
+    primary_keys: Dict[FieldPath, Field]
+    references: Dict[FieldPath, List[Tuple[FieldAddress, Optional[EdgeDirection]]]]
+    identities: Dict[FieldPath, SeedAddress]
+    field_paths_by_category: Dict[str, List[FieldPath]]
+
+
 class Collection(BaseModel):
     """A single grouping of individual data points that are accessed together"""
 
@@ -375,6 +386,48 @@ class Collection(BaseModel):
     fields: List[Field]
     # an optional list of collections that this collection must run after
     after: Set[CollectionAddress] = set()
+    # set by freeze(), after which the fields must not be modified
+    _indexes: Optional[FieldIndexes] = PrivateAttr(default=None)
+
+    def freeze(self) -> None:
+        """Compute the flattened field indexes once and reuse them from now on.
+
+        Collections are frozen when they are added to a DatasetGraph. Until then the indexes
+        are recomputed on every access, so fields can still be modified."""
+        if self._indexes is None:
+            self._indexes = self._build_indexes()
+
+    def _build_indexes(self) -> FieldIndexes:
+        """Walk the fields once, collecting every index"""
+        field_dict = self.recursively_collect_matches(lambda f: True)
+        categories: Dict[str, List[FieldPath]] = defaultdict(list)
+        for field_path, field in field_dict.items():
+            for category in field.data_categories or []:
+                categories[category].append(field_path)
+        return FieldIndexes(
+            field_dict=field_dict,
+            primary_keys={
+                field_path: field
+                for field_path, field in field_dict.items()
+                if field.primary_key
+            },
+            references={
+                field_path: field.references
+                for field_path, field in field_dict.items()
+                if field.references
+            },
+            identities={
+                field_path: field.identity
+                for field_path, field in field_dict.items()
+                if field.identity
+            },
+            field_paths_by_category=categories,
+        )
+
+    @property
+    def indexes(self) -> FieldIndexes:
+        """The flattened field indexes of this collection"""
+        return self._indexes or self._build_indexes()
 
     @property
     def field_dict(self) -> Dict[FieldPath, Field]:
@@ -382,6 +435,8 @@ class Collection(BaseModel):
 
         Flattens all the Fields so they are on one level: all nested fields are brought to the top.
         """
+        if self._indexes:
+            return self._indexes.field_dict
         return self.recursively_collect_matches(lambda f: True)
 
     def recursively_collect_matches(
@@ -392,6 +447,11 @@ class Collection(BaseModel):
         matches = [field.collect_matching(func) for field in self.fields]
         return merge_dicts(*matches)
 
+    @property
+    def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
+        """Mapping of FieldPaths to Fields that are marked as primary keys"""
+        return self.indexes.primary_keys
+
     def references(
         self,
     ) -> Dict[FieldPath, List[Tuple[FieldAddress, Optional[EdgeDirection]]]]:
@@ -399,23 +459,15 @@ class Collection(BaseModel):
 
         A nested field can be a reference.
         """
-        return {
-            field_path: field.references
-            for field_path, field in self.field_dict.items()
-            if field.references
-        }
+        return self.indexes.references
 
-    def identities(self) -> Dict[FieldPath, Tuple[str, ...]]:
+    def identities(self) -> Dict[FieldPath, SeedAddress]:
         """return identity pointers included in the table"""
-        return {
-            field_path: field.identity
-            for field_path, field in self.field_dict.items()
-            if field.identity
-        }
+        return self.indexes.identities
 
     def field(self, field_path: FieldPath) -> Optional[Field]:
         """Return Field (looked up by FieldPath) if on Collection or None if not found"""
-        return self.field_dict[field_path] if field_path in self.field_dict else None
+        return self.field_dict.get(field_path)
 
     @property
     def field_paths_by_category(self) -> Dict[str, List[FieldPath]]:
@@ -431,11 +483,7 @@ class Collection(BaseModel):
                 "user.provided.identifiable.contact.postal_code": ["zip"]
             }
         """
-        categories = defaultdict(list)
-        for field_path, field in self.field_dict.items():
-            for category in field.data_categories or []:
-                categories[category].append(field_path)
-        return categories
+        return self.indexes.field_paths_by_category
 
     class Config:
         """for pydantic incorporation of custom non-pydantic types"""
@@ -185,10 +185,13 @@ class DatasetGraph:
         """We create all edges based on field specifications.
         We also add child references to nodes. Note that this means that
         this is a destructive operation on the input datasets, as it
-        will alter references within them"""
+        will alter references within them. Collections are frozen, so their
+        fields must not be modified once they are part of a graph."""
 
         # build nodes
         nodes = [Node(dr, ds) for dr in datasets for ds in dr.collections]
+        for node in nodes:
+            node.collection.freeze()
         self.nodes: dict[CollectionAddress, Node] = {
             node.address: node for node in nodes
         }
@@ -0,0 +1,101 @@
+import logging
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.models.datasetconfig import DatasetConfig
+
+logger = logging.getLogger(__name__)
+
+GraphVersion = Tuple[Tuple[Any, ...], ...]
+"""The (id, updated_at) of every DatasetConfig and its ConnectionConfig that a graph was built from"""
+
+
+class DatasetGraphCache:
+    """Caches the DatasetGraph built from every configured dataset, so that each privacy request
+    doesn't have to re-parse and re-convert every dataset.
+
+    The cached graph is versioned on the updated_at timestamps of the DatasetConfigs and their
+    ConnectionConfigs, so a change made by any process is picked up by the next privacy request.
+    Traversals of the cached graph are also cached, by the set of identity keys they are seeded with.
+    Cached graphs and traversals are shared between privacy requests and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.version: Optional[GraphVersion] = None
+        self.graph: Optional[DatasetGraph] = None
+        self.traversals: Dict[FrozenSet[str], Traversal] = {}
+
+    @staticmethod
+    def current_version(db: Session) -> GraphVersion:
+        """Look up the current version of the configured datasets, without loading the datasets"""
+        rows = (
+            db.query(
+                DatasetConfig.id,
+                DatasetConfig.updated_at,
+                ConnectionConfig.key,
+                ConnectionConfig.updated_at,
+            )
+            .filter(DatasetConfig.connection_config_id == ConnectionConfig.id)
+            .order_by(DatasetConfig.id)
+            .all()
+        )
+        return tuple(tuple(row) for row in rows)
+
+    def get_graph(self, db: Session) -> DatasetGraph:
+        """Return a graph of every configured dataset, rebuilding it only if a dataset or
+        connection config has changed since it was last built"""
+        version = self.current_version(db)
+        with self.lock:
+            if self.graph is None or version != self.version:
+                logger.info("Building dataset graph")
+                self.graph = DatasetGraph(
+                    *[
+                        dataset_config.get_graph()
+                        for dataset_config in DatasetConfig.all(db=db)
+                    ]
+                )
+                self.version = version
+                self.traversals = {}
+            return self.graph
+
+    def get_traversal(
+        self, graph: DatasetGraph, identity_keys: Iterable[str]
+    ) -> Traversal:
+        """Return a traversal of the graph seeded with the given identity keys.
+
+        The traversal does not hold any identity values; these should be passed to the
+        task graph separately. Traversals of graphs that were not returned by get_graph
+        are not cached."""
+        keys = frozenset(identity_keys)
+        with self.lock:
+            if graph is not self.graph:
+                return Traversal(graph, {k: None for k in keys})
+            if keys not in self.traversals:
+                self.traversals[keys] = Traversal(graph, {k: None for k in keys})
+            return self.traversals[keys]
+
+    def invalidate(self) -> None:
+        """Discard the cached graph and traversals"""
+        with self.lock:
+            self.version = None
+            self.graph = None
+            self.traversals = {}
+
+
+_graph_cache: Optional[DatasetGraphCache] = None
+_graph_cache_lock = Lock()
+
+
+def get_dataset_graph_cache() -> DatasetGraphCache:
+    """Return the process-wide dataset graph cache"""
+    global _graph_cache  # pylint: disable=W0603
+    with _graph_cache_lock:
+        if _graph_cache is None:
+            _graph_cache = DatasetGraphCache()
+        return _graph_cache
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import List, Any, Tuple, Set, Dict, Callable, cast
-
-import pydash.collections
+from dataclasses import dataclass
+from typing import List, Any, Tuple, Set, Dict, Callable, Iterable, Optional
 
 from fidesops.common_exceptions import TraversalError
 from fidesops.graph.config import (
@@ -16,7 +16,6 @@ from fidesops.graph.config import (
 )
 from fidesops.graph.graph import Node, Edge, DatasetGraph
 from fidesops.util.logger import NotPii
-from fidesops.util.matching_queue import MatchingQueue
 from fidesops.util.collection_util import append
 
 logger = logging.getLogger(__name__)
@@ -45,24 +44,35 @@ class TraversalNode:
         self.is_terminal_node = False
 
     def add_child(self, child_node: TraversalNode, edge: Edge) -> None:
-        """Add other as a child to this traversal_node along the provided edge."""
+        """Add other as a child to this traversal_node along the provided edge.
+
+        Adding the same child along the same edge again has no effect, so that a traversal
+        can be run any number of times."""
         addresses = edge.split_by_address(self.address)  # (traversal_node -> other)
         if addresses:
             self_field_address, other_field_address = addresses
-            append(
-                self.children,
-                other_field_address.collection_address(),
-                (
-                    child_node,
-                    self_field_address.field_path,
-                    other_field_address.field_path,
-                ),
+            child = (
+                child_node,
+                self_field_address.field_path,
+                other_field_address.field_path,
             )
-            append(
-                child_node.parents,
-                self_field_address.collection_address(),
-                (self, self_field_address.field_path, other_field_address.field_path),
+            if child not in self.children.get(
+                other_field_address.collection_address(), []
+            ):
+                append(
+                    self.children, other_field_address.collection_address(), child
+                )
+            parent = (
+                self,
+                self_field_address.field_path,
+                other_field_address.field_path,
             )
+            if parent not in child_node.parents.get(
+                self_field_address.collection_address(), []
+            ):
+                append(
+                    child_node.parents, self_field_address.collection_address(), parent
+                )
 
     def incoming_edges(self) -> Set[Edge]:
         """Return the incoming edges to this traversal_node,in (other.address -> self.address) order."""
@@ -139,6 +149,111 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
+@dataclass
+class QueuedTraversalNode:
+    """A traversal_node in a TraversalQueue, with the number of collections and datasets
+    it is still waiting to run after"""
+
+    position: int
+    traversal_node: TraversalNode
+    waiting_on: int = 0
+
+
+class TraversalQueue:
+    """The queue of traversal_nodes waiting to run during a traversal.
+
+    Like popping the first node that can_run_given the remaining nodes from a MatchingQueue,
+    nodes are popped in the order they were queued, skipping any that must run after a
+    collection or dataset that still has unfinished nodes. Rather than re-checking every
+    queued node on each pop, each node counts the collections and datasets it is waiting on
+    and is moved to a heap of runnable nodes, ordered by queue position, once that count
+    reaches zero.
+    """
+
+    def __init__(self, node_keys: Iterable[CollectionAddress]) -> None:
+        self.remaining_node_keys: Set[CollectionAddress] = set(node_keys)
+        self.remaining_by_dataset: Dict[str, int] = {}
+        for address in self.remaining_node_keys:
+            self.remaining_by_dataset[address.dataset] = (
+                self.remaining_by_dataset.get(address.dataset, 0) + 1
+            )
+        self.queued: Dict[CollectionAddress, QueuedTraversalNode] = {}
+        self.runnable: List[Tuple[int, QueuedTraversalNode]] = []
+        self.waiting_on_collection: Dict[
+            CollectionAddress, List[QueuedTraversalNode]
+        ] = {}
+        self.waiting_on_dataset: Dict[str, List[QueuedTraversalNode]] = {}
+        self.pushed = 0
+
+    def push_if_new(self, traversal_node: TraversalNode) -> None:
+        """Queue the traversal_node, unless it is already queued"""
+        if traversal_node.address in self.queued:
+            return
+        queued = QueuedTraversalNode(self.pushed, traversal_node)
+        self.pushed += 1
+        self.queued[traversal_node.address] = queued
+
+        for address in traversal_node.node.collection.after:
+            if address in self.remaining_node_keys:
+                queued.waiting_on += 1
+                self.waiting_on_collection.setdefault(address, []).append(queued)
+        for dataset in traversal_node.node.dataset.after:
+            if self.remaining_by_dataset.get(dataset):
+                queued.waiting_on += 1
+                self.waiting_on_dataset.setdefault(dataset, []).append(queued)
+        if not queued.waiting_on:
+            heapq.heappush(self.runnable, (queued.position, queued))
+
+    def pop(self) -> Optional[TraversalNode]:
+        """Pop the first queued traversal_node that can run, or None if none can"""
+        if not self.runnable:
+            return None
+        _, queued = heapq.heappop(self.runnable)
+        del self.queued[queued.traversal_node.address]
+        return queued.traversal_node
+
+    def finish(self, address: CollectionAddress) -> None:
+        """Mark the node at this address as finished, releasing any nodes waiting on it"""
+        if address not in self.remaining_node_keys:
+            return
+        self.remaining_node_keys.remove(address)
+        for queued in self.waiting_on_collection.pop(address, []):
+            self._release(queued)
+        self.remaining_by_dataset[address.dataset] -= 1
+        if not self.remaining_by_dataset[address.dataset]:
+            for queued in self.waiting_on_dataset.pop(address.dataset, []):
+                self._release(queued)
+
+    def _release(self, queued: QueuedTraversalNode) -> None:
+        queued.waiting_on -= 1
+        if not queued.waiting_on:
+            heapq.heappush(self.runnable, (queued.position, queued))
+
+    def is_empty(self) -> bool:
+        """is the queue empty?"""
+        return not self.queued
+
+    def queued_addresses(self) -> List[CollectionAddress]:
+        """The addresses of the queued nodes, in the order they were queued"""
+        return [
+            queued.traversal_node.address
+            for queued in sorted(self.queued.values(), key=lambda q: q.position)
+        ]
+
+
+@dataclass(frozen=True)
+class TraversalPlan:
+    """The outcome of traversing a graph from a set of seed keys, computed once per Traversal.
+
+    Running a traversal only replays the plan, so verifying a traversal, building its tasks,
+    generating dry-run queries and running an erasure all share the same plan."""
+
+    node_order: Tuple[CollectionAddress, ...]
+    """Every node address, starting with the root, in the order the nodes are run"""
+    end_nodes: Tuple[CollectionAddress, ...]
+    """The addresses of nodes with no children"""
+
+
 class Traversal:
     """Handling for a single reified traversal of a graph based on input (seed) data."""
 
@@ -175,15 +290,7 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
-
-    def __verify_traversal(self) -> None:
-        """Verify that a valid traversal exists. This method simply assembles a traversal
-        and raises an error on any traversal failure conditions."""
-        self.traverse(
-            {self.root_node.address: [self.seed_data]},
-            lambda n, m: logger.info("Traverse %s", NotPii(n.address)),
-        )
+        self.plan: TraversalPlan = self.__plan_traversal()
 
     def traversal_map(
         self,
@@ -209,18 +316,33 @@ class Traversal:
 
         return {str(k): v for k, v in db.items()}, traversal_ends
 
-    def traverse(  # pylint: disable=R0914
+    def traverse(
         self,
         environment: Dict[CollectionAddress, Any],
         node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
     ) -> List[CollectionAddress]:
-        """Traverse and call run() on each traversal_node in turn. T represents an environment that
-        can provide or collect values as each traversal_node is run.
+        """Traverse and call run() on each traversal_node in turn, in the order given by the
+        traversal plan. T represents an environment that can provide or collect values as
+        each traversal_node is run.
 
         Returns a list of termination traversal_node addresses so that we can take action on completed
         traversal.
+        """
+        if environment:
+            logger.info(
+                "starting traversal",
+            )
+        for address in self.plan.node_order:
+            node_run_fn(self._node(address), environment)
 
+        end_nodes = list(self.plan.end_nodes)
+        if environment:
+            logger.debug(f"Found {len(end_nodes)} end nodes: {end_nodes}")
+        return end_nodes
 
+    def __plan_traversal(self) -> TraversalPlan:  # pylint: disable=R0914
+        """Assemble the traversal, connecting each traversal_node to its children, and record
+        the order the nodes run in. Raises a TraversalError on any traversal failure conditions.
 
         We define the root traversal_node as a traversal_node whose children are any nodes that have identity (seed)
         data.
@@ -229,7 +351,7 @@ class Traversal:
         - a (copied) set of all of the edges in the graph.
 
         - Pop the first eligible traversal_node from the queue.
-        - call the passed in callable node_run_function on this traversal_node. Mark this traversal_node as "finished"
+        - Add this traversal_node to the node order. Mark this traversal_node as "finished"
         - Delete all edges from any finished nodes to this traversal_node.
         - put all of this nodes children in the queue.
 
@@ -241,76 +363,94 @@ class Traversal:
         We also raise a TraversalError if the queue is empty but some nodes have not been visited. In
         that case they are unreachable.
 
+        Remaining edges are indexed by the addresses of the nodes at either end, so each step only
+        looks at the edges of the traversal_node being run, and the queue tracks which nodes are
+        able to run, so planning takes time linear in the number of nodes and edges.
         """
-        if environment:
-            logger.info(
-                "starting traversal",
-            )
-        remaining_node_keys: Set[CollectionAddress] = set(
-            self.traversal_node_dict.keys()
-        )
-        finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        node_order: List[CollectionAddress] = []
+        running_node_queue = TraversalQueue(self.traversal_node_dict.keys())
+        running_node_queue.push_if_new(self.root_node)
+        # finished node address -> the position it first finished in
+        finished_nodes: Dict[CollectionAddress, int] = {}
         remaining_edges: Set[Edge] = self.edges.copy()
+        # node address -> the remaining edges with an end in that node
+        remaining_edges_by_node: Dict[CollectionAddress, Set[Edge]] = {}
+        for edge in remaining_edges:
+            for address in (edge.f1.collection_address(), edge.f2.collection_address()):
+                remaining_edges_by_node.setdefault(address, set()).add(edge)
+
         while not running_node_queue.is_empty():
 
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
+            n = running_node_queue.pop()
 
             if n:
-                node_run_fn(n, environment)
-                # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,
+                logger.info("Traverse %s", NotPii(n.address))
+                node_order.append(n.address)
+                # delete all edges between any completed nodes and the traversal_node that's just run
+                node_edges = remaining_edges_by_node.get(n.address, set())
+                completed_edges: Dict[CollectionAddress, Set[Edge]] = {}
+                for edge in node_edges:
+                    other_address = (
+                        edge.f2.collection_address()
+                        if edge.f1.collection_address() == n.address
+                        else edge.f1.collection_address()
                     )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address
-                        ),
-                        completed_edges,
+                    if other_address in finished_nodes and edge.spans(
+                        other_address, n.address
                     ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
-                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
+                        completed_edges.setdefault(other_address, set()).add(edge)
+
+                for finished_node_address in sorted(
+                    completed_edges, key=finished_nodes.__getitem__
+                ):
+                    finished_node = self._node(finished_node_address)
+                    for edge in completed_edges[finished_node_address]:
+                        remaining_edges.discard(edge)
+                        remaining_edges_by_node[edge.f1.collection_address()].discard(
+                            edge
+                        )
+                        remaining_edges_by_node[edge.f2.collection_address()].discard(
+                            edge
+                        )
+                        # append edges that end in this traversal_node
+                        if edge.ends_with_collection(n.address):
+                            # note, this will not work for self-reference
+                            finished_node.add_child(n, edge)
+                # next edges = take all remaining edges including n
                 # in the form (field_address_this, field_address_foreign)
-
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
-                )
+                edges_to_children = [
+                    addresses
+                    for addresses in (e.split_by_address(n.address) for e in node_edges)
+                    if addresses
+                ]
                 if not edges_to_children:
                     n.is_terminal_node = True
 
                 # child traversal_node addresses are the address portion of the above
                 child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
+                    a[1].collection_address() for a in edges_to_children
                 }
                 for nxt_address in child_node_addresses:
                     # only add the next traversal_node to the queue if it is not already there (no duplicates)
                     running_node_queue.push_if_new(
                         self.traversal_node_dict[nxt_address]
                     )
-                finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                finished_nodes.setdefault(n.address, len(finished_nodes))
+                running_node_queue.finish(n.address)
             else:
-                # traversal traversal_node dict diff finished nodes
+                queued = ",".join(
+                    [str(address) for address in running_node_queue.queued_addresses()]
+                )
                 logger.error(
-                    f"Node could not be reached given specified ordering [{','.join([str(tn.address) for tn in running_node_queue.data])}]"
+                    f"Node could not be reached given specified ordering [{queued}]"
                 )
                 raise TraversalError(
                     f"""Node could not be reached given the specified ordering:
-                    [{','.join([str(tn.address) for tn in running_node_queue.data])}]"""
+                    [{queued}]"""
                 )
 
+        remaining_node_keys = running_node_queue.remaining_node_keys
         # error if there are nodes that have not been visited
         if remaining_node_keys:
             logger.error(
@@ -328,9 +468,16 @@ class Traversal:
                 f"Some edges were not reachable: {','.join([str(x) for x in remaining_edges])}"
             )
 
-        end_nodes = [
-            tn.address for tn in finished_nodes.values() if tn.is_terminal_node
-        ]
-        if environment:
-            logger.debug(f"Found {len(end_nodes)} end nodes: {end_nodes}")
-        return end_nodes
+        return TraversalPlan(
+            node_order=tuple(node_order),
+            end_nodes=tuple(
+                address
+                for address in finished_nodes
+                if self._node(address).is_terminal_node
+            ),
+        )
+
+    def _node(self, address: CollectionAddress) -> TraversalNode:
+        if address == ROOT_COLLECTION_ADDRESS:
+            return self.root_node
+        return self.traversal_node_dict[address]
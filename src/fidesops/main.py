@@ -7,6 +7,9 @@ from fidesops.api.v1.api import api_router
 from fidesops.api.v1.urn_registry import V1_URL_PREFIX
 from fidesops.db.database import init_db
 from fidesops.core.config import config
+from fidesops.service.privacy_request.request_runner_service import (
+    get_privacy_request_worker,
+)
 from fidesops.tasks.scheduled.scheduler import scheduler
 from fidesops.tasks.scheduled.tasks import initiate_scheduled_request_intake
 from fidesops.util.logger import get_fides_log_record_factory
@@ -40,6 +43,10 @@ def start_webserver() -> None:
     logger.info("Starting scheduled request intake...")
     initiate_scheduled_request_intake()
 
+    if config.execution.EMBEDDED_WORKER:
+        logger.info("Starting privacy request worker...")
+        get_privacy_request_worker().start()
+
     logger.info("Starting web server...")
     uvicorn.run(
         "src.fidesops.main:app",
@@ -50,5 +57,20 @@ def start_webserver() -> None:
     )
 
 
+def start_worker() -> None:
+    """Run any pending DB migrations and run queued privacy requests until interrupted."""
+    logger.info("****************fidesops****************")
+    logger.info("Running any pending DB migrations...")
+    init_db(config.database.SQLALCHEMY_DATABASE_URI)
+    scheduler.start()
+
+    logger.info("Starting privacy request worker...")
+    worker = get_privacy_request_worker()
+    try:
+        worker.serve()
+    except KeyboardInterrupt:
+        worker.stop()
+
+
 if __name__ == "__main__":
     start_webserver()
@@ -1,10 +1,11 @@
 # pylint: disable=R0401
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import json
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 from enum import Enum as EnumType
 from sqlalchemy.dialects.postgresql import JSONB
@@ -13,7 +14,10 @@ from sqlalchemy import (
     DateTime,
     Enum as EnumColumn,
     ForeignKey,
+    Index,
     String,
+    func,
+    insert,
 )
 
 from sqlalchemy.ext.mutable import MutableList
@@ -40,10 +44,12 @@ from fidesops.schemas.redis_cache import PrivacyRequestIdentity
 from fidesops.util.cache import (
     get_all_cache_keys_for_privacy_request,
     get_cache,
+    get_cache_index_key,
     get_identity_cache_key,
     FidesopsRedis,
     get_encryption_cache_key,
     get_masking_secret_cache_key,
+    join_result_batches,
 )
 from fidesops.util.oauth_util import generate_jwe
 
@@ -116,27 +122,111 @@ class PrivacyRequest(Base):
         primaryjoin="foreign(ExecutionLog.privacy_request_id)==PrivacyRequest.id",
     )
 
+    __table_args__ = (
+        # NB. __table_args__ requires a Tuple
+        # Supports paging through privacy requests in the order they were created
+        Index("ix_privacyrequest_created_at_id", "created_at", "id"),
+        # Supports filtering by when privacy requests completed or errored
+        Index(
+            "ix_privacyrequest_status_finished_processing_at",
+            "status",
+            "finished_processing_at",
+        ),
+    )
+
     def delete(self, db: Session) -> None:
         """
         Clean up the cached data related to this privacy request before deleting this
         object from the database
         """
         cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        cache.delete(
+            *get_all_cache_keys_for_privacy_request(privacy_request_id=self.id),
+            get_cache_index_key(self.id),
+        )
         super().delete(db=db)
 
+    @classmethod
+    def create_all(
+        cls, db: Session, *, data: List[Dict[str, Any]]
+    ) -> List["PrivacyRequest"]:
+        """
+        Create a PrivacyRequest for each item of data with a single multi-row INSERT, returned in
+        the order of `data`.
+
+        Requests created together would otherwise share the transaction's `now()` as their
+        `created_at`, so each is created a microsecond after the one before it. This keeps the
+        (created_at, id) order that privacy requests are paged in the same as the order they
+        were submitted in.
+        """
+        columns = sorted({column for kwargs in data for column in kwargs})
+        # The id default can't see which table it is generating an id for in a multi-row
+        # insert, so the ids are given their table prefix here
+        ids = [f"{cls.__tablename__[:3]}_{uuid4()}" for _ in data]
+        rows = [
+            {
+                **{column: kwargs.get(column) for column in columns},
+                "id": ids[position],
+                "created_at": func.now() + timedelta(microseconds=position),
+            }
+            for position, kwargs in enumerate(data)
+        ]
+        try:
+            inserted = db.execute(
+                insert(cls.__table__).values(rows).returning(cls.__table__.c.id)
+            ).all()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        # Load every created request with one query rather than one refresh apiece
+        privacy_requests = {
+            privacy_request.id: privacy_request
+            for privacy_request in db.query(cls).filter(
+                cls.id.in_([row.id for row in inserted])
+            )
+        }
+        return [privacy_requests[request_id] for request_id in ids]
+
+    def get_identity_cache_values(
+        self, identity: PrivacyRequestIdentity
+    ) -> Dict[str, Any]:
+        """Returns the identity's values keyed by their specific locations in the Fidesops app cache"""
+        identity_dict: Dict[str, Any] = dict(identity)
+        return {
+            get_identity_cache_key(self.id, key): value
+            for key, value in identity_dict.items()
+            if value is not None
+        }
+
+    def get_encryption_cache_values(
+        self, encryption_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Returns the encryption key, if provided, keyed by its location in the Fidesops app cache"""
+        if not encryption_key:
+            return {}
+        return {get_encryption_cache_key(self.id, "key"): encryption_key}
+
+    def get_masking_secret_cache_values(
+        self, masking_secret: MaskingSecretCache
+    ) -> Dict[str, Any]:
+        """Returns the masking secret, if provided, keyed by its location in the Fidesops app cache"""
+        if not masking_secret:
+            return {}
+        return {
+            get_masking_secret_cache_key(
+                self.id,
+                masking_strategy=masking_secret.masking_strategy,
+                secret_type=masking_secret.secret_type,
+            ): FidesopsRedis.encode_obj(masking_secret.secret)
+        }
+
     def cache_identity(self, identity: PrivacyRequestIdentity) -> None:
         """Sets the identity's values at their specific locations in the Fidesops app cache"""
         cache: FidesopsRedis = get_cache()
-        identity_dict: Dict[str, Any] = dict(identity)
-        for key, value in identity_dict.items():
-            if value is not None:
-                cache.set_with_autoexpire(
-                    get_identity_cache_key(self.id, key),
-                    value,
-                )
+        cache.set_all_with_autoexpire(
+            {get_cache_index_key(self.id): self.get_identity_cache_values(identity)}
+        )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
         """Sets the encryption key in the Fidesops app cache if provided"""
@@ -144,9 +234,12 @@ class PrivacyRequest(Base):
             return
 
         cache: FidesopsRedis = get_cache()
-        cache.set_with_autoexpire(
-            get_encryption_cache_key(self.id, "key"),
-            encryption_key,
+        cache.set_all_with_autoexpire(
+            {
+                get_cache_index_key(self.id): self.get_encryption_cache_values(
+                    encryption_key
+                )
+            }
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -154,27 +247,33 @@ class PrivacyRequest(Base):
         if not masking_secret:
             return
         cache: FidesopsRedis = get_cache()
-        cache.set_with_autoexpire(
-            get_masking_secret_cache_key(
-                self.id,
-                masking_strategy=masking_secret.masking_strategy,
-                secret_type=masking_secret.secret_type,
-            ),
-            FidesopsRedis.encode_obj(masking_secret.secret),
+        cache.set_all_with_autoexpire(
+            {
+                get_cache_index_key(self.id): self.get_masking_secret_cache_values(
+                    masking_secret
+                )
+            }
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
-        return {key.split("-")[-1]: cache.get(key) for key in keys}
+        keys = cache.get_index_members(get_cache_index_key(self.id), prefix)
+        return {
+            key.split("-")[-1]: value
+            for key, value in cache.get_values(keys).items()
+            if value is not None
+        }
 
     def get_results(self) -> Dict[str, Any]:
         """Retrieves all cached identity data associated with this Privacy Request"""
         cache: FidesopsRedis = get_cache()
-        result_prefix = f"{self.id}__*"
-        return cache.get_encoded_objects_by_prefix(result_prefix)
+        return join_result_batches(
+            cache.get_encoded_objects_in_index(
+                get_cache_index_key(self.id), prefix=f"{self.id}__"
+            )
+        )
 
     def trigger_policy_webhook(self, webhook: WebhookTypes) -> None:
         """Trigger a request to a single customer-defined policy webhook. Raises an exception if webhook response
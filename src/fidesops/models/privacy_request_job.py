@@ -0,0 +1,105 @@
+from datetime import timedelta
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from fidesops.db.base_class import Base
+from fidesops.models.privacy_request import PrivacyRequest
+
+
+class PrivacyRequestJob(Base):
+    """
+    A PrivacyRequest waiting to be run. Workers lease jobs from this table, so any number of
+    worker processes can share the queue. A job whose worker stops renewing its lease is
+    picked up by another worker once the lease expires.
+    """
+
+    privacy_request_id = Column(
+        String,
+        ForeignKey(PrivacyRequest.id_field_path, ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # The pre-execution webhook to resume after, if the request was paused
+    from_webhook_id = Column(String, nullable=True)
+    # The worker currently running this job, if any
+    leased_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    # The number of times this job has been claimed by a worker
+    attempts = Column(Integer, nullable=False, default=0)
+
+    @classmethod
+    def enqueue(
+        cls,
+        db: Session,
+        privacy_request_id: str,
+        from_webhook_id: Optional[str] = None,
+    ) -> "PrivacyRequestJob":
+        """Queue a privacy request to be run by the next free worker"""
+        return cls.create(
+            db=db,
+            data={
+                "privacy_request_id": privacy_request_id,
+                "from_webhook_id": from_webhook_id,
+            },
+        )
+
+    @classmethod
+    def claim(
+        cls,
+        db: Session,
+        worker_id: str,
+        lease_seconds: int,
+        limit: int,
+        job_id: Optional[str] = None,
+    ) -> List["PrivacyRequestJob"]:
+        """
+        Lease up to `limit` of the oldest jobs that are not leased, or whose lease has expired,
+        to the given worker. Jobs being claimed concurrently by another worker are skipped
+        rather than waited on. If `job_id` is given only that job is claimed.
+        """
+        query = db.query(cls).filter(
+            or_(cls.lease_expires_at.is_(None), cls.lease_expires_at < func.now())
+        )
+        if job_id:
+            query = query.filter(cls.id == job_id)
+        jobs = (
+            query.order_by(cls.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for job in jobs:
+            job.leased_by = worker_id
+            job.lease_expires_at = func.now() + timedelta(seconds=lease_seconds)
+            job.attempts = job.attempts + 1
+        db.commit()
+        return jobs
+
+    @classmethod
+    def renew_leases(
+        cls, db: Session, worker_id: str, job_ids: List[str], lease_seconds: int
+    ) -> int:
+        """Extend the leases the given worker holds on the given jobs. Returns the number renewed."""
+        if not job_ids:
+            return 0
+        renewed = (
+            db.query(cls)
+            .filter(cls.id.in_(job_ids), cls.leased_by == worker_id)
+            .update(
+                {cls.lease_expires_at: func.now() + timedelta(seconds=lease_seconds)},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return renewed
+
+    @classmethod
+    def finish(cls, db: Session, worker_id: str, job_id: str) -> None:
+        """Remove a job the given worker has finished running from the queue"""
+        db.query(cls).filter(cls.id == job_id, cls.leased_by == worker_id).delete(
+            synchronize_session=False
+        )
+        db.commit()
@@ -1,6 +1,9 @@
-from typing import Any, Dict
+from typing import Any, Dict, Generic, Optional, TypeVar
 
-from pydantic import BaseModel
+from fastapi_pagination import Page
+from pydantic import BaseModel, conint
+
+T = TypeVar("T")
 
 
 class BulkResponse(BaseModel):
@@ -28,3 +31,18 @@ class BulkUpdateFailed(BaseModel):
 
     message: str
     data: Dict[str, Any]
+
+
+class CursorPage(Page[T], Generic[T]):
+    """
+    A Page of results that also carries a cursor to the page after it. Fetching pages by cursor
+    rather than by page number stays fast however deep the page is.
+
+    Pages fetched by page number are shaped like any other Page. Pages fetched by cursor have a
+    `page` of None, and a `total` of None unless counting was asked for. `next_cursor` is None on
+    the last page.
+    """
+
+    total: Optional[conint(ge=0)]  # type: ignore
+    page: Optional[conint(ge=1)]  # type: ignore
+    next_cursor: Optional[str] = None
@@ -98,7 +98,7 @@ class PrivacyRequestVerboseResponse(PrivacyRequestResponse):
     )
 
     class Config:
-        """Allow the results field to be populated by the 'PrivacyRequest.execution_logs_by_dataset' property"""
+        """Allow the results field to be populated by the 'PrivacyRequest.execution_logs_by_dataset' attribute"""
 
         allow_population_by_field_name = True
 
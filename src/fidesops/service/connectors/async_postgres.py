@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+import psycopg2
+from psycopg2 import extensions
+
+from fidesops.graph.traversal import Row
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_until_ready(connection: Any) -> None:
+    """Wait, without blocking the event loop, for an asynchronous psycopg2 connection to
+    finish connecting or executing. The connection's socket is watched by the running
+    event loop rather than by a thread."""
+    loop = asyncio.get_running_loop()
+    while True:
+        state = connection.poll()
+        if state == extensions.POLL_OK:
+            return
+        if state not in (extensions.POLL_READ, extensions.POLL_WRITE):
+            raise psycopg2.OperationalError(f"Unexpected connection state {state}")
+        ready = loop.create_future()
+        fd = connection.fileno()
+        if state == extensions.POLL_READ:
+            loop.add_reader(fd, ready.set_result, None)
+            try:
+                await ready
+            finally:
+                loop.remove_reader(fd)
+        else:
+            loop.add_writer(fd, ready.set_result, None)
+            try:
+                await ready
+            finally:
+                loop.remove_writer(fd)
+
+
+class AsyncPostgresPool:
+    """Asynchronous psycopg2 connections, opened with the same arguments as a connector's
+    SQLAlchemy Engine. Connections are opened as they are needed, and up to `max_idle` of
+    them are kept open to be reused by later queries.
+
+    Asynchronous connections are always in autocommit mode, so these are only used for
+    reading data."""
+
+    def __init__(
+        self, connect_args: Sequence[Any], connect_kwargs: Dict[str, Any], max_idle: int
+    ):
+        self.connect_args = connect_args
+        self.connect_kwargs = connect_kwargs
+        self.max_idle = max_idle
+        self.idle: List[Any] = []
+        # the pool is shared by tasks running on multiple threads and event loops
+        self.lock = Lock()
+
+    async def _open(self) -> Any:
+        connection = psycopg2.connect(
+            *self.connect_args, **self.connect_kwargs, async_=1
+        )
+        try:
+            await wait_until_ready(connection)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Borrow a connection. It is closed rather than reused if the query it ran failed
+        or was cancelled, since it may still be busy."""
+        with self.lock:
+            connection = self.idle.pop() if self.idle else None
+        if connection is None or connection.closed:
+            connection = await self._open()
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+        with self.lock:
+            if len(self.idle) < self.max_idle:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    async def fetch_all(self, query: str, params: Dict[str, Any]) -> List[Row]:
+        """Run a query and return its rows as dictionaries"""
+        async with self.connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                await wait_until_ready(connection)
+                # DB-API cursors describe each column with a sequence starting with its name
+                column_names: List[str] = [col[0] for col in cursor.description]
+                return [dict(zip(column_names, row)) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Close the idle connections"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
@@ -1,6 +1,7 @@
 import logging
 from abc import abstractmethod, ABC
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, TypeVar, Generic
 
 from fidesops.core.config import config
 from fidesops.graph.traversal import Row, TraversalNode
@@ -37,6 +38,8 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         # mode.
         self.hide_parameters = not config.is_test_mode
         self.db_client: Optional[DB_CONNECTOR_TYPE] = None
+        # connectors may be shared by tasks running on multiple threads
+        self.client_lock = Lock()
 
     @abstractmethod
     def query_config(self, node: TraversalNode) -> QueryConfig[Any]:
@@ -57,7 +60,9 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     def client(self) -> DB_CONNECTOR_TYPE:
         """Return connector appropriate to this resource"""
         if not self.db_client:
-            self.db_client = self.create_client()
+            with self.client_lock:
+                if not self.db_client:
+                    self.db_client = self.create_client()
         return self.db_client
 
     @abstractmethod
@@ -69,6 +74,32 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         The input data is expected to include a key and list of values for
         each input key that may be queried on."""
 
+    def retrieve_data_batches(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> Iterator[List[Row]]:
+        """Retrieve data as retrieve_data does, yielding it in batches of at most
+        RESULT_BATCH_SIZE rows so that a large result is never held in memory at once.
+
+        Connectors that can read their results incrementally should override this. By
+        default, the rows from retrieve_data are yielded as a single batch."""
+        yield self.retrieve_data(node, policy, input_data)
+
+    def supports_async_retrieval(self) -> bool:
+        """Whether this connector implements retrieve_data_async with a non-blocking driver"""
+        return False
+
+    async def retrieve_data_async(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> List[Row]:
+        """Retrieve data as retrieve_data does, without blocking the event loop it is awaited on.
+
+        Connectors with a non-blocking driver implement this and return True from
+        supports_async_retrieval. Their access tasks are then awaited on an event loop
+        rather than run on a worker thread."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support asynchronous retrieval"
+        )
+
     @abstractmethod
     def mask_data(
         self,
@@ -79,6 +110,19 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     ) -> int:
         """Execute a masking request. Return the number of rows that have been updated"""
 
+    def masking_batch_size(self) -> int:
+        """The maximum number of rows updated by a single statement or batch when masking data.
+        SQL connectors batch rows whether or not they are masked to identical values, except
+        where the primary key is masked itself, and may use smaller batches to stay within
+        their database's limit on bind parameters.
+
+        Configured per connection type with MASKING_BATCH_SIZES, falling back to MASKING_BATCH_SIZE."""
+        connection_type = self.configuration.connection_type
+        return config.execution.MASKING_BATCH_SIZES.get(
+            connection_type.value if connection_type else None,
+            config.execution.MASKING_BATCH_SIZE,
+        )
+
     def dry_run_query(self, node: TraversalNode) -> str:
         """Generate a dry-run query to display action that will be taken"""
         return self.query_config(node).dry_run_query()
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+
+from apscheduler.schedulers.base import BaseScheduler
+
+from fidesops.core.config import config
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.service.connectors.base_connector import BaseConnector
+from fidesops.tasks.scheduled.scheduler import scheduler
+from fidesops.util.logger import NotPii
+
+logger = logging.getLogger(__name__)
+
+CONNECTOR_EVICTION_TASK = "connector_idle_eviction"
+
+RegistryKey = Tuple[str, str]
+"""Registered connectors are keyed on (ConnectionConfig key, hash of its connection settings)"""
+
+
+class RegisteredConnector:
+    """A connector held by the registry, along with how it is currently being used"""
+
+    def __init__(self, connector: BaseConnector):
+        self.connector = connector
+        self.in_use = 0
+        self.last_used = monotonic()
+        # set once the connection settings have changed, so the connector is closed
+        # as soon as the privacy requests using it are done with it
+        self.invalidated = False
+
+
+class ConnectorRegistry:
+    """A thread-safe registry of connectors that is shared by every privacy request in this process.
+
+    Connectors, and the engines and connection pools they hold, are reused across privacy requests
+    rather than being created and torn down for each one. Connectors are closed once they have
+    gone unused for `idle_timeout_seconds`, or once their ConnectionConfig has been invalidated
+    and no privacy request is still using them. Idle connectors are looked for whenever a
+    connector is acquired or released, and on the scheduler passed to `schedule_eviction`, so
+    that they are also closed while no privacy requests are running.
+    """
+
+    def __init__(self, idle_timeout_seconds: int):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.lock = Lock()
+        self.connectors: Dict[RegistryKey, RegisteredConnector] = {}
+
+    @staticmethod
+    def registry_key(connection_config: ConnectionConfig) -> RegistryKey:
+        """Connectors are only shared between identical connection settings, so that a change of
+        secrets, type or access level always results in a new connector."""
+        settings = json.dumps(
+            [
+                connection_config.connection_type.value,
+                connection_config.access.value if connection_config.access else None,
+                connection_config.secrets,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return (
+            connection_config.key,
+            hashlib.sha256(settings.encode(config.security.ENCODING)).hexdigest(),
+        )
+
+    @staticmethod
+    def detached_copy(connection_config: ConnectionConfig) -> ConnectionConfig:
+        """A copy of the connection config that isn't bound to any database session, so that a
+        shared connector never reads from a session that belongs to another request."""
+        return ConnectionConfig(
+            id=connection_config.id,
+            key=connection_config.key,
+            name=connection_config.name,
+            connection_type=connection_config.connection_type,
+            access=connection_config.access,
+            secrets=dict(connection_config.secrets or {}),
+        )
+
+    def acquire(
+        self,
+        connection_config: ConnectionConfig,
+        build_connector: Callable[[ConnectionConfig], BaseConnector],
+    ) -> BaseConnector:
+        """Return the registered connector for this config, building it with `build_connector` if
+        there is none. Every acquired connector must be handed back with `release`."""
+        key = self.registry_key(connection_config)
+        with self.lock:
+            self._evict_idle()
+            registered = self.connectors.get(key)
+            if registered is None:
+                logger.info(
+                    f"Registering connector for {NotPii(connection_config.key)}"
+                )
+                registered = RegisteredConnector(
+                    build_connector(self.detached_copy(connection_config))
+                )
+                self.connectors[key] = registered
+            registered.in_use += 1
+            registered.last_used = monotonic()
+            return registered.connector
+
+    def release(self, connector: BaseConnector) -> None:
+        """Hand back a connector returned by `acquire`."""
+        with self.lock:
+            for key, registered in list(self.connectors.items()):
+                if registered.connector is connector:
+                    registered.in_use -= 1
+                    registered.last_used = monotonic()
+                    if registered.invalidated and not registered.in_use:
+                        self._close(key)
+                    break
+            else:
+                # the registry was cleared while this connector was in use
+                connector.close()
+            self._evict_idle()
+
+    def invalidate(self, connection_key: str) -> None:
+        """Stop handing out connectors for the given ConnectionConfig key, for example because its
+        secrets have changed. Connectors still in use are closed once they are released."""
+        with self.lock:
+            for key, registered in list(self.connectors.items()):
+                if key[0] == connection_key:
+                    registered.invalidated = True
+                    if not registered.in_use:
+                        self._close(key)
+                    else:
+                        # make way for a connector with the new settings
+                        self.connectors[(key[0], f"invalidated-{id(registered)}")] = (
+                            self.connectors.pop(key)
+                        )
+
+    def evict_idle(self) -> None:
+        """Close connectors that have been unused for longer than the idle timeout."""
+        with self.lock:
+            self._evict_idle()
+
+    def schedule_eviction(self, job_scheduler: BaseScheduler) -> None:
+        """Look for idle connectors on the given scheduler every half of the idle timeout."""
+        job_scheduler.add_job(
+            func=self.evict_idle,
+            id=CONNECTOR_EVICTION_TASK,
+            # a check that was missed is made up for by the next one
+            coalesce=True,
+            replace_existing=True,
+            trigger="interval",
+            seconds=max(self.idle_timeout_seconds // 2, 1),
+        )
+
+    def close(self) -> None:
+        """Close every registered connector."""
+        with self.lock:
+            for key in list(self.connectors.keys()):
+                self._close(key)
+
+    def _evict_idle(self) -> None:
+        """Close connectors that have been unused for longer than the idle timeout. Must be called
+        with the lock held."""
+        now = monotonic()
+        for key, registered in list(self.connectors.items()):
+            if (
+                not registered.in_use
+                and now - registered.last_used > self.idle_timeout_seconds
+            ):
+                logger.info(f"Closing idle connector for {NotPii(key[0])}")
+                self._close(key)
+
+    def _close(self, key: RegistryKey) -> None:
+        """Remove the connector from the registry and close it. Must be called with the lock held."""
+        registered = self.connectors.pop(key)
+        try:
+            registered.connector.close()
+        except Exception as exc:  # pylint: disable=W0703
+            logger.warning(f"Error closing connector for {NotPii(key[0])}: {exc}")
+
+
+_registry: Optional[ConnectorRegistry] = None
+_registry_lock = Lock()
+
+
+def get_connector_registry() -> ConnectorRegistry:
+    """Return the process-wide connector registry"""
+    global _registry  # pylint: disable=W0603
+    with _registry_lock:
+        if _registry is None:
+            _registry = ConnectorRegistry(
+                idle_timeout_seconds=config.execution.CONNECTOR_IDLE_TIMEOUT_SECONDS
+            )
+            _registry.schedule_eviction(scheduler)
+        return _registry
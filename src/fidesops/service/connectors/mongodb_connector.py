@@ -1,10 +1,11 @@
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config
 from fidesops.graph.traversal import Row, TraversalNode
 from fidesops.models.connectionconfig import ConnectionTestStatus
 from fidesops.models.policy import Policy
@@ -43,12 +44,23 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         url = f"mongodb://{user_pass}{config.host}{port}{default_auth_db}"
         return url
 
+    @staticmethod
+    def max_pool_size() -> int:
+        """The maximum number of connections the client opens to the MongoDB instance. Clients are
+        shared by every privacy request that uses the same connection."""
+        return (
+            config.execution.CONNECTION_POOL_SIZE
+            + config.execution.CONNECTION_POOL_MAX_OVERFLOW
+        )
+
     def create_client(self) -> MongoClient:
         """Returns a client for a MongoDB instance"""
         config = MongoDBSchema(**self.configuration.secrets or {})
         uri = config.url if config.url else self.build_uri()
         try:
-            return MongoClient(uri, serverSelectionTimeoutMS=5000)
+            return MongoClient(
+                uri, serverSelectionTimeoutMS=5000, maxPoolSize=self.max_pool_size()
+            )
         except ValueError:
             raise ConnectionException("Value Error connecting to MongoDB.")
 
@@ -86,13 +98,23 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
     ) -> List[Row]:
         """Retrieve mongo data"""
+        return [
+            row
+            for rows in self.retrieve_data_batches(node, policy, input_data)
+            for row in rows
+        ]
+
+    def retrieve_data_batches(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> Iterator[List[Row]]:
+        """Retrieve mongo data in batches of at most RESULT_BATCH_SIZE documents"""
         # pylint: disable = too-many-locals
         query_config = self.query_config(node)
         client = self.client()
 
         query_components = query_config.generate_query(input_data, policy)
         if query_components is None:
-            return []
+            return
         query_data, fields = query_components
 
         db_name = node.address.dataset
@@ -100,12 +122,20 @@ class MongoDBConnector(BaseConnector[MongoClient]):
 
         db = client[db_name]
         collection = db[collection_name]
-        rows = []
+        batch_size = config.execution.RESULT_BATCH_SIZE
+        rows: List[Row] = []
+        row_ct = 0
         logger.info(f"Starting data retrieval for {node.address}")
-        for row in collection.find(query_data, fields):
-            rows.append(row)
-        logger.info(f"Found {len(rows)} on {node.address}")
-        return rows
+        with collection.find(query_data, fields).batch_size(batch_size) as cursor:
+            for row in cursor:
+                rows.append(row)
+                row_ct += 1
+                if len(rows) >= batch_size:
+                    yield rows
+                    rows = []
+        if rows:
+            yield rows
+        logger.info(f"Found {row_ct} on {node.address}")
 
     def mask_data(
         self,
@@ -114,20 +144,20 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        # pylint: disable=too-many-locals
-        """Execute a masking request"""
+        """Execute a masking request. Updates are sent to the server in unordered batches
+        of bulk writes. Returns the number of documents modified."""
         query_config = self.query_config(node)
         collection_name = node.address.collection
         client = self.client()
-        update_ct = 0
+        collection = client[node.address.dataset][collection_name]
+        batch_size = self.masking_batch_size()
+
+        operations: List[UpdateOne] = []
         for row in rows:
             update_stmt = query_config.generate_update_stmt(row, policy, request)
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
+                operations.append(UpdateOne(query, update, upsert=False))
                 logger.info(
                     "db.%s.update_one(%s, %s, upsert=False)",
                     NotPii(collection_name),
@@ -135,6 +165,12 @@ class MongoDBConnector(BaseConnector[MongoClient]):
                     update,
                 )
 
+        update_ct = 0
+        for start in range(0, len(operations), batch_size):
+            bulk_result = collection.bulk_write(
+                operations[start : start + batch_size], ordered=False
+            )
+            update_ct += bulk_result.modified_count
         return update_ct
 
     def close(self) -> None:
@@ -1,6 +1,7 @@
 import logging
 import re
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Dict, Any, List, Set, Optional, Generic, TypeVar, Tuple
 
 from sqlalchemy import text
@@ -28,12 +29,56 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@dataclass
+class FieldMasking:
+    """How a single field is masked: the field's string path, the strategy masking it,
+    the field's data type and length, and whether masked values are truncated to that length"""
+
+    string_path: str
+    strategy: MaskingStrategy
+    masking_override: MaskingOverride
+    truncate: bool
+
+
+class MaskingPlan:
+    """The masking applied to every row of a traversal_node under a policy.
+
+    Everything that does not depend on the row, such as the rules targeting each field and
+    their masking strategies, is worked out once when the plan is compiled."""
+
+    def __init__(self, policy: Policy, field_maskings: List[FieldMasking]):
+        self.policy = policy
+        self.field_maskings = field_maskings
+
+    def apply(self, row: Row, request_id: str) -> Dict[str, Any]:
+        """Map the string paths of the masked fields to their masked values for this row"""
+        return self.apply_batch([row], request_id)[0]
+
+    def apply_batch(self, rows: List[Row], request_id: str) -> List[Dict[str, Any]]:
+        """Map the string paths of the masked fields to their masked values for each row.
+        Each field is masked for all of the rows in a single batch."""
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
+        for masking in self.field_maskings:
+            masked_vals = masking.strategy.mask_batch(
+                [row[masking.string_path] for row in rows], request_id
+            )
+            for value_map, masked_val in zip(value_maps, masked_vals):
+                if masking.truncate:
+                    #  for strategies other than null masking we assume that masked data type is the same as specified data type
+                    masked_val = masking.masking_override.data_type_converter.truncate(
+                        masking.masking_override.length, masked_val
+                    )
+                value_map[masking.string_path] = masked_val
+        return value_maps
+
+
 class QueryConfig(Generic[T], ABC):
     """A wrapper around a resource-type dependent query object that can generate runnable queries
     and string representations."""
 
     def __init__(self, node: TraversalNode):
         self.node = node
+        self._masking_plan: Optional[MaskingPlan] = None
 
     def field_map(self) -> Dict[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
@@ -70,11 +115,7 @@ class QueryConfig(Generic[T], ABC):
     @property
     def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
         """Mapping of FieldPaths to Fields that are marked as PK's"""
-        return {
-            field_path: field
-            for field_path, field in self.field_map().items()
-            if field.primary_key
-        }
+        return self.node.node.collection.primary_key_field_paths
 
     @property
     def query_field_paths(self) -> Set[FieldPath]:
@@ -138,24 +179,23 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(
-        self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Dict[str, Any]:
-        """Map the relevant fields (as strings) to be updated on the row with their masked values from Policy Rules
-
-        Example return:  {'name': None, 'ccn': None, 'code': None, 'backup_identities.ssn': None}
-
-        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields and nested
-        backup_identities.ssn fields for a given customer_id will be replaced with null values.
+    def masking_plan(self, policy: Policy) -> MaskingPlan:
+        """Return the plan for masking rows of this traversal_node under the given policy,
+        compiling it on first use."""
+        if self._masking_plan is None or self._masking_plan.policy is not policy:
+            self._masking_plan = self.compile_masking_plan(policy)
+        return self._masking_plan
 
-        FieldPaths are mapped to their dotted string path representation.
+    def compile_masking_plan(self, policy: Policy) -> MaskingPlan:
+        """Work out how each field targeted by the policy's erasure rules is masked.
 
-        """
+        Fields whose data type is missing or not supported by their rule's masking strategy
+        are left out of the plan."""
         rule_to_collection_field_paths: Dict[
             Rule, List[FieldPath]
         ] = self.build_rule_target_field_paths(policy)
 
-        value_map: Dict[str, Any] = {}
+        field_maskings: List[FieldMasking] = []
         for rule, field_paths in rule_to_collection_field_paths.items():
             strategy_config = rule.masking_strategy
             if not strategy_config:
@@ -163,14 +203,13 @@ class QueryConfig(Generic[T], ABC):
             strategy: MaskingStrategy = get_strategy(
                 strategy_config["strategy"], strategy_config["configuration"]
             )
+            null_masking: bool = strategy_config.get("strategy") == NULL_REWRITE
 
             for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
-                null_masking: bool = strategy_config.get("strategy") == NULL_REWRITE
+                field: Field = self.field_map()[rule_field_path]
+                masking_override: MaskingOverride = MaskingOverride(
+                    field.data_type_converter, field.length
+                )
                 if not self._supported_data_type(
                     masking_override, null_masking, strategy
                 ):
@@ -178,17 +217,36 @@ class QueryConfig(Generic[T], ABC):
                         f"Unable to generate a query for field {rule_field_path.string_path}: data_type is either not present on the field or not supported for the {strategy_config['strategy']} masking strategy. Received data type: {masking_override.data_type_converter.name}"
                     )
                     continue
-                val: Any = row[rule_field_path.string_path]
-                masked_val = self._generate_masked_value(
-                    request.id,
-                    strategy,
-                    val,
-                    masking_override,
-                    null_masking,
-                    rule_field_path,
+                truncate = not null_masking and bool(masking_override.length)
+                if truncate:
+                    logger.warning(
+                        f"Because a length has been specified for field {rule_field_path.string_path}, we will truncate length "
+                        f"of masked value to match, regardless of masking strategy"
+                    )
+                field_maskings.append(
+                    FieldMasking(
+                        rule_field_path.string_path,
+                        strategy,
+                        masking_override,
+                        truncate,
+                    )
                 )
-                value_map[rule_field_path.string_path] = masked_val
-        return value_map
+        return MaskingPlan(policy, field_maskings)
+
+    def update_value_map(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Dict[str, Any]:
+        """Map the relevant fields (as strings) to be updated on the row with their masked values from Policy Rules
+
+        Example return:  {'name': None, 'ccn': None, 'code': None, 'backup_identities.ssn': None}
+
+        In this example, a Null Masking Strategy was used to determine that the name/ccn/code fields and nested
+        backup_identities.ssn fields for a given customer_id will be replaced with null values.
+
+        FieldPaths are mapped to their dotted string path representation.
+
+        """
+        return self.masking_plan(policy).apply(row, request.id)
 
     @staticmethod
     def _supported_data_type(
@@ -205,32 +263,6 @@ class QueryConfig(Generic[T], ABC):
             return False
         return True
 
-    @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
-        request_id: str,
-        strategy: MaskingStrategy,
-        val: Any,
-        masking_override: MaskingOverride,
-        null_masking: bool,
-        field_path: FieldPath,
-    ) -> T:
-        masked_val = strategy.mask(val, request_id)
-        logger.debug(
-            f"Generated the following masked val for field {field_path.string_path}: {masked_val}"
-        )
-        if null_masking:
-            return masked_val
-        if masking_override.length:
-            logger.warning(
-                f"Because a length has been specified for field {field_path.string_path}, we will truncate length "
-                f"of masked value to match, regardless of masking strategy"
-            )
-            #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(
-                masking_override.length, masked_val
-            )
-        return masked_val
-
     @abstractmethod
     def generate_query(
         self, input_data: Dict[str, List[Any]], policy: Optional[Policy]
@@ -259,6 +291,9 @@ class QueryConfig(Generic[T], ABC):
 class SQLQueryConfig(QueryConfig[TextClause]):
     """Query config that translates parameters into SQL statements."""
 
+    # the most bind parameters a single statement may have in this datastore, if it is limited
+    max_stmt_params: Optional[int] = None
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -334,41 +369,259 @@ class SQLQueryConfig(QueryConfig[TextClause]):
         fields.sort()
         return [f"{k} = :{k}" for k in fields]
 
-    def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
-    ) -> Optional[TextClause]:
-        """Returns an update statement in generic SQL dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
-        update_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(update_value_map.keys())
-        )
-        non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
+    def format_in_clause_for_update_stmt(
+        self, field: str, param_names: List[str]
+    ) -> str:
+        """Returns a clause matching a field against any of the given parameters, for update statements
+        in this datastore."""
+        return f"{field} IN ({', '.join(f':{p}' for p in param_names)})"
+
+    def primary_key_values(self, row: Row) -> Dict[str, Any]:
+        """Returns the non-empty primary key values of the row, cast to their field types."""
+        return filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
                 for fpath, fld in self.primary_key_field_paths.items()
                 if fpath.string_path in row
             }
         )
-        pk_clauses: list[str] = self.format_key_map_for_update_stmt(
-            list(non_empty_primary_keys.keys())
+
+    def _update_stmt(
+        self, update_value_map: Dict[str, Any], primary_keys: Dict[str, Any]
+    ) -> TextClause:
+        """Returns an update statement setting the given values on the row with the given primary keys."""
+        update_clauses: List[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
+        )
+        pk_clauses: List[str] = self.format_key_map_for_update_stmt(
+            list(primary_keys.keys())
+        )
+        params = {**update_value_map, **primary_keys}
+        query_str = self.get_formatted_update_stmt(update_clauses, pk_clauses)
+        logger.info("query = %s, params = %s", query_str, params)
+        return text(query_str).params(params)
+
+    def _batch_update_stmt(
+        self, update_value_map: Dict[str, Any], pk_name: str, pk_values: List[Any]
+    ) -> TextClause:
+        """Returns an update statement setting the given values on every row whose primary key `pk_name` is
+        one of `pk_values`."""
+        params = dict(update_value_map)
+        param_names: List[str] = []
+        for i, value in enumerate(pk_values):
+            # appending "_in_stmt_generated_" so that this name is unlikely to conflict with a column name
+            param_name = f"{pk_name}_in_stmt_generated_{i}"
+            params[param_name] = value
+            param_names.append(param_name)
+        update_clauses: List[str] = self.format_key_map_for_update_stmt(
+            list(update_value_map.keys())
         )
+        pk_clauses = [self.format_in_clause_for_update_stmt(pk_name, param_names)]
+        query_str = self.get_formatted_update_stmt(update_clauses, pk_clauses)
+        logger.info("query = %s, params = %s", query_str, params)
+        return text(query_str).params(params)
 
-        for k, v in non_empty_primary_keys.items():
-            update_value_map[k] = v
+    def generate_update_stmt(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[TextClause]:
+        """Returns an update statement in generic SQL dialect."""
+        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        non_empty_primary_keys: Dict[str, Any] = self.primary_key_values(row)
 
-        valid = len(pk_clauses) > 0 and len(update_clauses) > 0
+        valid = len(non_empty_primary_keys) > 0 and len(update_value_map) > 0
         if not valid:
             logger.warning(
                 f"There is not enough data to generate a valid update statement for {self.node.address}"
             )
             return None
 
-        query_str = self.get_formatted_update_stmt(
-            update_clauses,
-            pk_clauses,
+        return self._update_stmt(update_value_map, non_empty_primary_keys)
+
+    @staticmethod
+    def split_constant_columns(
+        updates: List[Tuple[Any, Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Splits the columns set by `updates` into those masked to the same value on every row,
+        with that value, and the sorted names of the columns whose values vary by row."""
+        first_update_value_map = updates[0][1]
+        constant_values: Dict[str, Any] = {
+            column: value
+            for column, value in first_update_value_map.items()
+            if all(
+                update_value_map[column] == value for _, update_value_map in updates
+            )
+        }
+        varying_columns = sorted(
+            column
+            for column in first_update_value_map
+            if column not in constant_values
         )
-        logger.info("query = %s, params = %s", query_str, update_value_map)
-        return text(query_str).params(update_value_map)
+        return constant_values, varying_columns
+
+    def format_case_clause_for_update_stmt(
+        self, field: str, pk_name: str, cases: List[Tuple[str, str]]
+    ) -> str:
+        """Returns a clause setting a field to the value parameter paired with the row's primary key
+        parameter in `cases`, for update statements in this datastore."""
+        whens = " ".join(f"WHEN :{pk} THEN :{value}" for pk, value in cases)
+        return f"{field} = CASE {pk_name} {whens} END"
+
+    def _varying_update_stmt(
+        self, pk_name: str, updates: List[Tuple[Any, Dict[str, Any]]]
+    ) -> TextClause:
+        """Returns an update statement setting each (primary key value, update value map) pair of
+        `updates`, whose update value maps all set the same columns.
+
+        Columns masked to the same value on every row are set directly. Each other column is set
+        with a CASE expression choosing the row's value by its primary key.
+        """
+        constant_values, varying_columns = self.split_constant_columns(updates)
+        params = dict(constant_values)
+        pk_param_names: List[str] = []
+        for i, (pk_value, _) in enumerate(updates):
+            # appending "_in_stmt_generated_" so that this name is unlikely to conflict with a column name
+            param_name = f"{pk_name}_in_stmt_generated_{i}"
+            params[param_name] = pk_value
+            pk_param_names.append(param_name)
+
+        update_clauses: List[str] = self.format_key_map_for_update_stmt(
+            list(constant_values.keys())
+        )
+        for column in varying_columns:
+            cases: List[Tuple[str, str]] = []
+            for i, (_, update_value_map) in enumerate(updates):
+                param_name = f"{column}_case_stmt_generated_{i}"
+                params[param_name] = update_value_map[column]
+                cases.append((pk_param_names[i], param_name))
+            update_clauses.append(
+                self.format_case_clause_for_update_stmt(column, pk_name, cases)
+            )
+        pk_clauses = [self.format_in_clause_for_update_stmt(pk_name, pk_param_names)]
+        query_str = self.get_formatted_update_stmt(update_clauses, pk_clauses)
+        logger.info("query = %s, params = %s", query_str, params)
+        return text(query_str).params(params)
+
+    def _identical_value_update_stmts(
+        self,
+        pk_name: str,
+        updates: List[Tuple[Any, Dict[str, Any]]],
+        batch_size: int,
+    ) -> List[TextClause]:
+        """Returns update statements that only update rows together when they are masked to
+        identical values, with up to `batch_size` rows per statement. Every other row is updated
+        by its own statement."""
+        stmts: List[TextClause] = []
+        batches: Dict[Tuple[Tuple[str, Any], ...], List[Any]] = {}
+        for pk_value, update_value_map in updates:
+            batches.setdefault(tuple(sorted(update_value_map.items())), []).append(
+                pk_value
+            )
+
+        for update_items, pk_values in batches.items():
+            update_value_map = dict(update_items)
+            for start in range(0, len(pk_values), batch_size):
+                batch = pk_values[start : start + batch_size]
+                if len(batch) == 1:
+                    stmts.append(
+                        self._update_stmt(update_value_map, {pk_name: batch[0]})
+                    )
+                else:
+                    stmts.append(
+                        self._batch_update_stmt(update_value_map, pk_name, batch)
+                    )
+        return stmts
+
+    def _rows_per_stmt(self, column_ct: int, batch_size: int) -> int:
+        """The number of rows to update per statement, keeping statements that set `column_ct`
+        columns per row within this datastore's limit on bind parameters, if it has one. Each
+        row needs at most one parameter for its primary key, plus two for each column it sets."""
+        if self.max_stmt_params is None:
+            return batch_size
+        return max(min(batch_size, self.max_stmt_params // (1 + 2 * column_ct)), 1)
+
+    def _batch_update_stmts(
+        self,
+        pk_name: str,
+        updates: List[Tuple[Any, Dict[str, Any]]],
+        batch_size: int,
+    ) -> List[TextClause]:
+        """Returns the update statements applying each (primary key value, update value map) pair of
+        `updates`, whose update value maps all set the same columns.
+
+        Rows are updated in batches of up to `batch_size` rows per statement, whether or not they
+        are masked to identical values: a batch whose rows are all masked to identical values is
+        matched with IN, and any other batch is updated by `_varying_update_stmt`. If the primary
+        key is masked itself it can't also be used to match each row to its values, so only rows
+        masked to identical values are updated together.
+        """
+        if pk_name in updates[0][1]:
+            return self._identical_value_update_stmts(pk_name, updates, batch_size)
+
+        rows_per_stmt = self._rows_per_stmt(len(updates[0][1]), batch_size)
+        stmts: List[TextClause] = []
+        for start in range(0, len(updates), rows_per_stmt):
+            batch = updates[start : start + rows_per_stmt]
+            update_value_map = batch[0][1]
+            if len(batch) == 1:
+                stmts.append(
+                    self._update_stmt(update_value_map, {pk_name: batch[0][0]})
+                )
+            elif all(other == update_value_map for _, other in batch):
+                stmts.append(
+                    self._batch_update_stmt(
+                        update_value_map, pk_name, [pk_value for pk_value, _ in batch]
+                    )
+                )
+            else:
+                stmts.append(self._varying_update_stmt(pk_name, batch))
+        return stmts
+
+    def generate_update_stmts(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        batch_size: int,
+    ) -> List[TextClause]:
+        """Returns the update statements needed to mask all of the given rows.
+
+        Rows sharing primary key values are only updated once, so the update counts of the
+        statements add up to the number of distinct rows masked. Rows that have a single primary
+        key are updated in batches of up to `batch_size` rows, see `_batch_update_stmts`. Every
+        other row is updated by its own statement, as in `generate_update_stmt`.
+        """
+        seen: Set[Tuple[Tuple[str, Any], ...]] = set()
+        updates: Dict[
+            Tuple[str, Tuple[str, ...]], List[Tuple[Any, Dict[str, Any]]]
+        ] = {}
+        stmts: List[TextClause] = []
+        update_value_maps: List[Dict[str, Any]] = self.masking_plan(
+            policy
+        ).apply_batch(rows, request.id)
+        for row, update_value_map in zip(rows, update_value_maps):
+            non_empty_primary_keys: Dict[str, Any] = self.primary_key_values(row)
+            if not non_empty_primary_keys or not update_value_map:
+                logger.warning(
+                    f"There is not enough data to generate a valid update statement for {self.node.address}"
+                )
+                continue
+            row_key = tuple(sorted(non_empty_primary_keys.items()))
+            if row_key in seen:
+                continue
+            seen.add(row_key)
+            if len(non_empty_primary_keys) > 1:
+                stmts.append(
+                    self._update_stmt(update_value_map, non_empty_primary_keys)
+                )
+                continue
+            ((pk_name, pk_value),) = non_empty_primary_keys.items()
+            updates.setdefault((pk_name, tuple(sorted(update_value_map))), []).append(
+                (pk_value, update_value_map)
+            )
+
+        for (pk_name, _), pk_updates in updates.items():
+            stmts.extend(self._batch_update_stmts(pk_name, pk_updates, batch_size))
+        return stmts
 
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
@@ -395,12 +648,61 @@ class SQLQueryConfig(QueryConfig[TextClause]):
         return None
 
 
+class PostgreSQLQueryConfig(SQLQueryConfig):
+    """Generates SQL in PostgreSQL's dialect, which can update a batch of rows to different values
+    by joining the table against a list of values."""
+
+    def _varying_update_stmt(
+        self, pk_name: str, updates: List[Tuple[Any, Dict[str, Any]]]
+    ) -> TextClause:
+        """Returns an update statement setting each (primary key value, update value map) pair of
+        `updates`, whose update value maps all set the same columns.
+
+        Columns masked to the same value on every row are set directly. The other columns are set
+        from a VALUES list joined on the primary key. The VALUES list follows an empty selection
+        from the table, so that its values take the types of the table's columns.
+        """
+        table = self.node.address.collection
+        constant_values, varying_columns = self.split_constant_columns(updates)
+
+        params = dict(constant_values)
+        value_rows: List[str] = []
+        for i, (pk_value, update_value_map) in enumerate(updates):
+            row_values = {
+                pk_name: pk_value,
+                **{column: update_value_map[column] for column in varying_columns},
+            }
+            param_names: List[str] = []
+            for column, value in row_values.items():
+                # appending "_values_stmt_generated_" so that this name is unlikely to conflict with a column name
+                param_name = f"{column}_values_stmt_generated_{i}"
+                params[param_name] = value
+                param_names.append(f":{param_name}")
+            value_rows.append(f"({', '.join(param_names)})")
+
+        update_clauses: List[str] = self.format_key_map_for_update_stmt(
+            list(constant_values.keys())
+        ) + [f"{column} = masked_values.{column}" for column in varying_columns]
+        field_list = ", ".join([pk_name, *varying_columns])
+        query_str = (
+            f"UPDATE {table} SET {','.join(update_clauses)} "
+            f"FROM (SELECT {field_list} FROM {table} WHERE false "
+            f"UNION ALL VALUES {', '.join(value_rows)}) AS masked_values "
+            f"WHERE {table}.{pk_name} = masked_values.{pk_name}"
+        )
+        logger.info("query = %s, params = %s", query_str, params)
+        return text(query_str).params(params)
+
+
 class MicrosoftSQLServerQueryConfig(SQLQueryConfig):
     """
     Generates SQL valid for SQLServer. This way of building queries should also work for every other connector,
     but SQLServer is separated due to increased code complexity for building queries
     """
 
+    # SQL Server allows 2100 parameters per request
+    max_stmt_params = 2000
+
     def format_clause_for_query(
         self, string_path: str, operator: str, operand: str
     ) -> str:
@@ -494,6 +796,19 @@ class SnowflakeQueryConfig(SQLQueryConfig):
         fields.sort()
         return [f'"{k}" = :{k}' for k in fields]
 
+    def format_in_clause_for_update_stmt(
+        self, field: str, param_names: List[str]
+    ) -> str:
+        """Returns field names in clauses surrounded by quotation marks as required by Snowflake syntax."""
+        return f'"{field}" IN ({", ".join(f":{p}" for p in param_names)})'
+
+    def format_case_clause_for_update_stmt(
+        self, field: str, pk_name: str, cases: List[Tuple[str, str]]
+    ) -> str:
+        """Returns field names in clauses surrounded by quotation marks as required by Snowflake syntax."""
+        whens = " ".join(f"WHEN :{pk} THEN :{value}" for pk, value in cases)
+        return f'"{field}" = CASE "{pk_name}" {whens} END'
+
     def get_formatted_update_stmt(
         self,
         update_clauses: List[str],
@@ -1,8 +1,8 @@
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import Column, text
+from sqlalchemy import text
 from sqlalchemy.engine import (
     URL,
     Engine,
@@ -16,8 +16,9 @@ from sqlalchemy.sql.elements import TextClause
 from snowflake.sqlalchemy import URL as Snowflake_URL
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config
 from fidesops.graph.traversal import Row, TraversalNode
-from fidesops.models.connectionconfig import ConnectionTestStatus
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fidesops.models.policy import Policy
 from fidesops.models.privacy_request import PrivacyRequest
 from fidesops.schemas.connection_configuration import (
@@ -29,10 +30,12 @@ from fidesops.schemas.connection_configuration import (
 from fidesops.schemas.connection_configuration.connection_secrets_mysql import (
     MySQLSchema,
 )
+from fidesops.service.connectors.async_postgres import AsyncPostgresPool
 from fidesops.service.connectors.base_connector import BaseConnector
 from fidesops.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
+    PostgreSQLQueryConfig,
     RedshiftQueryConfig,
     MicrosoftSQLServerQueryConfig,
 )
@@ -45,15 +48,30 @@ class SQLConnector(BaseConnector[Engine]):
     interacted with via standard SQL via SQLAlchemy"""
 
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
-        columns: List[Column] = results.cursor.description
-        rows = []
-        for row_tuple in results:
-            rows.append(
-                {col.name: row_tuple[count] for count, col in enumerate(columns)}
-            )
-        return rows
+    def cursor_result_to_row_batches(results: CursorResult) -> Iterator[List[Row]]:
+        """Convert SQLAlchemy results to lists of dictionaries, RESULT_BATCH_SIZE rows at a time"""
+        # DB-API cursors describe each column with a sequence starting with its name
+        column_names: List[str] = [col[0] for col in results.cursor.description]
+        for row_tuples in results.partitions(config.execution.RESULT_BATCH_SIZE):
+            yield [dict(zip(column_names, row_tuple)) for row_tuple in row_tuples]
+
+    @staticmethod
+    def streamed(stmt: TextClause) -> TextClause:
+        """Read the results of this statement from a server-side cursor where the dialect supports it,
+        holding at most RESULT_BATCH_SIZE rows in the driver's buffer at a time. This way only the rows
+        we convert are held in memory, rather than those rows plus the driver's copy of the full result."""
+        return stmt.execution_options(
+            stream_results=True, max_row_buffer=config.execution.RESULT_BATCH_SIZE
+        )
+
+    @staticmethod
+    def pool_settings() -> Dict[str, int]:
+        """Connection pool sizing for the SQLAlchemy Engine. Engines are shared by every privacy
+        request that uses the same connection, so this bounds the connections opened to each database."""
+        return {
+            "pool_size": config.execution.CONNECTION_POOL_SIZE,
+            "max_overflow": config.execution.CONNECTION_POOL_MAX_OVERFLOW,
+        }
 
     @abstractmethod
     def build_uri(self) -> str:
@@ -88,15 +106,36 @@ class SQLConnector(BaseConnector[Engine]):
         self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
     ) -> List[Row]:
         """Retrieve sql data"""
+        return [
+            row
+            for rows in self.retrieve_data_batches(node, policy, input_data)
+            for row in rows
+        ]
+
+    def retrieve_data_batches(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> Iterator[List[Row]]:
+        """Retrieve sql data in batches, read from a server-side cursor where supported"""
         query_config = self.query_config(node)
         client = self.client()
         stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
         if stmt is None:
-            return []
+            return
         logger.info(f"Starting data retrieval for {node.address}")
         with client.connect() as connection:
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            results = connection.execute(self.streamed(stmt))
+            yield from self.cursor_result_to_row_batches(results)
+
+    @staticmethod
+    def execute_update_stmts(
+        connection: Connection, update_stmts: List[TextClause]
+    ) -> int:
+        """Execute the update statements and return the total number of rows updated"""
+        update_ct = 0
+        for update_stmt in update_stmts:
+            results: LegacyCursorResult = connection.execute(update_stmt)
+            update_ct = update_ct + results.rowcount
+        return update_ct
 
     def mask_data(
         self,
@@ -105,19 +144,18 @@ class SQLConnector(BaseConnector[Engine]):
         request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        Rows are updated in batches, all within a single transaction."""
         query_config = self.query_config(node)
-        update_ct = 0
+        update_stmts: List[TextClause] = query_config.generate_update_stmts(
+            rows, policy, request, self.masking_batch_size()
+        )
+        if not update_stmts:
+            return 0
         client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
-        return update_ct
+        with client.begin() as connection:
+            return self.execute_update_stmts(connection, update_stmts)
 
     def close(self) -> None:
         """Close any held resources"""
@@ -129,6 +167,10 @@ class SQLConnector(BaseConnector[Engine]):
 class PostgreSQLConnector(SQLConnector):
     """Connector specific to postgresql"""
 
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        self.async_pool: Optional[AsyncPostgresPool] = None
+
     def build_uri(self) -> str:
         """Build URI of format postgresql://[user[:password]@][netloc][:port][/dbname]"""
         config = PostgreSQLSchema(**self.configuration.secrets or {})
@@ -152,8 +194,54 @@ class PostgreSQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_settings(),
         )
 
+    def query_config(self, node: TraversalNode) -> PostgreSQLQueryConfig:
+        """Query wrapper corresponding to the input traversal_node."""
+        return PostgreSQLQueryConfig(node)
+
+    def get_async_pool(self) -> AsyncPostgresPool:
+        """Return the asynchronous connections for this database, which are opened with the
+        same arguments as the Engine's connections"""
+        engine = self.client()
+        if not self.async_pool:
+            with self.client_lock:
+                if not self.async_pool:
+                    connect_args, connect_kwargs = engine.dialect.create_connect_args(
+                        engine.url
+                    )
+                    self.async_pool = AsyncPostgresPool(
+                        connect_args,
+                        connect_kwargs,
+                        max_idle=config.execution.CONNECTION_POOL_SIZE,
+                    )
+        return self.async_pool
+
+    def supports_async_retrieval(self) -> bool:
+        """Data is retrieved over psycopg2's asynchronous connections"""
+        return True
+
+    async def retrieve_data_async(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> List[Row]:
+        """Retrieve sql data without blocking the event loop, so that it can run other
+        queries while waiting on this one"""
+        stmt: Optional[TextClause] = self.query_config(node).generate_query(
+            input_data, policy
+        )
+        if stmt is None:
+            return []
+        logger.info(f"Starting data retrieval for {node.address}")
+        compiled = stmt.compile(dialect=self.client().dialect)
+        return await self.get_async_pool().fetch_all(str(compiled), compiled.params)
+
+    def close(self) -> None:
+        """Close any held resources"""
+        super().close()
+        if self.async_pool:
+            self.async_pool.close()
+
 
 class MySQLConnector(SQLConnector):
     """Connector specific to MySQL"""
@@ -182,21 +270,9 @@ class MySQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_settings(),
         )
 
-    # Overrides BaseConnector.cursor_result_to_rows
-    @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
-        """
-        Convert SQLAlchemy results to a list of dictionaries
-        Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MySQL
-        """
-        columns: List[Column] = results.cursor.description
-        rows = []
-        for row_tuple in results:
-            rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
-        return rows
-
 
 class RedshiftConnector(SQLConnector):
     """Connector specific to Amazon Redshift"""
@@ -220,6 +296,7 @@ class RedshiftConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_settings(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -231,10 +308,10 @@ class RedshiftConnector(SQLConnector):
             stmt = stmt.bindparams(search_path=config.db_schema)
             connection.execute(stmt)
 
-    # Overrides SQLConnector.retrieve_data
-    def retrieve_data(
+    # Overrides SQLConnector.retrieve_data_batches
+    def retrieve_data_batches(
         self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
-    ) -> List[Row]:
+    ) -> Iterator[List[Row]]:
         """Retrieve data from Amazon Redshift
 
         For redshift, we also set the search_path to be the schema defined on the ConnectionConfig if
@@ -244,13 +321,13 @@ class RedshiftConnector(SQLConnector):
         client = self.client()
         stmt = query_config.generate_query(input_data, policy)
         if stmt is None:
-            return []
+            return
 
         logger.info(f"Starting data retrieval for {node.address}")
         with client.connect() as connection:
             self.set_schema(connection)
-            results = connection.execute(stmt)
-            return SQLConnector.cursor_result_to_rows(results)
+            results = connection.execute(self.streamed(stmt))
+            yield from SQLConnector.cursor_result_to_row_batches(results)
 
     # Overrides SQLConnector.mask_data
     def mask_data(
@@ -266,16 +343,15 @@ class RedshiftConnector(SQLConnector):
         applicable - persists for the current session.
         """
         query_config = self.query_config(node)
-        update_ct = 0
+        update_stmts: List[TextClause] = query_config.generate_update_stmts(
+            rows, policy, request, self.masking_batch_size()
+        )
+        if not update_stmts:
+            return 0
         client = self.client()
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(row, policy, request)
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
-        return update_ct
+        with client.begin() as connection:
+            self.set_schema(connection)
+            return self.execute_update_stmts(connection, update_stmts)
 
     # Overrides SQLConnector.query_config
     def query_config(self, node: TraversalNode) -> RedshiftQueryConfig:
@@ -320,6 +396,7 @@ class SnowflakeConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_settings(),
         )
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
@@ -361,21 +438,9 @@ class MicrosoftSQLServerConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_settings(),
         )
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
         return MicrosoftSQLServerQueryConfig(node)
-
-    # Overrides BaseConnector.cursor_result_to_rows
-    @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
-        """
-        Convert SQLAlchemy results to a list of dictionaries
-        Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MsSQL
-        """
-        columns: List[Column] = results.cursor.description
-        rows = []
-        for row_tuple in results:
-            rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
-        return rows
@@ -16,6 +16,15 @@ class MaskingStrategy(ABC):
     def mask(self, value: Optional[str], request_id: Optional[str]) -> Optional[str]:
         """Used to mask the provided value"""
 
+    def mask_batch(
+        self, values: List[Optional[str]], request_id: Optional[str]
+    ) -> List[Optional[str]]:
+        """Used to mask each of the provided values, returning the masked values in the same order.
+
+        Strategies override this to look up secrets and set up hashing or encryption once
+        for the whole batch rather than once per value."""
+        return [self.mask(value, request_id) for value in values]
+
     @abstractmethod
     def secrets_required(self) -> bool:
         """Determines whether secrets are needed for specific masking strategy"""
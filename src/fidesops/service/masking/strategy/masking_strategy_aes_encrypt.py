@@ -17,7 +17,9 @@ from fidesops.schemas.masking.masking_strategy_description import (
 from fidesops.service.masking.strategy.format_preservation import FormatPreservation
 from fidesops.service.masking.strategy.masking_strategy import MaskingStrategy
 from fidesops.util.encryption.aes_gcm_encryption_scheme import encrypt
-from fidesops.util.encryption.hmac_encryption_scheme import hmac_encrypt_return_bytes
+from fidesops.util.encryption.hmac_encryption_scheme import (
+    hmac_encrypt_batch_return_bytes,
+)
 from fidesops.util.encryption.secrets_util import SecretsUtil
 
 AES_ENCRYPT = "aes_encrypt"
@@ -29,6 +31,12 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         self.format_preservation = configuration.format_preservation
 
     def mask(self, value: Optional[str], privacy_request_id: Optional[str]) -> str:
+        return self.mask_batch([value], privacy_request_id)[0]
+
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[str]:
+        """Encrypts each of the values, looking up the secrets once for the whole batch"""
         if self.mode == AesEncryptionMaskingConfiguration.Mode.GCM:
             masking_meta: Dict[
                 SecretType, MaskingSecretMeta
@@ -46,16 +54,20 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
             and therefore the same masked val through the aes strategy. This is called convergent encryption, with this
             implementation loosely based on https://www.vaultproject.io/docs/secrets/transit#convergent-encryption
             """
-            nonce: bytes = self._generate_nonce(
-                value, key_hmac, privacy_request_id, masking_meta
+            nonces: List[bytes] = self._generate_nonces(
+                values, key_hmac, privacy_request_id, masking_meta
             )
-            masked: str = encrypt(value, key, nonce)
-            if self.format_preservation is not None:
-                formatter = FormatPreservation(self.format_preservation)
-                return formatter.format(masked)
-            return masked
-        else:
-            raise ValueError(f"aes_mode {self.mode} is not supported")
+            formatter = (
+                FormatPreservation(self.format_preservation)
+                if self.format_preservation is not None
+                else None
+            )
+            masked_values: List[str] = []
+            for value, nonce in zip(values, nonces):
+                masked: str = encrypt(value, key, nonce)
+                masked_values.append(formatter.format(masked) if formatter else masked)
+            return masked_values
+        raise ValueError(f"aes_mode {self.mode} is not supported")
 
     def secrets_required(self) -> bool:
         return True
@@ -97,12 +109,12 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         return data_type in supported_data_types
 
     @staticmethod
-    def _generate_nonce(
-        value: Optional[str],
+    def _generate_nonces(
+        values: List[Optional[str]],
         key: str,
         privacy_request_id: Optional[str],
         masking_meta: Dict[SecretType, MaskingSecretMeta],
-    ) -> bytes:
+    ) -> List[bytes]:
         salt: str = SecretsUtil.get_or_generate_secret(
             privacy_request_id, SecretType.salt_hmac, masking_meta[SecretType.salt_hmac]
         )
@@ -110,9 +122,12 @@ class AesEncryptionMaskingStrategy(MaskingStrategy):
         Trim to 12 bytes, which is recommended length from aes gcm lib:
         https://cryptography.io/en/latest/hazmat/primitives/aead/#cryptography.hazmat.primitives.ciphers.aead.AESGCM.encrypt
         """
-        return hmac_encrypt_return_bytes(
-            value, key, salt, HmacMaskingConfiguration.Algorithm.sha_256
-        )[:12]
+        return [
+            hmac_digest[:12]
+            for hmac_digest in hmac_encrypt_batch_return_bytes(
+                values, key, salt, HmacMaskingConfiguration.Algorithm.sha_256
+            )
+        ]
 
     @staticmethod
     def _build_masking_secret_meta() -> Dict[SecretType, MaskingSecretMeta]:
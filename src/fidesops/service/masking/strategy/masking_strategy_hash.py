@@ -43,6 +43,15 @@ class HashMaskingStrategy(MaskingStrategy):
         is None"""
         if value is None:
             return None
+        return self.mask_batch([value], privacy_request_id)[0]
+
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[Optional[str]]:
+        """Returns the hashed version of each of the provided values, looking up the salt once
+        for the whole batch. None values are returned as None"""
+        if all(value is None for value in values):
+            return [None] * len(values)
         masking_meta: Dict[
             SecretType, MaskingSecretMeta
         ] = self._build_masking_secret_meta()
@@ -51,11 +60,19 @@ class HashMaskingStrategy(MaskingStrategy):
             SecretType.salt,
             masking_meta[SecretType.salt],
         )
-        masked: str = self.algorithm_function(value, salt)
-        if self.format_preservation is not None:
-            formatter = FormatPreservation(self.format_preservation)
-            return formatter.format(masked)
-        return masked
+        formatter = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
+        )
+        masked_values: List[Optional[str]] = []
+        for value in values:
+            if value is None:
+                masked_values.append(None)
+                continue
+            masked: str = self.algorithm_function(value, salt)
+            masked_values.append(formatter.format(masked) if formatter else masked)
+        return masked_values
 
     def secrets_required(self) -> bool:
         return True
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
 from fidesops.schemas.masking.masking_configuration import (
     MaskingConfiguration,
@@ -15,7 +15,9 @@ from fidesops.schemas.masking.masking_strategy_description import (
 )
 from fidesops.service.masking.strategy.format_preservation import FormatPreservation
 from fidesops.service.masking.strategy.masking_strategy import MaskingStrategy
-from fidesops.util.encryption.hmac_encryption_scheme import hmac_encrypt_return_str
+from fidesops.util.encryption.hmac_encryption_scheme import (
+    hmac_encrypt_batch_return_str,
+)
 from fidesops.util.encryption.secrets_util import SecretsUtil
 
 HMAC = "hmac"
@@ -42,6 +44,18 @@ class HmacMaskingStrategy(MaskingStrategy):
         """
         if value is None:
             return None
+        return self.mask_batch([value], privacy_request_id)[0]
+
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[Optional[str]]:
+        """
+        Returns a hash of each of the supplied values using the hmac algorithm, looking up the secrets
+        and keying the hmac once for the whole batch. None values are returned as None.
+        """
+        present: List[str] = [value for value in values if value is not None]
+        if not present:
+            return [None] * len(values)
         masking_meta: Dict[
             SecretType, MaskingSecretMeta
         ] = self._build_masking_secret_meta()
@@ -51,11 +65,24 @@ class HmacMaskingStrategy(MaskingStrategy):
         salt: str = SecretsUtil.get_or_generate_secret(
             privacy_request_id, SecretType.salt, masking_meta[SecretType.salt]
         )
-        masked: str = hmac_encrypt_return_str(value, key, salt, self.algorithm)
-        if self.format_preservation is not None:
-            formatter = FormatPreservation(self.format_preservation)
-            return formatter.format(masked)
-        return masked
+        masked: Iterator[str] = iter(
+            hmac_encrypt_batch_return_str(present, key, salt, self.algorithm)
+        )
+        formatter = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
+        )
+        masked_values: List[Optional[str]] = []
+        for value in values:
+            if value is None:
+                masked_values.append(None)
+                continue
+            masked_value: str = next(masked)
+            masked_values.append(
+                formatter.format(masked_value) if formatter else masked_value
+            )
+        return masked_values
 
     def secrets_required(self) -> bool:
         return True
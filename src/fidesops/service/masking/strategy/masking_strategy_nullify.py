@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List
 
 from fidesops.schemas.masking.masking_configuration import (
     NullMaskingConfiguration,
@@ -27,6 +27,12 @@ class NullMaskingStrategy(MaskingStrategy):
         """Replaces the value with a null value"""
         return None
 
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[None]:
+        """Replaces each value with a null value"""
+        return [None] * len(values)
+
     def secrets_required(self) -> bool:
         return False
 
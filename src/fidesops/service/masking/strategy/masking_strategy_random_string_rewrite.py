@@ -1,6 +1,6 @@
 import string
-from typing import Optional
-from secrets import choice
+from typing import Optional, List
+from secrets import token_bytes
 
 from fidesops.schemas.masking.masking_configuration import (
     RandomStringMaskingConfiguration,
@@ -15,6 +15,7 @@ from fidesops.service.masking.strategy.masking_strategy import MaskingStrategy
 
 
 RANDOM_STRING_REWRITE = "random_string_rewrite"
+ALPHABET = string.ascii_lowercase + string.digits
 
 
 class RandomStringRewriteMaskingStrategy(MaskingStrategy):
@@ -33,17 +34,51 @@ class RandomStringRewriteMaskingStrategy(MaskingStrategy):
         """Replaces the value with a random lowercase string of the configured length"""
         if value is None:
             return None
-        masked: str = "".join(
-            [choice(string.ascii_lowercase + string.digits) for _ in range(self.length)]
+        return self.mask_batch([value], privacy_request_id)[0]
+
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[Optional[str]]:
+        """Replaces each value with a random lowercase string of the configured length, drawing
+        the random characters for the whole batch at once. None values are returned as None"""
+        present = sum(1 for value in values if value is not None)
+        characters: str = self._random_characters(present * self.length)
+        formatter = (
+            FormatPreservation(self.format_preservation)
+            if self.format_preservation is not None
+            else None
         )
-        if self.format_preservation is not None:
-            formatter = FormatPreservation(self.format_preservation)
-            return formatter.format(masked)
-        return masked
+        masked_values: List[Optional[str]] = []
+        start = 0
+        for value in values:
+            if value is None:
+                masked_values.append(None)
+                continue
+            masked: str = characters[start : start + self.length]
+            start += self.length
+            masked_values.append(formatter.format(masked) if formatter else masked)
+        return masked_values
 
     def secrets_required(self) -> bool:
         return False
 
+    @staticmethod
+    def _random_characters(count: int) -> str:
+        """Returns `count` characters drawn uniformly at random from ALPHABET.
+
+        Random bytes are read in bulk. Bytes at or above the largest multiple of the alphabet
+        size are discarded so that every character is equally likely."""
+        limit = 256 - 256 % len(ALPHABET)
+        characters: List[str] = []
+        while len(characters) < count:
+            needed = count - len(characters)
+            characters.extend(
+                ALPHABET[byte % len(ALPHABET)]
+                for byte in token_bytes(needed + needed // 8 + 1)
+                if byte < limit
+            )
+        return "".join(characters[:count])
+
     @staticmethod
     def get_configuration_model() -> MaskingConfiguration:
         return RandomStringMaskingConfiguration
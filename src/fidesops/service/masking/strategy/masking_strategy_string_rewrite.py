@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List
 
 from fidesops.schemas.masking.masking_configuration import (
     StringRewriteMaskingConfiguration,
@@ -30,12 +30,17 @@ class StringRewriteMaskingStrategy(MaskingStrategy):
     ) -> Optional[str]:
         """Replaces the value with the value specified in strategy spec. Returns None if input is
         None"""
-        if value is None:
-            return None
+        return self.mask_batch([value], privacy_request_id)[0]
+
+    def mask_batch(
+        self, values: List[Optional[str]], privacy_request_id: Optional[str]
+    ) -> List[Optional[str]]:
+        """Replaces each value with the value specified in strategy spec, leaving None values as None"""
+        masked: str = self.rewrite_value
         if self.format_preservation is not None:
             formatter = FormatPreservation(self.format_preservation)
-            return formatter.format(self.rewrite_value)
-        return self.rewrite_value
+            masked = formatter.format(masked)
+        return [None if value is None else masked for value in values]
 
     def secrets_required(self) -> bool:
         return False
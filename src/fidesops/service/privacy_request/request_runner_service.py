@@ -9,9 +9,8 @@ from fidesops import common_exceptions
 from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.common_exceptions import PrivacyRequestPaused, ClientUnsuccessfulException
-from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.graph_cache import get_dataset_graph_cache
 from fidesops.models.connectionconfig import ConnectionConfig
-from fidesops.models.datasetconfig import DatasetConfig
 from fidesops.models.policy import (
     ActionType,
     WebhookTypes,
@@ -19,6 +18,7 @@ from fidesops.models.policy import (
     PolicyPostWebhook,
 )
 from fidesops.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
+from fidesops.service.privacy_request.worker import PrivacyRequestWorker
 from fidesops.service.storage.storage_uploader_service import upload
 from fidesops.task.graph_task import (
     run_access_request,
@@ -26,8 +26,8 @@ from fidesops.task.graph_task import (
     run_erasure,
 )
 from fidesops.tasks.scheduled.scheduler import scheduler
+from fidesops.util.cache import FidesopsRedis, get_cache
 from fidesops.util.async_util import run_async
-from fidesops.util.cache import FidesopsRedis
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +91,19 @@ class PrivacyRequestRunner:
 
         return True
 
-    def submit(
-        self, from_webhook: Optional[PolicyPreWebhook] = None
-    ) -> Awaitable[None]:
-        """Run this privacy request in a separate thread."""
+    def submit(self, from_webhook: Optional[PolicyPreWebhook] = None) -> Awaitable[None]:
+        """
+        Queue this privacy request to be run by a worker. If this process runs an embedded
+        worker with room to spare, the request is started straight away in a separate thread,
+        and the returned awaitable completes once it has run. Otherwise the request is left
+        queued for a worker to poll, and the returned awaitable completes straight away.
+        """
         from_webhook_id = from_webhook.id if from_webhook else None
-        return run_async(self.run, self.privacy_request.id, from_webhook_id)
+        worker = get_privacy_request_worker()
+        job_id = worker.enqueue(self.privacy_request.id, from_webhook_id)
+        if not config.execution.EMBEDDED_WORKER:
+            return run_async(lambda: None)
+        return worker.run_job_async(job_id)
 
     def run(
         self, privacy_request_id: str, from_webhook_id: Optional[str] = None
@@ -127,9 +134,7 @@ class PrivacyRequestRunner:
                 session.close()
                 return
 
-            datasets = DatasetConfig.all(db=session)
-            dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-            dataset_graph = DatasetGraph(*dataset_graphs)
+            dataset_graph = get_dataset_graph_cache().get_graph(session)
             identity_data = privacy_request.get_cached_identity_data()
             connection_configs = ConnectionConfig.all(db=session)
             policy = privacy_request.policy
@@ -217,6 +222,35 @@ class PrivacyRequestRunner:
         """Pretend to dispatch privacy_request into the execution layer, return the query plan"""
 
 
+def run_privacy_request(
+    privacy_request_id: str, from_webhook_id: Optional[str] = None
+) -> None:
+    """Run a queued privacy request. `run` loads the request itself, so the runner is only
+    given a placeholder carrying its id."""
+    PrivacyRequestRunner(
+        cache=get_cache(),
+        privacy_request=PrivacyRequest(id=privacy_request_id),
+    ).run(privacy_request_id, from_webhook_id)
+
+
+_worker: Optional[PrivacyRequestWorker] = None
+
+
+def get_privacy_request_worker() -> PrivacyRequestWorker:
+    """Return the worker that runs this process's share of the privacy request queue"""
+    global _worker  # pylint: disable=W0603
+    if _worker is None:
+        _worker = PrivacyRequestWorker(
+            run=run_privacy_request,
+            max_workers=config.execution.PRIVACY_REQUEST_WORKERS,
+            lease_seconds=config.execution.PRIVACY_REQUEST_LEASE_SECONDS,
+            heartbeat_seconds=config.execution.PRIVACY_REQUEST_HEARTBEAT_SECONDS,
+            poll_seconds=config.execution.PRIVACY_REQUEST_POLL_SECONDS,
+            max_attempts=config.execution.PRIVACY_REQUEST_MAX_ATTEMPTS,
+        )
+    return _worker
+
+
 def initiate_paused_privacy_request_followup(privacy_request: PrivacyRequest) -> None:
     """Initiates scheduler to expire privacy request when the redis cache expires"""
     scheduler.add_job(
@@ -0,0 +1,214 @@
+import logging
+import os
+import socket
+from concurrent.futures import Future
+from threading import Event, Lock, Thread
+from typing import Awaitable, Callable, List, Optional
+from uuid import uuid4
+
+from dataclasses import dataclass
+from sqlalchemy.orm import sessionmaker
+
+from fidesops.db.session import get_db_session
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.models.privacy_request_job import PrivacyRequestJob
+from fidesops.util.async_util import executor, run_async
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LeasedJob:
+    """The details of a PrivacyRequestJob this worker has claimed"""
+
+    id: str
+    privacy_request_id: str
+    from_webhook_id: Optional[str]
+    attempts: int
+
+
+class PrivacyRequestWorker:
+    """
+    Runs the privacy requests queued as PrivacyRequestJobs, up to `max_workers` at a time.
+
+    Any number of workers, in any number of processes, may share the queue. Each job is
+    leased to one worker, which renews the lease every `heartbeat_seconds` from the thread
+    running the request, so jobs started through `run_job_async` keep their lease whether or
+    not this worker is serving. The job is removed once it has finished. If the worker stops
+    before then, the lease expires and another worker runs the request again, up to
+    `max_attempts` times.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        run: Callable[[str, Optional[str]], None],
+        max_workers: int,
+        lease_seconds: int,
+        heartbeat_seconds: int,
+        poll_seconds: int,
+        max_attempts: int,
+        session_factory: Optional[sessionmaker] = None,
+    ):
+        self.run = run
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.session_factory = session_factory or get_db_session()
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+
+        self._lock = Lock()
+        self._busy = 0
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def enqueue(
+        self, privacy_request_id: str, from_webhook_id: Optional[str] = None
+    ) -> str:
+        """Add a privacy request to the queue. Returns the id of its job."""
+        with self.session_factory() as session:
+            return PrivacyRequestJob.enqueue(
+                session, privacy_request_id, from_webhook_id
+            ).id
+
+    def run_job_async(self, job_id: str) -> Awaitable[None]:
+        """
+        Claim the given job and start running it in a separate thread. If this worker is
+        already running `max_workers` requests, the job is left queued for a later poll. In
+        that case, or if another worker has already claimed the job, the returned awaitable
+        completes straight away.
+        """
+        if not self._reserve(1):
+            return run_async(lambda: None)
+        jobs: List[LeasedJob] = []
+        try:
+            jobs = self._claim(limit=1, job_id=job_id)
+        finally:
+            self._release(1 - len(jobs))
+        if not jobs:
+            return run_async(lambda: None)
+        return run_async(self._run, jobs[0])
+
+    def poll(self) -> List["Future[None]"]:
+        """Claim as many queued jobs as this worker has room to run, and start running them"""
+        reserved = self._reserve(self.max_workers)
+        if not reserved:
+            return []
+        jobs: List[LeasedJob] = []
+        try:
+            jobs = self._claim(limit=reserved)
+        finally:
+            self._release(reserved - len(jobs))
+        return [executor.submit(self._run, job) for job in jobs]
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Renew the lease on a job this worker is running. Returns whether it was renewed."""
+        with self.session_factory() as session:
+            return (
+                PrivacyRequestJob.renew_leases(
+                    session, self.worker_id, [job_id], self.lease_seconds
+                )
+                == 1
+            )
+
+    def serve(self) -> None:
+        """Poll the queue until `stop` is called"""
+        logger.info(f"Privacy request worker {self.worker_id} started")
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(f"Privacy request worker {self.worker_id} error: {exc}")
+            self._stopped.wait(self.poll_seconds)
+        logger.info(f"Privacy request worker {self.worker_id} stopped")
+
+    def start(self) -> None:
+        """Serve in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self.serve, name="privacy-request-worker")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling. Requests that are already running are left to finish."""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+
+    def _reserve(self, count: int) -> int:
+        """Reserve room to run up to `count` more jobs. Returns the number reserved."""
+        with self._lock:
+            reserved = max(min(count, self.max_workers - self._busy), 0)
+            self._busy += reserved
+            return reserved
+
+    def _release(self, count: int) -> None:
+        """Release reserved room that no job was claimed for"""
+        with self._lock:
+            self._busy -= count
+
+    def _claim(self, limit: int, job_id: Optional[str] = None) -> List[LeasedJob]:
+        with self.session_factory() as session:
+            jobs = PrivacyRequestJob.claim(
+                session, self.worker_id, self.lease_seconds, limit, job_id=job_id
+            )
+            return [
+                LeasedJob(
+                    id=job.id,
+                    privacy_request_id=job.privacy_request_id,
+                    from_webhook_id=job.from_webhook_id,
+                    attempts=job.attempts,
+                )
+                for job in jobs
+            ]
+
+    def _keep_lease(self, job: LeasedJob, finished: Event) -> None:
+        """Renew the lease on a job every `heartbeat_seconds` until it has finished"""
+        while not finished.wait(self.heartbeat_seconds):
+            try:
+                if not self.heartbeat(job.id):
+                    logger.warning(
+                        f"Privacy request worker {self.worker_id} lost the lease on job {job.id}"
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(f"Privacy request worker {self.worker_id} error: {exc}")
+
+    def _run(self, job: LeasedJob) -> None:
+        finished = Event()
+        lease_keeper = Thread(
+            target=self._keep_lease,
+            args=(job, finished),
+            name=f"privacy-request-lease-{job.id}",
+        )
+        lease_keeper.daemon = True
+        lease_keeper.start()
+        try:
+            if job.attempts > self.max_attempts:
+                logger.error(
+                    f"Privacy request {job.privacy_request_id} was abandoned after {self.max_attempts} attempts"
+                )
+                with self.session_factory() as session:
+                    privacy_request = PrivacyRequest.get(
+                        db=session, id=job.privacy_request_id
+                    )
+                    if privacy_request:
+                        privacy_request.error_processing(db=session)
+            else:
+                self.run(job.privacy_request_id, job.from_webhook_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Privacy request {job.privacy_request_id} failed: {exc}")
+        finally:
+            finished.set()
+            lease_keeper.join()
+            self._finish(job)
+
+    def _finish(self, job: LeasedJob) -> None:
+        try:
+            with self.session_factory() as session:
+                PrivacyRequestJob.finish(session, self.worker_id, job.id)
+        finally:
+            with self._lock:
+                self._busy -= 1
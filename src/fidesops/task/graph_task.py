@@ -1,14 +1,25 @@
+import asyncio
+import hashlib
 import itertools
+import json
 import logging
 import traceback
 from abc import ABC
 from collections import defaultdict
-from functools import wraps
+from functools import wraps, partial
 from time import sleep
-from typing import List, Dict, Any, Tuple, Callable, Optional, Set
-
-import dask
-from dask.threaded import get
+from typing import (
+    List,
+    Dict,
+    Any,
+    AsyncIterator,
+    Tuple,
+    Callable,
+    Optional,
+    Set,
+    Hashable,
+    Iterator,
+)
 
 from fidesops.core.config import config
 from fidesops.graph.config import (
@@ -18,19 +29,20 @@ from fidesops.graph.config import (
     FieldPath,
 )
 from fidesops.graph.graph import Edge, DatasetGraph
+from fidesops.graph.graph_cache import get_dataset_graph_cache
 from fidesops.graph.traversal import TraversalNode, Row, Traversal
 from fidesops.models.connectionconfig import ConnectionConfig, AccessLevel
 from fidesops.models.policy import ActionType, Policy
 from fidesops.models.privacy_request import PrivacyRequest, ExecutionLogStatus
 from fidesops.service.connectors import BaseConnector
+from fidesops.task.task_executor import TaskExecutor, TaskGraph
 from fidesops.task.task_resources import TaskResources
 from fidesops.util.collection_util import partition, append
+from fidesops.util.encryption.secrets_util import SecretsUtil
 from fidesops.util.logger import NotPii
 
 logger = logging.getLogger(__name__)
 
-dask.config.set(scheduler="processes")
-
 EMPTY_REQUEST = PrivacyRequest()
 
 
@@ -43,9 +55,43 @@ def retry(
 
     If an exception is raised, we retry the function `count` times with exponential backoff. After the number of
     retries have expired, we call GraphTask.end() with the appropriate `action_type` and `default_return`.
+
+    Coroutine functions are retried the same way, except that a cancelled coroutine is not retried. Their
+    execution logs are written from the event loop's default executor so that the loop is not held up.
     """
 
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_result(*args: Any, **kwargs: Any) -> Any:
+                func_delay = config.execution.TASK_RETRY_DELAY
+                method_name = func.__name__
+                self = args[0]
+                loop = asyncio.get_running_loop()
+
+                raised_ex = None
+                for attempt in range(config.execution.TASK_RETRY_COUNT + 1):
+                    try:
+                        # Create ExecutionLog with status in_processing or retrying
+                        log = self.log_retry if attempt else self.log_start
+                        await loop.run_in_executor(None, log, action_type)
+                        # Run access or erasure request
+                        return await func(*args, **kwargs)
+                    except asyncio.CancelledError:
+                        raise
+                    except BaseException as ex:  # pylint: disable=W0703
+                        func_delay *= config.execution.TASK_RETRY_BACKOFF
+                        logger.warning(
+                            f"Retrying {method_name} {self.traversal_node.address} in {func_delay} seconds..."
+                        )
+                        await asyncio.sleep(func_delay)
+                        raised_ex = ex
+                await loop.run_in_executor(None, self.log_end, action_type, raised_ex)
+                return default_return
+
+            return async_result
+
         @wraps(func)
         def result(*args: Any, **kwargs: Any) -> List[Optional[Row]]:
             func_delay = config.execution.TASK_RETRY_DELAY
@@ -77,6 +123,43 @@ def retry(
     return decorator
 
 
+class ChildInputRows:
+    """The distinct values of the fields that child traversal_nodes query on, collected
+    from a traversal_node's rows one batch at a time. Only these values are held until the
+    children run, rather than every retrieved row."""
+
+    def __init__(self, field_paths: Set[str]) -> None:
+        self.field_paths = sorted(field_paths)
+        self.rows: List[Row] = []
+        self.seen: Set[Tuple[Tuple[str, Any], ...]] = set()
+
+    def add(self, rows: List[Row]) -> None:
+        """Keep the child query values from these rows that have not been seen before"""
+        for row in rows:
+            child_row = {k: row[k] for k in self.field_paths if k in row}
+            if not child_row:
+                continue
+            fingerprint = tuple(child_row.items())
+            try:
+                if fingerprint in self.seen:
+                    continue
+                self.seen.add(fingerprint)
+            except TypeError:
+                # unhashable values, such as arrays, are passed on without de-duplication
+                pass
+            self.rows.append(child_row)
+
+
+def row_fingerprint(row: Row) -> bytes:
+    """A digest identifying a row by its values"""
+    return hashlib.blake2b(
+        json.dumps(row, sort_keys=True, default=str).encode(
+            config.security.ENCODING
+        ),
+        digest_size=16,
+    ).digest()
+
+
 class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
     """A task that operates on one traversal_node of a traversal"""
 
@@ -102,7 +185,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             for col_addr, edge_list in b.items()
         }
 
-        # the input keys this task will read from.These will build the dask graph
+        # the input keys this task will read from.These will build the task graph
         self.input_keys: List[CollectionAddress] = sorted(b.keys())
 
         self.key = self.traversal_node.address
@@ -217,15 +300,140 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ExecutionLogStatus.complete,
             )
 
+    def child_field_paths(self) -> Set[str]:
+        """The fields of this traversal_node that child traversal_nodes query on"""
+        return {
+            self_field_path.string_path
+            for child_tuples in self.traversal_node.children.values()
+            for _, self_field_path, _ in child_tuples
+        }
+
+    @staticmethod
+    def input_batches(input_data: Dict[str, List[Any]]) -> List[Dict[str, List[Any]]]:
+        """Split the values passed in from parent traversal_nodes into batches of at most
+        RESULT_BATCH_SIZE values.
+
+        A row is retrieved if it matches any one of the input values, so a large input
+        can be queried for in several smaller IN clauses. Input that fits in one batch is
+        queried for all at once."""
+        batch_size = config.execution.RESULT_BATCH_SIZE
+        if sum(len(values) for values in input_data.values()) <= batch_size:
+            return [input_data]
+        return [
+            {field: values[i : i + batch_size]}
+            for field, values in input_data.items()
+            for i in range(0, len(values), batch_size)
+        ]
+
+    def retrieve_data_batches(
+        self, input_data: Dict[str, List[Any]]
+    ) -> Iterator[List[Row]]:
+        """Retrieve this traversal_node's rows a batch at a time, querying for each batch of
+        input values in turn. A row matched by more than one batch of input values is only
+        returned once."""
+        input_batches = self.input_batches(input_data)
+        seen: Set[bytes] = set()
+        for input_batch in input_batches:
+            for rows in self.connector.retrieve_data_batches(
+                self.traversal_node, self.resources.policy, input_batch
+            ):
+                if len(input_batches) > 1:
+                    rows = [row for row in rows if self._first_sighting(row, seen)]
+                if rows:
+                    yield rows
+
+    async def retrieve_data_batches_async(
+        self, input_data: Dict[str, List[Any]]
+    ) -> AsyncIterator[List[Row]]:
+        """Retrieve this traversal_node's rows as retrieve_data_batches does, awaiting the
+        connector's retrieve_data_async for each batch of input values."""
+        input_batches = self.input_batches(input_data)
+        seen: Set[bytes] = set()
+        batch_size = config.execution.RESULT_BATCH_SIZE
+        for input_batch in input_batches:
+            rows = await self.connector.retrieve_data_async(
+                self.traversal_node, self.resources.policy, input_batch
+            )
+            if len(input_batches) > 1:
+                rows = [row for row in rows if self._first_sighting(row, seen)]
+            for i in range(0, len(rows), batch_size):
+                yield rows[i : i + batch_size]
+
+    @staticmethod
+    def _first_sighting(row: Row, seen: Set[bytes]) -> bool:
+        fingerprint = row_fingerprint(row)
+        if fingerprint in seen:
+            return False
+        seen.add(fingerprint)
+        return True
+
     @retry(action_type=ActionType.access, default_return=[])
     def access_request(self, *inputs: List[Row]) -> List[Row]:
-        """Run access request"""
-        output = self.connector.retrieve_data(
-            self.traversal_node, self.resources.policy, self.to_dask_input_data(*inputs)
-        )
-        self.resources.cache_object(f"access_request__{self.key}", output)
+        """Run access request
+
+        Rows are retrieved and cached a batch at a time. Only the distinct values of the
+        fields that child traversal_nodes query on are returned to be passed on to them."""
+        result_key = f"access_request__{self.key}"
+        child_input = ChildInputRows(self.child_field_paths())
+        batch_ct = 0
+        try:
+            for rows in self.retrieve_data_batches(self.to_dask_input_data(*inputs)):
+                self.resources.cache_object_batch(result_key, batch_ct, rows)
+                child_input.add(rows)
+                batch_ct += 1
+            if not batch_ct:
+                self.resources.cache_object(result_key, [])
+            # batches left over from an earlier attempt that retrieved more rows
+            self.resources.clear_object_batches(result_key, max(batch_ct, 1))
+        except BaseException:
+            # a failed attempt leaves no partial result behind
+            self.resources.clear_object_batches(result_key, 0)
+            raise
         self.log_end(ActionType.access)
-        return output
+        return child_input.rows
+
+    @retry(action_type=ActionType.access, default_return=[])
+    async def access_request_async(self, *inputs: List[Row]) -> List[Row]:
+        """Run access request as access_request does, awaiting the connector's non-blocking
+        retrieve_data_async.
+
+        Retrieved batches are cached from the event loop's default executor, so that the loop
+        can run other tasks' queries in the meantime."""
+        loop = asyncio.get_running_loop()
+        result_key = f"access_request__{self.key}"
+        child_input = ChildInputRows(self.child_field_paths())
+        batch_ct = 0
+        try:
+            async for rows in self.retrieve_data_batches_async(
+                self.to_dask_input_data(*inputs)
+            ):
+                await loop.run_in_executor(
+                    None, self.resources.cache_object_batch, result_key, batch_ct, rows
+                )
+                child_input.add(rows)
+                batch_ct += 1
+            if not batch_ct:
+                await loop.run_in_executor(
+                    None, self.resources.cache_object, result_key, []
+                )
+            # batches left over from an earlier attempt that retrieved more rows
+            await loop.run_in_executor(
+                None, self.resources.clear_object_batches, result_key, max(batch_ct, 1)
+            )
+        except BaseException:
+            # a failed or cancelled attempt leaves no partial result behind
+            self.resources.clear_object_batches(result_key, 0)
+            raise
+        await loop.run_in_executor(None, self.log_end, ActionType.access)
+        return child_input.rows
+
+    def access_request_task(self) -> Callable[..., Any]:
+        """The access request to run for this traversal_node. Where the connector can retrieve
+        data without blocking, this is a coroutine function that the TaskExecutor awaits on its
+        event loop, so that it does not occupy a worker thread."""
+        if self.connector.supports_async_retrieval():
+            return self.access_request_async
+        return self.access_request
 
     @retry(action_type=ActionType.erasure, default_return=0)
     def erasure_request(self, retrieved_data: List[Row]) -> int:
@@ -277,6 +485,23 @@ def collect_queries(
     return env
 
 
+def build_task_executor(env: Dict[CollectionAddress, GraphTask]) -> TaskExecutor:
+    """Return an executor for the given tasks. Tasks that query the same ConnectionConfig share a
+    concurrency limit, so that no single datastore is sent more than MAX_TASKS_PER_CONNECTION
+    queries at once by a privacy request. The limit is a global setting, read as each privacy
+    request starts."""
+
+    def connection_key(key: Hashable) -> Optional[str]:
+        task = env.get(key)  # type: ignore
+        return task.traversal_node.node.dataset.connection_key if task else None
+
+    return TaskExecutor(
+        max_workers=config.execution.MAX_TASK_WORKERS,
+        max_tasks_per_group=config.execution.MAX_TASKS_PER_CONNECTION,
+        group_fn=connection_key,
+    )
+
+
 def run_access_request(
     privacy_request: PrivacyRequest,
     policy: Policy,
@@ -285,13 +510,15 @@ def run_access_request(
     identity: Dict[str, Any],
 ) -> Dict[str, List[Row]]:
     """Run the access request"""
-    traversal: Traversal = Traversal(graph, identity)
+    traversal: Traversal = get_dataset_graph_cache().get_traversal(
+        graph, identity.keys()
+    )
     with TaskResources(privacy_request, policy, connection_configs) as resources:
 
         def start_function(seed: Dict[str, Any]) -> Callable[[], List[Dict[str, Any]]]:
-            """Return a function that returns the seed value to kick off the dask function chain.
+            """Return a function that returns the seed value to kick off the task graph.
 
-            The first traversal_node in the dask function chain is just a function that when called returns
+            The first traversal_node in the task graph is just a function that when called returns
             the graph seed value."""
 
             def g() -> List[Dict[str, Any]]:
@@ -310,20 +537,21 @@ def run_access_request(
 
             """A termination function that just returns its inputs mapped to their source addresses.
 
-            This needs to wait for all dependent keys because this is how dask is informed to wait for
-            all terminating addresses before calling this."""
+            This needs to wait for all dependent keys so that it is not called until all
+            terminating addresses have finished."""
 
             return resources.get_all_cached_objects()
 
         env: Dict[CollectionAddress, Any] = {}
         end_nodes = traversal.traverse(env, collect_tasks_fn)
 
-        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
-        dsk[ROOT_COLLECTION_ADDRESS] = (start_function(traversal.seed_data),)
-        dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
+        task_graph: TaskGraph = {
+            k: (t.access_request_task(), *t.input_keys) for k, t in env.items()
+        }
+        task_graph[ROOT_COLLECTION_ADDRESS] = (start_function(identity),)
+        task_graph[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
 
-        return v.compute()
+        return build_task_executor(env).run(task_graph, TERMINATOR_ADDRESS)
 
 
 def run_erasure(  # pylint: disable = too-many-arguments
@@ -335,8 +563,12 @@ def run_erasure(  # pylint: disable = too-many-arguments
     access_request_data: Dict[str, List[Row]],
 ) -> Dict[str, int]:
     """Run an erasure request"""
-    traversal: Traversal = Traversal(graph, identity)
-    with TaskResources(privacy_request, policy, connection_configs) as resources:
+    traversal: Traversal = get_dataset_graph_cache().get_traversal(
+        graph, identity.keys()
+    )
+    with TaskResources(
+        privacy_request, policy, connection_configs
+    ) as resources, SecretsUtil.prefetched_secrets(privacy_request.id):
 
         def collect_tasks_fn(
             tn: TraversalNode, data: Dict[CollectionAddress, GraphTask]
@@ -357,14 +589,16 @@ def run_erasure(  # pylint: disable = too-many-arguments
             The termination function just returns this tuple of ints."""
             return dependent_values
 
-        dsk: Dict[CollectionAddress, Any] = {
-            k: (t.erasure_request, access_request_data[str(k)]) for k, t in env.items()
+        task_graph: TaskGraph = {
+            k: (partial(t.erasure_request, access_request_data[str(k)]),)
+            for k, t in env.items()
         }
         # terminator function waits for all keys
-        dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
+        task_graph[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
 
-        update_cts: Tuple[int, ...] = v.compute()
+        update_cts: Tuple[int, ...] = build_task_executor(env).run(
+            task_graph, TERMINATOR_ADDRESS
+        )
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: records_updated}:
         erasure_update_map: Dict[str, int] = dict(
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from fidesops.common_exceptions import FidesopsException
+from fidesops.util.async_util import EventLoopThread
+
+logger = logging.getLogger(__name__)
+
+TaskGraph = Dict[Hashable, Tuple[Any, ...]]
+"""A graph of tasks in the form {key: (callable, *upstream keys)}. When a task runs, its callable is
+called with the outputs of its upstream tasks, in the order the upstream keys are listed. The callable
+may be a coroutine function, in which case the coroutine it returns is awaited."""
+
+
+class TaskExecutionError(FidesopsException):
+    """The task graph is malformed and cannot be executed."""
+
+
+class TaskExecutor:
+    """Runs a graph of dependent tasks on a bounded pool of worker threads.
+
+    Tasks run as soon as all of their upstream tasks have finished, so independent tasks run
+    concurrently. Task outputs are handed to downstream tasks in memory, and are released as
+    soon as every downstream task has started.
+
+    Tasks that are coroutine functions are awaited on an event loop running in one more thread,
+    rather than each occupying a worker thread, so they are not limited by `max_workers`.
+
+    Tasks can optionally be assigned to a group with `group_fn` (for example, the connection
+    a task queries). At most `max_tasks_per_group` tasks belonging to the same group run
+    at once. Tasks for which `group_fn` returns None are not limited.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_tasks_per_group: Optional[int] = None,
+        group_fn: Optional[Callable[[Hashable], Optional[Hashable]]] = None,
+    ):
+        if max_workers < 1:
+            raise TaskExecutionError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.max_tasks_per_group = max_tasks_per_group
+        self.group_fn = group_fn
+
+    @staticmethod
+    def _validate(graph: TaskGraph, target: Hashable) -> None:
+        """Raise a TaskExecutionError if the graph references unknown keys"""
+        if target not in graph:
+            raise TaskExecutionError(f"Target {target} is not in the task graph")
+        for key, (_, *upstream_keys) in graph.items():
+            missing = [k for k in upstream_keys if k not in graph]
+            if missing:
+                raise TaskExecutionError(
+                    f"Task {key} depends on unknown task(s) {missing}"
+                )
+
+    @staticmethod
+    def _required_keys(graph: TaskGraph, target: Hashable) -> Set[Hashable]:
+        """Return the target and every task it (transitively) depends on"""
+        required: Set[Hashable] = set()
+        stack = [target]
+        while stack:
+            key = stack.pop()
+            if key not in required:
+                required.add(key)
+                stack.extend(graph[key][1:])
+        return required
+
+    def run(self, graph: TaskGraph, target: Hashable) -> Any:  # pylint: disable=R0914
+        """Run every task needed to compute `target` and return the target's output.
+
+        If any task raises, no further tasks are started and the exception is re-raised
+        once the tasks already running on worker threads have finished. Coroutines still
+        running are cancelled.
+        """
+        self._validate(graph, target)
+        required = self._required_keys(graph, target)
+
+        waiting_on: Dict[Hashable, int] = {}
+        downstream: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        for key in required:
+            upstream_keys = graph[key][1:]
+            waiting_on[key] = len(upstream_keys)
+            for upstream_key in upstream_keys:
+                downstream[upstream_key].append(key)
+
+        # outputs are held only until all of their downstream tasks have been started
+        consumers_left: Dict[Hashable, int] = {
+            k: len(v) for k, v in downstream.items()
+        }
+        results: Dict[Hashable, Any] = {}
+        ready: Deque[Hashable] = deque(
+            sorted((k for k, ct in waiting_on.items() if ct == 0), key=str)
+        )
+        running: Dict[Future, Hashable] = {}
+        running_per_group: Dict[Hashable, int] = defaultdict(int)
+        on_loop: Set[Future] = set()
+
+        def group_of(key: Hashable) -> Optional[Hashable]:
+            return self.group_fn(key) if self.group_fn else None
+
+        def can_start(key: Hashable) -> bool:
+            group = group_of(key)
+            return (
+                group is None
+                or not self.max_tasks_per_group
+                or running_per_group[group] < self.max_tasks_per_group
+            )
+
+        def is_async(key: Hashable) -> bool:
+            return asyncio.iscoroutinefunction(graph[key][0])
+
+        with ExitStack() as stack:
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=self.max_workers)
+            )
+            event_loop: Optional[EventLoopThread] = None
+            if any(is_async(key) for key in required):
+                # entered last so that it is exited first, cancelling any pending coroutines
+                event_loop = stack.enter_context(EventLoopThread())
+
+            while ready or running:
+                # start every ready task that is not held back by its group limit, or by a
+                # lack of free worker threads
+                deferred: Deque[Hashable] = deque()
+                while ready:
+                    key = ready.popleft()
+                    threads_busy = len(running) - len(on_loop)
+                    if not can_start(key) or (
+                        not is_async(key) and threads_busy >= self.max_workers
+                    ):
+                        deferred.append(key)
+                        continue
+                    fn, upstream_keys = graph[key][0], graph[key][1:]
+                    group = group_of(key)
+                    if group is not None:
+                        running_per_group[group] += 1
+                    inputs = [results[k] for k in upstream_keys]
+                    if event_loop and is_async(key):
+                        future = event_loop.submit(fn(*inputs))
+                        on_loop.add(future)
+                    else:
+                        future = pool.submit(fn, *inputs)
+                    running[future] = key
+                    for upstream_key in upstream_keys:
+                        consumers_left[upstream_key] -= 1
+                        if not consumers_left[upstream_key]:
+                            results.pop(upstream_key, None)
+                ready.extendleft(reversed(deferred))
+
+                if not running:
+                    # unreachable for a valid acyclic graph
+                    raise TaskExecutionError(
+                        f"Tasks could not be scheduled: {list(ready)}"
+                    )
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    on_loop.discard(future)
+                    group = group_of(key)
+                    if group is not None:
+                        running_per_group[group] -= 1
+                    ex = future.exception()
+                    if ex:
+                        logger.error(f"Task {key} failed: {ex}")
+                        for f in running:
+                            f.cancel()
+                        raise ex
+                    results[key] = future.result()
+                    for downstream_key in downstream[key]:
+                        waiting_on[downstream_key] -= 1
+                        if waiting_on[downstream_key] == 0:
+                            ready.append(downstream_key)
+
+        if target not in results:
+            raise TaskExecutionError(
+                f"Tasks could not be scheduled: {sorted((k for k, ct in waiting_on.items() if ct), key=str)}"
+            )
+        return results[target]
@@ -1,9 +1,13 @@
 import logging
+from datetime import datetime, timezone
+from threading import Lock, Timer
+from time import monotonic
 from typing import Dict, Any, Optional, List
 
 from fidesops.schemas.shared_schemas import FidesOpsKey
 
 from fidesops.common_exceptions import ConnectorNotFoundException
+from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.graph.config import (
     CollectionAddress,
@@ -21,25 +25,40 @@ from fidesops.service.connectors import (
     RedshiftConnector,
     MicrosoftSQLServerConnector,
 )
-from fidesops.util.cache import get_cache
+from fidesops.service.connectors.connector_registry import get_connector_registry
+from fidesops.util.cache import (
+    RESULT_BATCH_SEPARATOR,
+    get_cache,
+    get_cache_index_key,
+    get_result_batch_key,
+    join_result_batches,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class Connections:
-    """Temporary container for connections. This will be replaced."""
+    """The connectors used by a single privacy request.
+
+    Connectors are borrowed from the process-wide connector registry, so that their
+    connection pools are shared between privacy requests, and handed back on close."""
 
     def __init__(self) -> None:
         self.connections: Dict[str, BaseConnector] = {}
+        # held while checking for and acquiring a connector, so that tasks which first need the
+        # same connection at once acquire it from the registry once rather than once each
+        self.lock = Lock()
 
     def get_connector(self, connection_config: ConnectionConfig) -> BaseConnector:
         """Return the connector corresponding to this config. Will return the existing
         connector or create one if it does not yet exist."""
         key = connection_config.key
-        if key not in self.connections:
-            connector = Connections.build_connector(connection_config)
-            self.connections[key] = connector
-        return self.connections[key]
+        with self.lock:
+            if key not in self.connections:
+                self.connections[key] = get_connector_registry().acquire(
+                    connection_config, Connections.build_connector
+                )
+            return self.connections[key]
 
     @staticmethod
     def build_connector(connection_config: ConnectionConfig) -> BaseConnector:
@@ -61,9 +80,85 @@ class Connections:
         )
 
     def close(self) -> None:
-        """Close all held connection resources."""
-        for connector in self.connections.values():
-            connector.close()
+        """Hand all held connectors back to the connector registry."""
+        with self.lock:
+            registry = get_connector_registry()
+            for connector in self.connections.values():
+                registry.release(connector)
+            self.connections = {}
+
+
+class ExecutionLogBuffer:
+    """The execution logs written by the tasks of a single privacy request.
+
+    Logs are held in memory and inserted together once `batch_size` have built up, or at most
+    `flush_seconds` after the oldest held log was written, and whenever the buffer is flushed
+    explicitly. Each log is timestamped when it is written, so logs keep their order however
+    they are batched. Once the buffer is closed, any late logs are inserted as they are written."""
+
+    def __init__(self, batch_size: int, flush_seconds: float) -> None:
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.rows: List[Dict[str, Any]] = []
+        self.oldest_row_at = 0.0
+        # flushes the held logs once the oldest is due, if no later write does first
+        self.timer: Optional[Timer] = None
+        self.closed = False
+        # guards the held logs and the timer, which are shared by the tasks writing logs and
+        # the timer's thread flushing them
+        self.lock = Lock()
+        self.SessionLocal = get_db_session()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Add a log, flushing the held logs if the batch is full or the oldest is due"""
+        with self.lock:
+            now = datetime.now(timezone.utc)
+            if not self.rows:
+                self.oldest_row_at = monotonic()
+            self.rows.append({**row, "created_at": now, "updated_at": now})
+            if (
+                self.closed
+                or len(self.rows) >= self.batch_size
+                or monotonic() - self.oldest_row_at >= self.flush_seconds
+            ):
+                self._flush()
+            elif self.timer is None:
+                self.timer = Timer(self.flush_seconds, self._flush_when_due)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self) -> None:
+        """Insert all held logs"""
+        with self.lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Insert all held logs. The timer is cancelled even if they can't be inserted."""
+        with self.lock:
+            try:
+                self._flush()
+            finally:
+                self.closed = True
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+
+    def _flush_when_due(self) -> None:
+        try:
+            self.flush()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Failed to write execution logs: {exc}")
+
+    def _flush(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        with self.SessionLocal() as db:
+            db.execute(ExecutionLog.__table__.insert(), rows)
+            db.commit()
 
 
 class TaskResources:
@@ -89,6 +184,10 @@ class TaskResources:
             c.key: c for c in connection_configs
         }
         self.connections = Connections()
+        self.execution_logs = ExecutionLogBuffer(
+            config.execution.EXECUTION_LOG_BATCH_SIZE,
+            config.execution.EXECUTION_LOG_FLUSH_SECONDS,
+        )
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' useage for closing resources"""
@@ -101,11 +200,43 @@ class TaskResources:
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be
         stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}",
+            value,
+            index=get_cache_index_key(self.request.id),
+        )
+
+    def cache_object_batch(self, key: str, batch_number: int, value: Any) -> None:
+        """Store one batch of a result in cache. Batches are joined back together in
+        order by get_all_cached_objects"""
+        self.cache_object(get_result_batch_key(key, batch_number), value)
+
+    def clear_object_batches(self, key: str, batch_count: int) -> None:
+        """Remove the batches of a result from `batch_count` on, such as those left over
+        from an earlier attempt that retrieved more rows. A `batch_count` of 0 removes
+        the whole result."""
+        index = get_cache_index_key(self.request.id)
+        result_key = f"EN_{self.request.id}__{key}"
+        stale_keys = [
+            batch_key
+            for batch_key in self.cache.get_index_members(index, result_key)
+            if (batch_key == result_key and not batch_count)
+            or (
+                batch_key.startswith(f"{result_key}{RESULT_BATCH_SEPARATOR}")
+                and int(batch_key.rpartition(RESULT_BATCH_SEPARATOR)[2]) >= batch_count
+            )
+        ]
+        if stale_keys:
+            self.cache.delete(*stale_keys)
+            self.cache.srem(index, *stale_keys)
 
     def get_all_cached_objects(self) -> Dict[str, Optional[Any]]:
         """Retrieve the results of all steps"""
-        value_dict = self.cache.get_encoded_objects_by_prefix(self.request.id)
+        value_dict = join_result_batches(
+            self.cache.get_encoded_objects_in_index(
+                get_cache_index_key(self.request.id), prefix=f"{self.request.id}__"
+            )
+        )
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
@@ -117,13 +248,10 @@ class TaskResources:
         status: ExecutionLogStatus,
         message: str = None,
     ) -> Any:
-        """Store in application db. Return the created or written-to id field value."""
-        SessionLocal = get_db_session()
-        db = SessionLocal()
-
-        ExecutionLog.create(
-            db=db,
-            data={
+        """Store in application db. Logs are written in batches, and any still held are
+        written when these resources are closed."""
+        self.execution_logs.write(
+            {
                 "dataset_name": collection_address.dataset,
                 "collection_name": collection_address.collection,
                 "fields_affected": fields_affected,
@@ -131,9 +259,8 @@ class TaskResources:
                 "status": status,
                 "privacy_request_id": self.request.id,
                 "message": message,
-            },
+            }
         )
-        db.close()
 
     def get_connector(self, key: FidesOpsKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
@@ -144,4 +271,7 @@ class TaskResources:
     def close(self) -> None:
         """Close any held resources"""
         logger.debug(f"Closing all task resources for {self.request.id}")
-        self.connections.close()
+        try:
+            self.execution_logs.close()
+        finally:
+            self.connections.close()
@@ -1,3 +1,4 @@
+import base64
 import secrets
 
 from datetime import datetime
@@ -5,15 +6,13 @@ from datetime import datetime
 import os
 
 import logging
-from typing import Any, Dict, Union
+from typing import IO, Any, Dict, List, Optional, Union, cast
 
 import json
 import zipfile
 from io import BytesIO
 import requests
 
-import pandas as pd
-
 from botocore.exceptions import ClientError, ParamValidationError
 
 from fidesops.core.config import config
@@ -21,8 +20,10 @@ from fidesops.models.storage import ResponseFormat
 from fidesops.schemas.storage.storage import StorageSecrets
 from fidesops.util.cache import get_encryption_cache_key, get_cache
 from fidesops.util.cryptographic_util import bytes_to_b64_str
+from fidesops.util.csv_util import csv_lines
 from fidesops.util.encryption.aes_gcm_encryption_scheme import (
     encrypt_to_bytes_verify_secrets_length,
+    encryptor_verify_secrets_length,
 )
 
 from fidesops.util.storage_authenticator import (
@@ -35,6 +36,11 @@ logger = logging.getLogger(__name__)
 
 LOCAL_FIDES_UPLOAD_DIRECTORY = "fides_uploads"
 
+# S3 requires every part of a multipart upload but the last to be at least 5 MiB
+S3_MULTIPART_CHUNK_SIZE_BYTES = 5 * 1024 * 1024
+# Serialized results are encrypted and written on in chunks of at least this size
+RESULTS_WRITE_BUFFER_BYTES = 64 * 1024
+
 
 def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
     """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
@@ -61,45 +67,182 @@ def encrypt_access_request_results(data: Union[str, bytes], request_id: str) ->
     )
 
 
-def write_to_in_memory_buffer(
-    resp_format: str, data: Dict[str, Any], request_id: str
-) -> BytesIO:
-    """Write JSON/CSV data to in-memory file-like object to be passed to S3. Encrypt data if encryption key/nonce
-    has been cached for the given privacy request id
+class EncryptedResultsWriter:
+    """Writes access request results to a binary file object as they are serialized,
+    encrypting them if an encryption key has been cached for the privacy request.
+
+    Encrypted output is the same base64 encoded nonce and AES GCM message that
+    encrypt_access_request_results returns, but is encrypted and encoded a chunk at a time
+    rather than from a copy of the whole serialized results.
+    """
+
+    def __init__(self, fileobj: IO[bytes], request_id: str) -> None:
+        self.fileobj = fileobj
+        self.buffer = bytearray()
+        # Encrypted bytes waiting to be base64 encoded in multiples of 3 bytes
+        self.encrypted = bytearray()
+        self.encryptor = None
+
+        encryption_key: Optional[str] = get_cache().get(
+            get_encryption_cache_key(
+                privacy_request_id=request_id,
+                encryption_attr="key",
+            )
+        )
+        if encryption_key:
+            nonce: bytes = secrets.token_bytes(config.security.AES_GCM_NONCE_LENGTH)
+            self.encryptor = encryptor_verify_secrets_length(
+                encryption_key.encode(config.security.ENCODING), nonce
+            )
+            self.encrypted += nonce
+
+    def write(self, data: Union[str, bytes]) -> None:
+        """Write the next piece of the serialized results"""
+        if isinstance(data, str):
+            data = data.encode(config.security.ENCODING)
+        self.buffer += data
+        if len(self.buffer) >= RESULTS_WRITE_BUFFER_BYTES:
+            self._flush()
+
+    def finish(self) -> None:
+        """Write out any buffered results. The underlying file object is left open."""
+        self._flush(final=True)
+
+    def _flush(self, final: bool = False) -> None:
+        if self.encryptor is None:
+            self.fileobj.write(bytes(self.buffer))
+            self.buffer.clear()
+            return
+
+        self.encrypted += self.encryptor.update(bytes(self.buffer))
+        self.buffer.clear()
+        if final:
+            self.encrypted += self.encryptor.finalize() + self.encryptor.tag
+        end = len(self.encrypted) if final else len(self.encrypted) // 3 * 3
+        self.fileobj.write(base64.b64encode(bytes(self.encrypted[:end])))
+        del self.encrypted[:end]
+
+
+class S3MultipartUpload:
+    """A write-only file object that uploads everything written to it to S3 as a multipart
+    upload, holding at most one part in memory at a time.
+
+    Used as a context manager, the upload is completed on exit, or aborted if an
+    exception was raised.
+    """
+
+    def __init__(
+        self,
+        s3: Any,
+        bucket_name: str,
+        file_key: str,
+        part_size: int = S3_MULTIPART_CHUNK_SIZE_BYTES,
+    ) -> None:
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.file_key = file_key
+        self.part_size = part_size
+        self.buffer = bytearray()
+        self.parts: List[Dict[str, Any]] = []
+        self.upload_id: Optional[str] = None
+
+    def __enter__(self) -> "S3MultipartUpload":
+        self.upload_id = self.s3.create_multipart_upload(
+            Bucket=self.bucket_name, Key=self.file_key
+        )["UploadId"]
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is not None:
+            logger.info(f"Aborting S3 Upload of {self.file_key}")
+            self.s3.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=self.file_key, UploadId=self.upload_id
+            )
+            return
+
+        if self.buffer or not self.parts:
+            self._upload_part(bytes(self.buffer))
+        self.s3.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.file_key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
+
+    def write(self, data: bytes) -> int:
+        """Buffer the data, uploading a part whenever a full part has been buffered"""
+        self.buffer += data
+        while len(self.buffer) >= self.part_size:
+            self._upload_part(bytes(self.buffer[: self.part_size]))
+            del self.buffer[: self.part_size]
+        return len(data)
+
+    def flush(self) -> None:
+        """Parts are only uploaded once full, so there is nothing to flush"""
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self.parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.file_key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+
+def write_access_results(
+    resp_format: str, data: Dict[str, Any], request_id: str, fileobj: IO[bytes]
+) -> None:
+    """Serialize JSON/CSV data to a binary file object a piece at a time. Encrypt data if
+    encryption key/nonce has been cached for the given privacy request id
 
     :param resp_format: str, should be one of ResponseFormat
     :param data: Dict
     :param request_id: str, The privacy request id
+    :param fileobj: The file object to write to, which does not need to be seekable
     """
-    logger.info("Writing data to in-memory buffer")
-
     if resp_format == ResponseFormat.json.value:
-        json_str = json.dumps(data, indent=2, default=_handle_json_encoding)
-        return BytesIO(
-            encrypt_access_request_results(json_str, request_id).encode(
-                config.security.ENCODING
-            )
-        )
+        writer = EncryptedResultsWriter(fileobj, request_id)
+        encoder = json.JSONEncoder(indent=2, default=_handle_json_encoding)
+        for chunk in encoder.iterencode(data):
+            writer.write(chunk)
+        writer.finish()
+        return
 
     if resp_format == ResponseFormat.csv.value:
-        zipped_csvs = BytesIO()
-        with zipfile.ZipFile(zipped_csvs, "w") as f:
+        with zipfile.ZipFile(fileobj, "w") as f:
             for key in data:
-                df = pd.json_normalize(data[key])
-                buffer = BytesIO()
-                df.to_csv(buffer, index=False, encoding=config.security.ENCODING)
-                buffer.seek(0)
-                f.writestr(
-                    f"{key}.csv",
-                    encrypt_access_request_results(buffer.getvalue(), request_id),
-                )
-
-        zipped_csvs.seek(0)
-        return zipped_csvs
+                # the size of each file isn't known up front, so always allow it to
+                # exceed the 2 GiB limit of a zip file without ZIP64 extensions
+                with f.open(f"{key}.csv", "w", force_zip64=True) as csv_file:
+                    writer = EncryptedResultsWriter(csv_file, request_id)
+                    for line in csv_lines(data[key]):
+                        writer.write(line)
+                    writer.finish()
+        return
 
     raise NotImplementedError(f"No handling for response format {resp_format}.")
 
 
+def write_to_in_memory_buffer(
+    resp_format: str, data: Dict[str, Any], request_id: str
+) -> BytesIO:
+    """Write JSON/CSV data to in-memory file-like object. Encrypt data if encryption key/nonce
+    has been cached for the given privacy request id
+
+    :param resp_format: str, should be one of ResponseFormat
+    :param data: Dict
+    :param request_id: str, The privacy request id
+    """
+    logger.info("Writing data to in-memory buffer")
+    buffer = BytesIO()
+    write_access_results(resp_format, data, request_id, buffer)
+    buffer.seek(0)
+    return buffer
+
+
 def upload_to_s3(  # pylint: disable=R0913
     storage_secrets: Dict[StorageSecrets, Any],
     data: Dict,
@@ -120,12 +263,13 @@ def upload_to_s3(  # pylint: disable=R0913
 
         s3 = my_session.client("s3")
 
-        # handles file chunking
-        s3.upload_fileobj(
-            Fileobj=write_to_in_memory_buffer(resp_format, data, request_id),
-            Bucket=bucket_name,
-            Key=file_key,
-        )
+        # results are serialized, encrypted and uploaded a part at a time
+        with S3MultipartUpload(s3, bucket_name, file_key) as s3_upload:
+            # S3MultipartUpload implements the write and flush methods that are used
+            # on the file object, including by zipfile
+            write_access_results(
+                resp_format, data, request_id, cast(IO[bytes], s3_upload)
+            )
         # todo- move to outbound_urn_registry
         return "https://%s.s3.amazonaws.com/%s" % (bucket_name, file_key)
     except ClientError as e:
@@ -1,15 +1,17 @@
 import asyncio
 from asyncio import AbstractEventLoop
-from concurrent.futures import ThreadPoolExecutor
-from typing import TypeVar, Callable, Any, Awaitable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Thread
+from typing import TypeVar, Callable, Any, Awaitable, Coroutine, Optional
 import logging
 
+from fidesops.core.config import config
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
-executor = ThreadPoolExecutor(max_workers=2)
+executor = ThreadPoolExecutor(max_workers=config.execution.PRIVACY_REQUEST_WORKERS)
 
 
 def _loop() -> AbstractEventLoop:
@@ -29,3 +31,38 @@ def wait_for(t: Awaitable[T]) -> Optional[T]:
     """Wait for the return of a callable. This is mostly intended
     to be used for testing async tasks."""
     return asyncio.get_event_loop().run_until_complete(t)
+
+
+class EventLoopThread:
+    """An event loop running in its own thread, so that coroutines can be awaited concurrently
+    from synchronous code. Coroutines still pending when the context exits are cancelled."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self.loop.run_forever, name="event-loop")
+        self._thread.daemon = True
+
+    def __enter__(self) -> "EventLoopThread":
+        self._thread.start()
+        return self
+
+    def __exit__(self, _type: Any, value: Any, traceback: Any) -> None:
+        asyncio.run_coroutine_threadsafe(self._cancel_pending(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule a coroutine on the loop, returning a future for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    @staticmethod
+    async def _cancel_pending() -> None:
+        pending = [
+            task
+            for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
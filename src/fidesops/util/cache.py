@@ -1,17 +1,21 @@
 import base64
 import logging
 import pickle
+import zlib
+from collections import defaultdict
+from threading import Lock
+from time import monotonic
 from typing import (
     Any,
     List,
     Optional,
-    Set,
     Union,
     Dict,
 )
 
-from redis import Redis
-from redis.client import Script
+from redis import ConnectionPool, Redis
+from redis.client import Pipeline
+from redis.exceptions import RedisError
 
 from fidesops import common_exceptions
 from fidesops.core.config import config
@@ -26,6 +30,14 @@ RedisValue = Union[bytes, float, int, str]
 
 _connection = None
 
+# The first byte of an object encoded with encode_obj_binary. Base64 encoded objects
+# always start with a printable character, so the two formats can't be confused.
+RAW_PICKLE_HEADER = b"\x00"
+ZLIB_PICKLE_HEADER = b"\x01"
+
+# Separates the key of a result saved in batches from the number of each batch
+RESULT_BATCH_SEPARATOR = "#"
+
 
 class FidesopsRedis(Redis):
     """
@@ -33,9 +45,70 @@ class FidesopsRedis(Redis):
     should never be instantiated on its own.
     """
 
-    def set_with_autoexpire(self, key: str, value: RedisValue) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
-        return self.set(key, value, ex=config.redis.DEFAULT_TTL_SECONDS)
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._binary_client: Optional[Redis] = None
+
+    @property
+    def binary_client(self) -> Redis:
+        """A client with the same connection settings that returns values as raw bytes rather
+        than decoding them, for reading and writing binary encoded objects."""
+        if self._binary_client is None:
+            pool = self.connection_pool
+            self._binary_client = Redis(
+                connection_pool=ConnectionPool(
+                    connection_class=pool.connection_class,
+                    **{**pool.connection_kwargs, "decode_responses": False},
+                )
+            )
+        return self._binary_client
+
+    def set_with_autoexpire(
+        self, key: str, value: RedisValue, index: Optional[str] = None
+    ) -> Optional[bool]:
+        """Call the connection class' default set method with ex= our default TTL
+
+        If an index is given, the key is also added to the set stored at that index. The
+        index expires along with the last key added to it."""
+        if not index:
+            return self.set(key, value, ex=config.redis.DEFAULT_TTL_SECONDS)
+        pipe = self.pipeline(transaction=False)
+        self._set_in_index(pipe, key, value, index)
+        return pipe.execute()[0]
+
+    def set_all_with_autoexpire(
+        self, values_by_index: Dict[str, Dict[str, RedisValue]]
+    ) -> None:
+        """Set every given key with our default TTL and add it to the set stored at its index,
+        all in a single round trip. Each index expires along with the last key added to it."""
+        pipe = self.pipeline(transaction=False)
+        for index, values in values_by_index.items():
+            for key, value in values.items():
+                self._set_in_index(pipe, key, value, index)
+        if len(pipe):
+            pipe.execute()
+
+    @staticmethod
+    def _set_in_index(pipe: Pipeline, key: str, value: Any, index: str) -> None:
+        """Queue up setting the key with our default TTL and adding it to the index"""
+        ttl = config.redis.DEFAULT_TTL_SECONDS
+        pipe.set(key, value, ex=ttl)
+        pipe.sadd(index, key)
+        pipe.expire(index, ttl)
+
+    def get_index_members(self, index: str, prefix: str = "") -> List[str]:
+        """Return the keys in the given index that start with the prefix.
+
+        Keys cached before the index existed are not in it, so if the index is empty and a
+        prefix is given, the keys are found with an incremental SCAN for the prefix instead."""
+        members = self.smembers(index)
+        if not members and prefix:
+            return sorted(self.get_keys_by_prefix(prefix))
+        return sorted(key for key in members if key.startswith(prefix))
+
+    def delete_index(self, index: str) -> None:
+        """Delete the given index along with every key in it"""
+        self.delete(*self.get_index_members(index), index)
 
     def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
         """Retrieve all keys that match a given prefix."""
@@ -48,38 +121,79 @@ class FidesopsRedis(Redis):
             out.extend(keys)
         return out
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
-        )
-        s()
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix.
+
+        Keys are found with an incremental SCAN, so this doesn't block Redis while the
+        keyspace is searched. Prefer deleting keys through an index where possible."""
+        keys = self.get_keys_by_prefix(prefix, chunk_size)
+        for start in range(0, len(keys), chunk_size):
+            self.delete(*keys[start : start + chunk_size])
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
         dictionary. Note that if a key does not exist in redis it will be returned as None"""
+        if not keys:
+            return {}
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
+    def set_encoded_object(
+        self, key: str, obj: Any, index: Optional[str] = None
+    ) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
-        get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        get_objects_by_prefix or processed with decode_obj.
+
+        If an index is given, the key is also added to the set stored at that index, so that
+        all objects in the index can be retrieved with get_encoded_objects_in_index. The
+        index expires along with the last object added to it."""
+        if config.redis.BINARY_OBJECTS:
+            client: Redis = self.binary_client
+            value = FidesopsRedis.encode_obj_binary(obj)
+        else:
+            client = self
+            value = FidesopsRedis.encode_obj(obj)
+        if not index:
+            return client.set(
+                f"EN_{key}", value, ex=config.redis.DEFAULT_TTL_SECONDS
+            )
+        pipe = client.pipeline(transaction=False)
+        self._set_in_index(pipe, f"EN_{key}", value, index)
+        return pipe.execute()[0]
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
-        val = super().get(key)
+        val = self.binary_client.get(key)
         return self.decode_obj(val) if val else None
 
+    def get_encoded_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """Retrieve and decode the objects stored at the given keys. Keys that do not exist
+        in redis are returned with a value of None."""
+        if not keys:
+            return {}
+        values = self.binary_client.mget(keys)
+        return {
+            key: FidesopsRedis.decode_obj(value) for key, value in zip(keys, values)
+        }
+
     def get_encoded_objects_by_prefix(self, prefix: str) -> Dict[str, Optional[Any]]:
         """Return all objects stored under a given prefix. This method
         assumes these objects have been stored encoded using set_object"""
         keys = self.get_keys_by_prefix(f"EN_{prefix}")
-        encoded_object_dict = self.get_values(keys)
-        return {
-            key: FidesopsRedis.decode_obj(value)
-            for key, value in encoded_object_dict.items()
-        }
+        return self.get_encoded_values(keys)
+
+    def get_encoded_objects_in_index(
+        self, index: str, prefix: str = ""
+    ) -> Dict[str, Optional[Any]]:
+        """Return all objects that were added to the given index by set_encoded_object and
+        whose keys start with the prefix, without scanning the keyspace."""
+        if not prefix:
+            keys = [
+                key for key in self.get_index_members(index) if key.startswith("EN_")
+            ]
+        else:
+            keys = self.get_index_members(index, f"EN_{prefix}")
+        return self.get_encoded_values(keys)
 
     @staticmethod
     def encode_obj(obj: Any) -> bytes:
@@ -87,14 +201,75 @@ class FidesopsRedis(Redis):
         return base64.b64encode(pickle.dumps(obj))
 
     @staticmethod
-    def decode_obj(bs: Optional[bytes]) -> Any:
-        """Decode an object from its base64 representation.
+    def encode_obj_binary(obj: Any) -> bytes:
+        """Encode an object to bytes that can be stored in Redis. Encoded objects larger than
+        the configured COMPRESSION_THRESHOLD_BYTES are compressed."""
+        pickled = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        threshold = config.redis.COMPRESSION_THRESHOLD_BYTES
+        if threshold is not None and len(pickled) > threshold:
+            return ZLIB_PICKLE_HEADER + zlib.compress(pickled)
+        return RAW_PICKLE_HEADER + pickled
+
+    @staticmethod
+    def decode_obj(bs: Optional[Union[bytes, str]]) -> Any:
+        """Decode an object encoded with either encode_obj or encode_obj_binary.
 
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
-        if bs:
-            return pickle.loads(base64.b64decode(bs))
-        return None
+        if not bs:
+            return None
+        if isinstance(bs, bytes):
+            header, body = bs[:1], bs[1:]
+            if header == RAW_PICKLE_HEADER:
+                return pickle.loads(body)
+            if header == ZLIB_PICKLE_HEADER:
+                return pickle.loads(zlib.decompress(body))
+        return pickle.loads(base64.b64decode(bs))
+
+
+class CacheHealthCheck:
+    """Decides when get_cache should check that Redis is reachable, and counts the checks
+    performed and skipped.
+
+    Redis is pinged at most once every `interval_seconds`, and on the next call after a
+    failed check. An interval of 0 checks on every call."""
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.last_success: Optional[float] = None
+        self.performed = 0
+        self.skipped = 0
+
+    def check(self, connection: Redis, interval_seconds: int) -> None:
+        """Ping Redis if a check is due, raising a RedisConnectionError if it is unreachable"""
+        now = monotonic()
+        with self.lock:
+            if (
+                self.last_success is not None
+                and now - self.last_success < interval_seconds
+            ):
+                self.skipped += 1
+                return
+            self.performed += 1
+        try:
+            connected = connection.ping()
+        except RedisError as exc:
+            logger.error(f"Redis health check failed: {exc}")
+            connected = False
+        with self.lock:
+            self.last_success = now if connected else None
+        if not connected:
+            raise common_exceptions.RedisConnectionError(
+                "Unable to establish Redis connection. Fidesops is unable to accept PrivacyRequsts."
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """The number of health checks performed and skipped so far"""
+        with self.lock:
+            return {"performed": self.performed, "skipped": self.skipped}
+
+
+_health_check = CacheHealthCheck()
 
 
 def get_cache() -> FidesopsRedis:
@@ -110,15 +285,16 @@ def get_cache() -> FidesopsRedis:
             password=config.redis.PASSWORD,
         )
 
-    connected = _connection.ping()
-    if not connected:
-        raise common_exceptions.RedisConnectionError(
-            "Unable to establish Redis connection. Fidesops is unable to accept PrivacyRequsts."
-        )
-
+    _health_check.check(_connection, config.redis.HEALTH_CHECK_INTERVAL_SECONDS)
     return _connection
 
 
+def get_cache_health_check_counts() -> Dict[str, int]:
+    """Return how many times get_cache has checked the Redis connection, and how many
+    times it skipped the check because one had recently succeeded"""
+    return _health_check.counts()
+
+
 def get_identity_cache_key(privacy_request_id: str, identity_attribute: str) -> str:
     """Return the key at which to save this PrivacyRequest's identity for the passed in attribute"""
     # TODO: Remove this prefix
@@ -130,6 +306,11 @@ def get_encryption_cache_key(privacy_request_id: str, encryption_attr: str) -> s
     return f"id-{privacy_request_id}-encryption-{encryption_attr}"
 
 
+def get_cache_index_key(privacy_request_id: str) -> str:
+    """Return the key of the set indexing every key cached for this PrivacyRequest"""
+    return f"idx-{privacy_request_id}"
+
+
 def get_masking_secret_cache_key(
     privacy_request_id: str, masking_strategy: str, secret_type: SecretType
 ) -> str:
@@ -139,9 +320,41 @@ def get_masking_secret_cache_key(
     )
 
 
-def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> Set:
-    """Returns all cache keys related to this privacy request's cached identities"""
+def get_result_batch_key(key: str, batch_number: int) -> str:
+    """Return the key at which to save one batch of a result. The first batch is saved at
+    the key itself, so a result that fits in a single batch is saved just as a whole one"""
+    if not batch_number:
+        return key
+    return f"{key}{RESULT_BATCH_SEPARATOR}{batch_number}"
+
+
+def join_result_batches(values: Dict[str, Optional[Any]]) -> Dict[str, Optional[Any]]:
+    """Join results saved in batches with get_result_batch_key back into single lists,
+    in batch order, under the key of their first batch"""
+    batches: Dict[str, Dict[int, Any]] = defaultdict(dict)
+    for key, value in values.items():
+        result_key, _, batch_number = key.partition(RESULT_BATCH_SEPARATOR)
+        batches[result_key][int(batch_number or 0)] = value
+    joined: Dict[str, Optional[Any]] = {}
+    for result_key, result_batches in batches.items():
+        if len(result_batches) == 1 and 0 in result_batches:
+            joined[result_key] = result_batches[0]
+            continue
+        joined[result_key] = [
+            row
+            for batch_number in sorted(result_batches)
+            for row in result_batches[batch_number] or []
+        ]
+    return joined
+
+
+def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[str]:
+    """Returns all cache keys related to this privacy request"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    keys = cache.get_index_members(get_cache_index_key(privacy_request_id))
+    if not keys:
+        # the request's keys were cached before the index existed
+        keys = cache.get_keys_by_prefix(
+            f"{privacy_request_id}-"
+        ) + cache.get_keys_by_prefix(f"id-{privacy_request_id}-")
+    return keys
@@ -1,12 +1,86 @@
 import base64
-from typing import Optional
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
 
+from cryptography.hazmat.primitives.ciphers import AEADEncryptionContext, Cipher
+from cryptography.hazmat.primitives.ciphers.algorithms import AES
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers.modes import GCM
 
 from fidesops.core.config import config
 from fidesops.util.cryptographic_util import bytes_to_b64_str
 
 
+class AesGcmCipherCache:
+    """A bounded, least recently used cache of AESGCM ciphers, so that repeated encryption
+    and decryption with the same key doesn't re-construct and re-validate the cipher each time.
+
+    Ciphers are keyed by a digest of their key, so raw keys are never held as dict keys.
+    Evicted ciphers are dropped from the cache straight away; the cryptography library owns
+    the key material inside a cipher, so it is released once no caller holds the cipher.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.lock = Lock()
+        self.ciphers: "OrderedDict[bytes, AESGCM]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: bytes) -> AESGCM:
+        """Return the cipher for the given key, creating it if it is not cached"""
+        if self.max_size <= 0:
+            return AESGCM(key)
+        digest = hashlib.sha256(key).digest()
+        with self.lock:
+            cipher = self.ciphers.get(digest)
+            if cipher is not None:
+                self.ciphers.move_to_end(digest)
+                self.hits += 1
+                return cipher
+
+        cipher = AESGCM(key)
+        with self.lock:
+            self.misses += 1
+            self.ciphers[digest] = cipher
+            self.ciphers.move_to_end(digest)
+            while len(self.ciphers) > self.max_size:
+                self.ciphers.popitem(last=False)
+                self.evictions += 1
+        return cipher
+
+    def clear(self) -> None:
+        """Evict every cached cipher and reset the counts"""
+        with self.lock:
+            self.ciphers.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of cache hits, misses and evictions"""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_cipher_cache: Optional[AesGcmCipherCache] = None
+
+
+def get_cipher_cache() -> AesGcmCipherCache:
+    """Return the process-wide AESGCM cipher cache"""
+    global _cipher_cache  # pylint: disable=W0603
+    if _cipher_cache is None:
+        _cipher_cache = AesGcmCipherCache(config.security.AES_CIPHER_CACHE_SIZE)
+    return _cipher_cache
+
+
 def encrypt_to_bytes_verify_secrets_length(
     plain_value: Optional[str], key: bytes, nonce: bytes
 ) -> bytes:
@@ -22,7 +96,7 @@ def _encrypt_to_bytes(plain_value: Optional[str], key: bytes, nonce: bytes) -> b
     Returns encrypted value in bytes"""
     if plain_value is None:
         raise ValueError("plain_value cannot be null")
-    gcm = AESGCM(key)
+    gcm = get_cipher_cache().get(key)
     value_bytes = plain_value.encode(config.security.ENCODING)
     encrypted_bytes = gcm.encrypt(nonce, value_bytes, nonce)
     return encrypted_bytes
@@ -44,10 +118,22 @@ def encrypt(plain_value: Optional[str], key: bytes, nonce: bytes) -> str:
     return bytes_to_b64_str(encrypted)
 
 
+def encryptor_verify_secrets_length(key: bytes, nonce: bytes) -> AEADEncryptionContext:
+    """Returns an AES GCM encryption context for encrypting a value in pieces.
+
+    Feeding the value through update(), followed by finalize() and the context's tag, gives
+    the same bytes as encrypting the whole value with encrypt_to_bytes_verify_secrets_length"""
+    verify_nonce(nonce)
+    verify_encryption_key(key)
+    encryptor = Cipher(AES(key), GCM(nonce)).encryptor()
+    encryptor.authenticate_additional_data(nonce)
+    return encryptor
+
+
 def decrypt_combined_nonce_and_message(encrypted_value: str, key: bytes) -> str:
     """Decrypts a message when the nonce has been packaged together with the message"""
     verify_encryption_key(key)
-    gcm = AESGCM(key)
+    gcm = get_cipher_cache().get(key)
 
     encrypted_combined: bytes = base64.b64decode(encrypted_value)
     # Separate the nonce out as the first 12 characters of the combined message
@@ -66,7 +152,7 @@ def decrypt(encrypted_value: str, key: bytes, nonce: bytes) -> str:
     verify_encryption_key(key)
     verify_nonce(nonce)
 
-    gcm = AESGCM(key)
+    gcm = get_cipher_cache().get(key)
     encrypted_bytes = base64.b64decode(encrypted_value)
     decrypted_bytes = gcm.decrypt(nonce, encrypted_bytes, nonce)
     decrypted_str = decrypted_bytes.decode(config.security.ENCODING)
@@ -1,6 +1,6 @@
 import hashlib
 import hmac
-from typing import Callable, Optional
+from typing import Callable, Optional, List
 
 from fidesops.core.config import config
 from fidesops.schemas.masking.masking_configuration import HmacMaskingConfiguration
@@ -24,6 +24,52 @@ def hmac_encrypt_return_str(
     return _hmac_encrypt(value, hmac_key, salt, hashing_algorithm).hexdigest()
 
 
+def hmac_encrypt_batch_return_bytes(
+    values: List[str],
+    hmac_key: str,
+    salt: str,
+    hashing_algorithm: HmacMaskingConfiguration.Algorithm,
+) -> List[bytes]:
+    """HMAC each of the values, keying the HMAC once for the whole batch"""
+    return [
+        h.digest()
+        for h in _hmac_encrypt_batch(values, hmac_key, salt, hashing_algorithm)
+    ]
+
+
+def hmac_encrypt_batch_return_str(
+    values: List[str],
+    hmac_key: str,
+    salt: str,
+    hashing_algorithm: HmacMaskingConfiguration.Algorithm,
+) -> List[str]:
+    """HMAC each of the values, keying the HMAC once for the whole batch"""
+    return [
+        h.hexdigest()
+        for h in _hmac_encrypt_batch(values, hmac_key, salt, hashing_algorithm)
+    ]
+
+
+def _hmac_encrypt_batch(
+    values: List[str],
+    hmac_key: str,
+    salt: str,
+    hashing_algorithm: HmacMaskingConfiguration.Algorithm,
+) -> List[hmac.HMAC]:
+    """Key an HMAC object once, then copy it for each value. This gives the same result as
+    calling _hmac_encrypt for each value."""
+    keyed: hmac.HMAC = hmac.new(
+        key=hmac_key.encode(config.security.ENCODING),
+        digestmod=_HASHING_ALGORITHMS[hashing_algorithm],
+    )
+    results = []
+    for value in values:
+        h = keyed.copy()
+        h.update((value + salt).encode(config.security.ENCODING))
+        results.append(h)
+    return results
+
+
 def _hmac_encrypt(
     value: str,
     hmac_key: str,
@@ -43,6 +89,12 @@ def _hmac_encrypt(
     return algorithm_function(value, hmac_key, salt)
 
 
+_HASHING_ALGORITHMS = {
+    HmacMaskingConfiguration.Algorithm.sha_256: hashlib.sha256,
+    HmacMaskingConfiguration.Algorithm.sha_512: hashlib.sha512,
+}
+
+
 def _hmac_sha256(value: str, hmac_key: str, salt: str) -> hmac.HMAC:
     """Creates a new hmac object using the sh256 hash algorithm and the hmac_key and then returns the hexdigest."""
     return _hmac(value=value, hmac_key=hmac_key, salt=salt, hashing_alg=hashlib.sha256)
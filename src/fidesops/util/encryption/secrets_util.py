@@ -1,17 +1,27 @@
 import logging
 import secrets
-from typing import TypeVar, Optional, List, Dict
+from contextlib import contextmanager
+from threading import Lock
+from typing import TypeVar, Optional, List, Dict, Any, Iterator
 
 from fidesops.schemas.masking.masking_secrets import (
     MaskingSecretMeta,
     MaskingSecretCache,
     SecretType,
 )
-from fidesops.util.cache import get_masking_secret_cache_key, get_cache
+from fidesops.util.cache import (
+    get_masking_secret_cache_key,
+    get_cache,
+    get_cache_index_key,
+)
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# masking secrets loaded by SecretsUtil.prefetched_secrets, keyed on privacy request id
+_prefetched_secrets: Dict[str, Dict[str, Any]] = {}
+_prefetched_secrets_lock = Lock()
+
 
 class SecretsUtil:
     @staticmethod
@@ -41,14 +51,45 @@ class SecretsUtil:
         secret_type: SecretType,
         masking_secret_meta: MaskingSecretMeta[T],
     ) -> T:
-        cache = get_cache()
         masking_secret_cache_key: str = get_masking_secret_cache_key(
             privacy_request_id=privacy_request_id,
             masking_strategy=masking_secret_meta.masking_strategy,
             secret_type=secret_type,
         )
+        prefetched = _prefetched_secrets.get(privacy_request_id, {}).get(
+            masking_secret_cache_key
+        )
+        if prefetched is not None:
+            return prefetched
+        cache = get_cache()
         return cache.get_encoded_by_key(masking_secret_cache_key)
 
+    @staticmethod
+    @contextmanager
+    def prefetched_secrets(privacy_request_id: str) -> Iterator[None]:
+        """Load every masking secret cached for the privacy request in a single round trip, and
+        serve the request's secrets from memory until the context exits.
+
+        Secrets that were not cached against the privacy request's cache index are still
+        looked up individually."""
+        cache = get_cache()
+        keys = cache.get_index_members(
+            get_cache_index_key(privacy_request_id),
+            prefix=f"id-{privacy_request_id}-masking-secret-",
+        )
+        loaded = {
+            key: secret
+            for key, secret in cache.get_encoded_values(keys).items()
+            if secret is not None
+        }
+        with _prefetched_secrets_lock:
+            _prefetched_secrets[privacy_request_id] = loaded
+        try:
+            yield
+        finally:
+            with _prefetched_secrets_lock:
+                _prefetched_secrets.pop(privacy_request_id, None)
+
     @staticmethod
     def generate_secret_string(length: int) -> str:
         return secrets.token_urlsafe(length)
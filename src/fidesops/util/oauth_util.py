@@ -1,6 +1,10 @@
+import hashlib
 import json
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 from starlette.status import HTTP_404_NOT_FOUND
 from pydantic import ValidationError
 
@@ -34,6 +38,152 @@ oauth2_scheme = OAuth2ClientCredentialsBearer(
 )
 
 
+class TokenClaims:
+    """The claims of an access token that verify_oauth_client checks on every call"""
+
+    def __init__(self, client_id: str, scopes: List[str], issued_at: datetime) -> None:
+        self.client_id = client_id
+        self.scopes = scopes
+        self.issued_at = issued_at
+
+
+class OAuthClientCache:
+    """Bounded, least recently used caches of decrypted access token claims, keyed by a
+    digest of the token, and of OAuth client scopes, keyed by client id. Entries expire
+    `ttl_seconds` after they are cached, and counts of hits and misses are kept for each.
+
+    Token claims never change, but a client's scopes can, so a client's entries must be
+    invalidated when it is updated or deleted. Each process has its own cache, so a change
+    made through another process is picked up here once the entries expire.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.lock = Lock()
+        self.tokens: "OrderedDict[bytes, Tuple[float, TokenClaims]]" = OrderedDict()
+        self.clients: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        self.token_hits = 0
+        self.token_misses = 0
+        self.client_hits = 0
+        self.client_misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything is cached at all"""
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get_token_claims(self, authorization: str) -> Optional[TokenClaims]:
+        """Return the cached claims of the given token, if any"""
+        if not self.enabled:
+            return None
+        claims = self._get(self.tokens, _token_digest(authorization))
+        with self.lock:
+            if claims is None:
+                self.token_misses += 1
+            else:
+                self.token_hits += 1
+        return claims
+
+    def set_token_claims(self, authorization: str, claims: TokenClaims) -> None:
+        """Cache the claims of the given token"""
+        if self.enabled:
+            self._set(self.tokens, _token_digest(authorization), claims)
+
+    def get_client_scopes(self, client_id: str) -> Optional[List[str]]:
+        """Return the cached scopes of the given client, if any"""
+        if not self.enabled:
+            return None
+        scopes = self._get(self.clients, client_id)
+        with self.lock:
+            if scopes is None:
+                self.client_misses += 1
+            else:
+                self.client_hits += 1
+        return scopes
+
+    def set_client_scopes(self, client_id: str, scopes: List[str]) -> None:
+        """Cache the scopes of the given client"""
+        if self.enabled:
+            self._set(self.clients, client_id, list(scopes))
+
+    def invalidate_client(self, client_id: str) -> None:
+        """Evict the given client's scopes and the claims of every token issued to it"""
+        with self.lock:
+            self.clients.pop(client_id, None)
+            for digest in [
+                digest
+                for digest, (_, claims) in self.tokens.items()
+                if claims.client_id == client_id
+            ]:
+                del self.tokens[digest]
+
+    def clear(self) -> None:
+        """Evict every cached entry and reset the counts"""
+        with self.lock:
+            self.tokens.clear()
+            self.clients.clear()
+            self.token_hits = 0
+            self.token_misses = 0
+            self.client_hits = 0
+            self.client_misses = 0
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of cache hits and misses for tokens and clients"""
+        with self.lock:
+            return {
+                "token_hits": self.token_hits,
+                "token_misses": self.token_misses,
+                "client_hits": self.client_hits,
+                "client_misses": self.client_misses,
+            }
+
+    def _get(self, entries: "OrderedDict[Any, Tuple[float, Any]]", key: Any) -> Any:
+        with self.lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def _set(
+        self, entries: "OrderedDict[Any, Tuple[float, Any]]", key: Any, value: Any
+    ) -> None:
+        with self.lock:
+            entries[key] = (monotonic() + self.ttl_seconds, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+
+def _token_digest(authorization: str) -> bytes:
+    return hashlib.sha256(authorization.encode(config.security.ENCODING)).digest()
+
+
+_oauth_client_cache: Optional[OAuthClientCache] = None
+
+
+def get_oauth_client_cache() -> OAuthClientCache:
+    """Return the process-wide cache of access token claims and client scopes"""
+    global _oauth_client_cache  # pylint: disable=W0603
+    if _oauth_client_cache is None:
+        _oauth_client_cache = OAuthClientCache(
+            config.security.OAUTH_CLIENT_CACHE_SIZE,
+            config.security.OAUTH_CLIENT_CACHE_TTL_SECONDS,
+        )
+    return _oauth_client_cache
+
+
+def get_oauth_client_cache_counts() -> Dict[str, int]:
+    """Return how many times verify_oauth_client found token claims and client scopes in
+    its cache, and how many times it had to decrypt the token or load the client"""
+    return get_oauth_client_cache().counts()
+
+
 async def verify_oauth_client(
     security_scopes: SecurityScopes,
     authorization: str = Security(oauth2_scheme),
@@ -48,26 +198,28 @@ async def verify_oauth_client(
     if authorization is None:
         raise AuthenticationFailure(detail="Authentication Failure")
 
-    token_data = json.loads(extract_payload(authorization))
-
-    issued_at = token_data.get(JWE_ISSUED_AT, None)
-    if not issued_at:
-        raise AuthorizationError(detail="Not Authorized for this action")
+    cache = get_oauth_client_cache()
+    claims = cache.get_token_claims(authorization)
+    if claims is None:
+        claims = get_token_claims(authorization)
+        cache.set_token_claims(authorization, claims)
 
-    if is_token_expired(datetime.fromisoformat(issued_at)):
+    if is_token_expired(claims.issued_at):
         raise AuthorizationError(detail="Not Authorized for this action")
 
-    assigned_scopes = token_data[JWE_PAYLOAD_SCOPES]
+    assigned_scopes = claims.scopes
     if not set(security_scopes.scopes).issubset(assigned_scopes):
         raise AuthorizationError(detail="Not Authorized for this action")
 
-    client_id = token_data.get(JWE_PAYLOAD_CLIENT_ID)
-    if not client_id:
-        raise AuthorizationError(detail="Not Authorized for this action")
-
-    client = ClientDetail.get(db, id=client_id)
-    if not client:
-        raise AuthorizationError(detail="Not Authorized for this action")
+    client_scopes = cache.get_client_scopes(claims.client_id)
+    if client_scopes is None:
+        client = ClientDetail.get(db, id=claims.client_id)
+        if not client:
+            raise AuthorizationError(detail="Not Authorized for this action")
+        cache.set_client_scopes(client.id, client.scopes)
+    else:
+        # The client is only used for its id and scopes, so there is no need to load it
+        client = ClientDetail(id=claims.client_id, scopes=client_scopes)
 
     if not set(assigned_scopes).issubset(set(client.scopes)):
         # If the scopes on the token are not a subset of the scopes available
@@ -76,6 +228,26 @@ async def verify_oauth_client(
     return client
 
 
+def get_token_claims(authorization: str) -> TokenClaims:
+    """Decrypts the access token and returns its claims. Raises an AuthorizationError if
+    the token is missing the time it was issued or the client it was issued to"""
+    token_data = json.loads(extract_payload(authorization))
+
+    issued_at = token_data.get(JWE_ISSUED_AT, None)
+    if not issued_at:
+        raise AuthorizationError(detail="Not Authorized for this action")
+
+    client_id = token_data.get(JWE_PAYLOAD_CLIENT_ID)
+    if not client_id:
+        raise AuthorizationError(detail="Not Authorized for this action")
+
+    return TokenClaims(
+        client_id=client_id,
+        scopes=token_data[JWE_PAYLOAD_SCOPES],
+        issued_at=datetime.fromisoformat(issued_at),
+    )
+
+
 def is_token_expired(issued_at: Optional[datetime]) -> bool:
     """Returns True if the datetime is earlier than OAUTH_ACCESS_TOKEN_EXPIRE_MINUTES ago"""
     if not issued_at:
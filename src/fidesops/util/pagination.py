@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi_pagination import Params
+from sqlalchemy import Column, tuple_
+from sqlalchemy.orm import Query
+
+from fidesops.schemas.api import CursorPage
+
+
+def encode_cursor(item: Any, order_by: Sequence[Column]) -> str:
+    """Returns an opaque cursor pointing just after the given item in a query ordered by `order_by`"""
+    values = [getattr(item, column.key) for column in order_by]
+    data = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    )
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: Sequence[Column]) -> List[Any]:
+    """Returns the values of the `order_by` columns that a cursor points after.
+    Raises a ValueError if the cursor is not valid for these columns."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Invalid cursor '{cursor}'") from exc
+    if not isinstance(values, list) or len(values) != len(order_by):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    decoded = []
+    for value, column in zip(values, order_by):
+        if not isinstance(value, str):
+            raise ValueError(f"Invalid cursor '{cursor}'")
+        decoded.append(
+            datetime.fromisoformat(value)
+            if column.type.python_type is datetime
+            else value
+        )
+    return decoded
+
+
+def paginate_by_cursor(
+    query: Query,
+    params: Params,
+    order_by: Sequence[Column],
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    descending: bool = False,
+) -> CursorPage:
+    """
+    Returns a page of the query ordered by `order_by`, which must uniquely order the results,
+    in descending order if `descending` is set.
+
+    Given a cursor, the page starts just after the item the cursor points to and `params.page`
+    is ignored, so the database seeks straight to the page using an index on the `order_by`
+    columns instead of reading and discarding every earlier row. The page has no page number,
+    and the total number of results is only counted if `include_total` is set. Without a
+    cursor, the page is found by `params.page` and counted as usual.
+    """
+    total = query.count() if include_total or not cursor else None
+    query = query.order_by(
+        *[column.desc() if descending else column for column in order_by]
+    )
+    if cursor:
+        position = tuple_(*decode_cursor(cursor, order_by))
+        query = query.filter(
+            tuple_(*order_by) < position if descending else tuple_(*order_by) > position
+        )
+    else:
+        query = query.offset(params.size * (params.page - 1))
+    # Fetch one more than the page size to find out whether there is a next page
+    rows = query.limit(params.size + 1).all()
+    items = rows[: params.size]
+    next_cursor = encode_cursor(items[-1], order_by) if len(rows) > params.size else None
+    return CursorPage(
+        items=items,
+        total=total,
+        page=None if cursor else params.page,
+        size=params.size,
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,38 @@
+"""add privacy request paging indexes
+
+Revision ID: 3c5e1f2b8a96
+Revises: 7e8b3c1a9d42
+Create Date: 2022-01-13 10:41:52.916034
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3c5e1f2b8a96"
+down_revision = "7e8b3c1a9d42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_privacyrequest_created_at_id",
+        "privacyrequest",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_privacyrequest_status_finished_processing_at",
+        "privacyrequest",
+        ["status", "finished_processing_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_privacyrequest_status_finished_processing_at", table_name="privacyrequest"
+    )
+    op.drop_index("ix_privacyrequest_created_at_id", table_name="privacyrequest")
@@ -0,0 +1,72 @@
+"""add privacy request job queue
+
+Revision ID: 7e8b3c1a9d42
+Revises: f3841942d90c
+Create Date: 2022-01-11 16:02:37.410518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7e8b3c1a9d42"
+down_revision = "f3841942d90c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "privacyrequestjob",
+        sa.Column("id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("privacy_request_id", sa.String(), nullable=False),
+        sa.Column("from_webhook_id", sa.String(), nullable=True),
+        sa.Column("leased_by", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["privacy_request_id"],
+            ["privacyrequest.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_privacyrequestjob_id"), "privacyrequestjob", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_privacyrequestjob_lease_expires_at"),
+        "privacyrequestjob",
+        ["lease_expires_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_privacyrequestjob_privacy_request_id"),
+        "privacyrequestjob",
+        ["privacy_request_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_privacyrequestjob_privacy_request_id"), table_name="privacyrequestjob"
+    )
+    op.drop_index(
+        op.f("ix_privacyrequestjob_lease_expires_at"), table_name="privacyrequestjob"
+    )
+    op.drop_index(op.f("ix_privacyrequestjob_id"), table_name="privacyrequestjob")
+    op.drop_table("privacyrequestjob")
@@ -34,9 +34,12 @@ class TestGetConnections:
                 security_keys.difference(
                     set(
                         [
+                            "AES_CIPHER_CACHE_SIZE",
                             "CORS_ORIGINS",
                             "ENCODING",
                             "OAUTH_ACCESS_TOKEN_EXPIRE_MINUTES",
+                            "OAUTH_CLIENT_CACHE_SIZE",
+                            "OAUTH_CLIENT_CACHE_TTL_SECONDS",
                         ]
                     )
                 )
@@ -2,7 +2,12 @@ import json
 
 from starlette.testclient import TestClient
 
-from fidesops.api.v1.urn_registry import MASKING, MASKING_STRATEGY, V1_URL_PREFIX
+from fidesops.api.v1.urn_registry import (
+    MASKING,
+    MASKING_BATCH,
+    MASKING_STRATEGY,
+    V1_URL_PREFIX,
+)
 from fidesops.schemas.masking.masking_configuration import (
     AesEncryptionMaskingConfiguration,
 )
@@ -150,3 +155,29 @@ class TestMaskValues:
         json_response = json.loads(response.text)
         assert value == json_response["plain"]
         assert json_response["masked_value"] is None
+
+    def test_mask_values_batch(self, api_client: TestClient):
+        values = ["my@email.com", "other@email.com", "my@email.com"]
+        masking_strategy = {"strategy": HMAC, "configuration": {}}
+        response = api_client.put(
+            f"{V1_URL_PREFIX}{MASKING_BATCH}",
+            json={"masking_strategy": masking_strategy, "values": values},
+        )
+        assert 200 == response.status_code
+        json_response = json.loads(response.text)
+        assert [r["plain"] for r in json_response] == values
+        masked = [r["masked_value"] for r in json_response]
+        assert masked[0] not in values
+        # secrets are generated once for the whole batch
+        assert masked[0] == masked[2]
+        assert masked[0] != masked[1]
+
+    def test_mask_values_batch_no_such_strategy(self, api_client: TestClient):
+        response = api_client.put(
+            f"{V1_URL_PREFIX}{MASKING_BATCH}",
+            json={
+                "masking_strategy": {"strategy": "No Such Strategy", "configuration": {}},
+                "values": ["check"],
+            },
+        )
+        assert 404 == response.status_code
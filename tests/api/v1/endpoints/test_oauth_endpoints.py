@@ -27,7 +27,11 @@ from fidesops.schemas.jwt import (
     JWE_PAYLOAD_SCOPES,
     JWE_ISSUED_AT,
 )
-from fidesops.util.oauth_util import extract_payload, generate_jwe
+from fidesops.util.oauth_util import (
+    extract_payload,
+    generate_jwe,
+    get_oauth_client_cache_counts,
+)
 
 
 class TestCreateClient:
@@ -184,6 +188,26 @@ class TestGetClientScopes:
         assert 200 == response.status_code
         assert response_body == SCOPE_REGISTRY
 
+    def test_get_scopes_caches_token_and_client(
+        self,
+        api_client: TestClient,
+        oauth_client: ClientDetail,
+        url,
+        generate_auth_header,
+    ) -> None:
+        auth_header = generate_auth_header([CLIENT_READ])
+        counts = get_oauth_client_cache_counts()
+
+        for _ in range(3):
+            response = api_client.get(url, headers=auth_header)
+            assert 200 == response.status_code
+
+        new_counts = get_oauth_client_cache_counts()
+        assert new_counts["token_misses"] - counts["token_misses"] == 1
+        assert new_counts["token_hits"] - counts["token_hits"] == 2
+        assert new_counts["client_misses"] - counts["client_misses"] == 1
+        assert new_counts["client_hits"] - counts["client_hits"] == 2
+
 
 class TestSetClientScopes:
     @pytest.fixture(scope="function")
@@ -252,6 +276,11 @@ class TestSetClientScopes:
         db.refresh(oauth_client)
         assert oauth_client.scopes == ["storage:read"]
 
+        # The client's cached scopes are invalidated, so its token no longer grants
+        # scopes it has lost
+        response = api_client.put(url, headers=auth_header, json=["storage:read"])
+        assert 403 == response.status_code
+
 
 class TestReadScopes:
     @pytest.fixture(scope="function")
@@ -344,6 +373,9 @@ class TestDeleteClient:
         client = ClientDetail.get(db, id=oauth_client.id)
         assert client is None
 
+        response = api_client.delete(url, headers=auth_header)
+        assert 403 == response.status_code
+
 
 class TestAcquireAccessToken:
     @pytest.fixture(scope="function")
@@ -1,10 +1,12 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict
 from unittest import mock
 
 from fastapi_pagination import Params
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event
 from starlette.testclient import TestClient
 
 from fidesops.api.v1.endpoints.privacy_request_endpoints import (
@@ -22,6 +24,7 @@ from fidesops.api.v1.scope_registry import (
     PRIVACY_REQUEST_READ,
     PRIVACY_REQUEST_CALLBACK_RESUME,
 )
+from fidesops.db.session import ENGINE
 from fidesops.models.client import ClientDetail
 from fidesops.models.privacy_request import (
     PrivacyRequest,
@@ -33,6 +36,7 @@ from fidesops.models.policy import ActionType
 from fidesops.schemas.dataset import DryRunDatasetResponse
 from fidesops.schemas.masking.masking_secrets import SecretType
 from fidesops.util.cache import (
+    FidesopsRedis,
     get_identity_cache_key,
     get_encryption_cache_key,
     get_masking_secret_cache_key,
@@ -329,6 +333,108 @@ class TestCreatePrivacyRequest:
         response_data = resp.json()["failed"]
         assert len(response_data) == 1
 
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.submit"
+    )
+    def test_create_privacy_requests_in_bulk(
+        self,
+        run_privacy_request_mock,
+        url,
+        db,
+        api_client: TestClient,
+        generate_auth_header,
+        policy,
+        erasure_policy_aes,
+        cache,
+    ):
+        data = [
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": erasure_policy_aes.key,
+                "identity": {"email": "first@example.com"},
+            },
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": "bad_policy_key",
+                "identity": {"email": "second@example.com"},
+            },
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": policy.key,
+                "identity": {},
+            },
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": erasure_policy_aes.key,
+                "identity": {"email": "third@example.com"},
+                "external_id": "ext-third",
+            },
+        ]
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_CREATE])
+        resp = api_client.post(url, json=data, headers=auth_header)
+        assert resp.status_code == 200
+
+        failed = resp.json()["failed"]
+        assert [failure["message"] for failure in failed] == [
+            "Policy with key bad_policy_key does not exist",
+            "You must provide at least one identity to process",
+        ]
+        succeeded = resp.json()["succeeded"]
+        assert [item["external_id"] for item in succeeded] == [None, "ext-third"]
+        assert run_privacy_request_mock.call_count == 2
+
+        secret_keys = []
+        for item, email in zip(succeeded, ["first@example.com", "third@example.com"]):
+            pr = PrivacyRequest.get(db=db, id=item["id"])
+            assert pr.policy_id == erasure_policy_aes.id
+            assert cache.get(get_identity_cache_key(pr.id, "email")) == email
+            secret_key = get_masking_secret_cache_key(
+                privacy_request_id=pr.id,
+                masking_strategy="aes_encrypt",
+                secret_type=SecretType.key,
+            )
+            secret_keys.append(cache.get_encoded_by_key(secret_key))
+            pr.delete(db=db)
+        # Each request gets its own masking secrets
+        assert None not in secret_keys
+        assert secret_keys[0] != secret_keys[1]
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.submit"
+    )
+    def test_create_privacy_requests_cache_unavailable(
+        self,
+        run_privacy_request_mock,
+        url,
+        db,
+        api_client: TestClient,
+        generate_auth_header,
+        policy,
+    ):
+        data = [
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": policy.key,
+                "identity": {"email": "test@example.com"},
+                "external_id": "ext-cache-unavailable",
+            }
+        ]
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_CREATE])
+        with mock.patch.object(
+            FidesopsRedis,
+            "set_all_with_autoexpire",
+            side_effect=RedisConnectionError("Connection refused"),
+        ):
+            resp = api_client.post(url, json=data, headers=auth_header)
+        assert resp.status_code == 424
+        assert not run_privacy_request_mock.called
+
+        pr = PrivacyRequest.get_by(
+            db=db, field="external_id", value="ext-cache-unavailable"
+        )
+        assert pr.status == PrivacyRequestStatus.error
+        pr.delete(db=db)
+
 
 class TestGetPrivacyRequests:
     @pytest.fixture(scope="function")
@@ -387,6 +493,7 @@ class TestGetPrivacyRequests:
             "total": 1,
             "page": 1,
             "size": page_size,
+            "next_cursor": None,
         }
 
         resp = response.json()
@@ -462,9 +569,9 @@ class TestGetPrivacyRequests:
         assert 200 == response.status_code
         resp = response.json()
         assert len(resp["items"]) == 3
-        assert resp["items"][0]["id"] == privacy_request.id
+        assert resp["items"][0]["id"] == failed_privacy_request.id
         assert resp["items"][1]["id"] == succeeded_privacy_request.id
-        assert resp["items"][2]["id"] == failed_privacy_request.id
+        assert resp["items"][2]["id"] == privacy_request.id
 
     def test_filter_privacy_requests_by_started(
         self,
@@ -480,8 +587,8 @@ class TestGetPrivacyRequests:
         assert 200 == response.status_code
         resp = response.json()
         assert len(resp["items"]) == 2
-        assert resp["items"][0]["id"] == privacy_request.id
-        assert resp["items"][1]["id"] == failed_privacy_request.id
+        assert resp["items"][0]["id"] == failed_privacy_request.id
+        assert resp["items"][1]["id"] == privacy_request.id
 
         response = api_client.get(url + f"?started_gt=2021-05-01", headers=auth_header)
         assert 200 == response.status_code
@@ -535,6 +642,91 @@ class TestGetPrivacyRequests:
         assert len(resp["items"]) == 1
         assert resp["items"][0]["id"] == failed_privacy_request.id
 
+    def test_get_privacy_requests_by_cursor(
+        self,
+        api_client: TestClient,
+        generate_auth_header,
+        privacy_request,
+        succeeded_privacy_request,
+        failed_privacy_request,
+        url,
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(url + "?size=2", headers=auth_header)
+        assert 200 == response.status_code
+        resp = response.json()
+        assert [item["id"] for item in resp["items"]] == [
+            failed_privacy_request.id,
+            succeeded_privacy_request.id,
+        ]
+        assert resp["total"] == 3
+        assert resp["next_cursor"] is not None
+
+        assert resp["page"] == 1
+        next_cursor = resp["next_cursor"]
+
+        response = api_client.get(
+            url + f"?size=2&cursor={next_cursor}", headers=auth_header
+        )
+        assert 200 == response.status_code
+        resp = response.json()
+        assert [item["id"] for item in resp["items"]] == [privacy_request.id]
+        # pages fetched by cursor have no page number, and aren't counted unless asked
+        assert resp["total"] is None
+        assert resp["page"] is None
+        assert resp["next_cursor"] is None
+
+        response = api_client.get(
+            url + f"?size=2&cursor={next_cursor}&include_total=True",
+            headers=auth_header,
+        )
+        assert response.json()["total"] == 3
+
+        # pages fetched by page number are always counted
+        response = api_client.get(
+            url + "?size=2&page=2&include_total=False", headers=auth_header
+        )
+        resp = response.json()
+        assert [item["id"] for item in resp["items"]] == [privacy_request.id]
+        assert resp["total"] == 3
+        assert resp["page"] == 2
+
+    def test_get_privacy_requests_newest_first(
+        self,
+        db,
+        api_client: TestClient,
+        generate_auth_header,
+        privacy_request,
+        succeeded_privacy_request,
+        failed_privacy_request,
+        url,
+    ):
+        # the oldest request is also the one with the greatest id
+        ordered = sorted(
+            [privacy_request, succeeded_privacy_request, failed_privacy_request],
+            key=lambda request: request.id,
+        )
+        for days_ago, request in enumerate(ordered):
+            request.created_at = datetime.utcnow() - timedelta(days=days_ago)
+            request.save(db)
+
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(url, headers=auth_header)
+        assert 200 == response.status_code
+        resp = response.json()
+        assert [item["id"] for item in resp["items"]] == [
+            request.id for request in ordered
+        ]
+        assert resp["total"] == 3
+        assert resp["page"] == 1
+
+    def test_get_privacy_requests_invalid_cursor(
+        self, api_client: TestClient, generate_auth_header, url
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(url + "?cursor=not-a-cursor", headers=auth_header)
+        assert 400 == response.status_code
+
     def test_verbose_privacy_requests(
         self,
         api_client: TestClient,
@@ -638,6 +830,7 @@ class TestGetPrivacyRequests:
             "total": 1,
             "page": 1,
             "size": page_size,
+            "next_cursor": None,
         }
         assert resp == expected_resp
 
@@ -674,6 +867,66 @@ class TestGetPrivacyRequests:
             ExecutionLog.privacy_request_id == privacy_request.id
         ).delete()
 
+    def test_verbose_privacy_requests_load_logs_in_one_query(
+        self,
+        db,
+        api_client: TestClient,
+        generate_auth_header,
+        privacy_request: PrivacyRequest,
+        succeeded_privacy_request: PrivacyRequest,
+        failed_privacy_request: PrivacyRequest,
+        url,
+    ):
+        for request in [privacy_request, succeeded_privacy_request]:
+            for dataset_name in ["my-postgres-db", "my-mongo-db"]:
+                for i in range(0, EMBEDDED_EXECUTION_LOG_LIMIT + 2):
+                    ExecutionLog.create(
+                        db=db,
+                        data={
+                            "dataset_name": dataset_name,
+                            "collection_name": f"test_collection_{i}",
+                            "fields_affected": [],
+                            "action_type": ActionType.access,
+                            "status": ExecutionLogStatus.pending,
+                            "privacy_request_id": request.id,
+                        },
+                    )
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        event.listen(ENGINE, "before_cursor_execute", record_statement)
+        try:
+            response = api_client.get(url + f"?verbose=True", headers=auth_header)
+        finally:
+            event.remove(ENGINE, "before_cursor_execute", record_statement)
+        assert 200 == response.status_code
+        assert len([s for s in statements if "FROM executionlog" in s]) == 1
+
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [
+            failed_privacy_request.id,
+            succeeded_privacy_request.id,
+            privacy_request.id,
+        ]
+        assert items[0]["results"] == {}
+        for item in items[1:]:
+            assert list(item["results"]) == ["my-mongo-db", "my-postgres-db"]
+            for logs in item["results"].values():
+                assert [log["collection_name"] for log in logs] == [
+                    f"test_collection_{i}" for i in range(EMBEDDED_EXECUTION_LOG_LIMIT)
+                ]
+
+        db.query(ExecutionLog).filter(
+            ExecutionLog.privacy_request_id.in_(
+                [privacy_request.id, succeeded_privacy_request.id]
+            )
+        ).delete(synchronize_session=False)
+        db.commit()
+
 
 class TestGetExecutionLogs:
     @pytest.fixture(scope="function")
@@ -1,5 +1,5 @@
 import random
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
 from sqlalchemy.engine import Engine
@@ -53,6 +53,11 @@ class MockSqlConnector(SQLConnector):
     ) -> List[Row]:
         return [generate_collection(node.node.collection) for _ in range(3)]
 
+    def retrieve_data_batches(
+        self, node: TraversalNode, policy: Policy, input_data: Dict[str, List[Any]]
+    ) -> Iterator[List[Row]]:
+        yield self.retrieve_data(node, policy, input_data)
+
 
 class MockSqlTask(GraphTask):
     def connector(self) -> BaseConnector:
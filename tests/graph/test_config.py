@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from fidesops.graph.config import *
@@ -216,6 +218,59 @@ class TestCollection:
             ],  # Applies to a nested field
         }
 
+    def test_freeze(self):
+        ds = Collection(
+            name="t3",
+            fields=[
+                ScalarField(name="f1", primary_key=True),
+                ObjectField(
+                    name="f2",
+                    fields={"f3": ScalarField(name="f3", identity="email")},
+                ),
+            ],
+        )
+        # indexes follow changes to the fields until the collection is frozen
+        ds.fields[0].identity = "ssn"
+        assert ds.identities() == {FieldPath("f1"): "ssn", FieldPath("f2", "f3"): "email"}
+
+        ds.freeze()
+        field_dict = ds.field_dict
+        assert ds.field_dict is field_dict
+        assert ds.primary_key_field_paths == {FieldPath("f1"): ds.fields[0]}
+        assert ds.field(FieldPath("f2", "f3")) is field_dict[FieldPath("f2", "f3")]
+        assert ds.field(FieldPath("f4")) is None
+
+        ds.fields.append(ScalarField(name="f4"))
+        assert ds.field(FieldPath("f4")) is None
+
+    def test_frozen_field_lookups_do_not_depend_on_field_count(self):
+        """A field lookup on a frozen collection visits no fields and compares one FieldPath,
+        however many fields the collection has. Unfrozen, every lookup visits every field."""
+
+        def lookup_work(num_fields: int, frozen: bool) -> Tuple[int, int]:
+            collection = Collection(
+                name="wide",
+                fields=[ScalarField(name=f"f{i}") for i in range(num_fields)],
+            )
+            if frozen:
+                collection.freeze()
+            with mock.patch.object(
+                ScalarField,
+                "collect_matching",
+                autospec=True,
+                side_effect=ScalarField.collect_matching,
+            ) as visits, mock.patch.object(
+                FieldPath, "__eq__", autospec=True, side_effect=FieldPath.__eq__
+            ) as comparisons:
+                for i in range(10):
+                    assert collection.field(FieldPath(f"f{i}")).name == f"f{i}"
+            return visits.call_count, comparisons.call_count
+
+        assert lookup_work(10, frozen=True) == (0, 10)
+        assert lookup_work(200, frozen=True) == (0, 10)
+        assert lookup_work(10, frozen=False)[0] == 10 * 10
+        assert lookup_work(200, frozen=False)[0] == 10 * 200
+
 
 class TestField:
     def test_generate_field(self) -> None:
@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from fidesops.graph.config import CollectionAddress, FieldAddress
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph import graph_cache
+from fidesops.graph.graph_cache import DatasetGraphCache, get_dataset_graph_cache
+from fidesops.models.datasetconfig import DatasetConfig
+from .graph_test_util import generate_graph_resources, field
+
+
+def test_graph_is_rebuilt_when_datasets_change(
+    db: Session, dataset_config: DatasetConfig
+) -> None:
+    cache = DatasetGraphCache()
+    graph = cache.get_graph(db)
+    assert CollectionAddress(dataset_config.fides_key, "subscriptions") in graph.nodes
+    assert cache.get_graph(db) is graph
+
+    dataset = dict(dataset_config.dataset)
+    dataset["name"] = "Renamed dataset"
+    dataset_config.update(db=db, data={"dataset": dataset})
+    updated = cache.get_graph(db)
+    assert updated is not graph
+    assert cache.get_graph(db) is updated
+
+    cache.invalidate()
+    assert cache.get_graph(db) is not updated
+
+
+def test_traversals_are_shared_by_identity_keys() -> None:
+    cache = DatasetGraphCache()
+    t = generate_graph_resources(2)
+    field(t, ("dr_1", "ds_1", "f1")).identity = "email"
+    field(t, ("dr_1", "ds_1", "f1")).references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), "to")
+    )
+    graph = DatasetGraph(*t)
+    cache.graph = graph
+
+    traversal = cache.get_traversal(graph, ["email"])
+    assert cache.get_traversal(graph, {"email"}) is traversal
+    # identity values are never held by the cache
+    assert traversal.seed_data == {"email": None}
+
+    # traversing again does not add to the traversal nodes
+    def edge_count() -> int:
+        return sum(
+            len(tuples)
+            for tn in traversal.traversal_node_dict.values()
+            for tuples in [*tn.children.values(), *tn.parents.values()]
+        )
+
+    count = edge_count()
+    assert count
+    traversal.traverse({}, lambda tn, data: None)
+    assert edge_count() == count
+
+    # traversals of other graphs are not cached
+    other_graph = DatasetGraph(*t)
+    assert cache.get_traversal(other_graph, ["email"]) is not cache.get_traversal(
+        other_graph, ["email"]
+    )
+
+
+def test_dataset_graph_cache_is_created_once(monkeypatch) -> None:
+    monkeypatch.setattr(graph_cache, "_graph_cache", None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        caches = list(executor.map(lambda _: get_dataset_graph_cache(), range(32)))
+    assert all(cache is caches[0] for cache in caches)
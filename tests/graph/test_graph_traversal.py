@@ -1,3 +1,6 @@
+from collections import Counter
+from unittest import mock
+
 import pytest
 from fidesops.graph.graph import *
 from .graph_test_util import *
@@ -64,6 +67,41 @@ def test_extract_seed_nodes() -> None:
     assert traversal.root_node.children.keys() == {CollectionAddress("dr_1", "ds_1")}
 
 
+def test_traversal_plan_is_replayed() -> None:
+    t = generate_graph_resources(3)
+    field(t, ("dr_1", "ds_1", "f1")).references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), "to")
+    )
+    field(t, ("dr_1", "ds_1", "f1")).references.append(
+        (FieldAddress("dr_3", "ds_3", "f1"), "to")
+    )
+    field(t, ("dr_1", "ds_1", "f1")).identity = "x"
+    traversal = Traversal(DatasetGraph(*t), {"x": 1})
+    plan = traversal.plan
+
+    assert plan.node_order[:2] == (
+        ROOT_COLLECTION_ADDRESS,
+        CollectionAddress("dr_1", "ds_1"),
+    )
+    assert set(plan.end_nodes) == {
+        CollectionAddress("dr_2", "ds_2"),
+        CollectionAddress("dr_3", "ds_3"),
+    }
+    assert set(traversal.traversal_node_dict[plan.node_order[1]].children) == {
+        CollectionAddress("dr_2", "ds_2"),
+        CollectionAddress("dr_3", "ds_3"),
+    }
+    with pytest.raises(AttributeError):
+        plan.end_nodes = ()
+
+    for _ in range(2):
+        visited = []
+        end_nodes = traversal.traverse({}, lambda tn, env: visited.append(tn.address))
+        assert tuple(visited) == plan.node_order
+        assert tuple(end_nodes) == plan.end_nodes
+    assert traversal.plan is plan
+
+
 #  -------------------------------------------
 #   graph traversal errors
 #  -------------------------------------------
@@ -672,3 +710,96 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def large_graph(num_nodes: int) -> DatasetGraph:
+    """A tree of `num_nodes` nodes, with a further one-way edge from each node to the
+    node 10 below it"""
+    t = generate_graph_resources(num_nodes)
+    field(t, ("dr_1", "ds_1", "f1")).identity = "email"
+    for i in range(2, num_nodes + 1):
+        field(t, (f"dr_{i // 2}", f"ds_{i // 2}", "f1")).references.append(
+            (FieldAddress(f"dr_{i}", f"ds_{i}", "f1"), None)
+        )
+        if i > 10:
+            field(t, (f"dr_{i - 10}", f"ds_{i - 10}", "f2")).references.append(
+                (FieldAddress(f"dr_{i}", f"ds_{i}", "f3"), "to")
+            )
+    return DatasetGraph(*t)
+
+
+def test_traversal_plan_on_large_graph() -> None:
+    """Plans a traversal of a 1000 node graph. Children run after their parents."""
+    num_nodes = 1000
+    graph = large_graph(num_nodes)
+    traversal = Traversal(graph, {"email": "X"})
+    plan = traversal.plan
+
+    assert plan.node_order[0] == ROOT_COLLECTION_ADDRESS
+    assert set(plan.node_order) == set(graph.nodes) | {ROOT_COLLECTION_ADDRESS}
+
+    def address(i: int) -> CollectionAddress:
+        return CollectionAddress(f"dr_{i}", f"ds_{i}")
+
+    def children(i: int) -> Set[CollectionAddress]:
+        return set(traversal.traversal_node_dict[address(i)].children)
+
+    first_run: Dict[CollectionAddress, int] = {}
+    for i, a in enumerate(plan.node_order):
+        first_run.setdefault(a, i)
+    last_run = {a: i for i, a in enumerate(plan.node_order)}
+    for i in range(2, num_nodes + 1):
+        # tree edges are followed from whichever node runs first
+        if address(i) in children(i // 2):
+            assert first_run[address(i // 2)] < last_run[address(i)]
+        else:
+            assert address(i // 2) in children(i)
+            assert first_run[address(i)] < last_run[address(i // 2)]
+        if i > 10:
+            assert address(i) in children(i - 10)
+            assert first_run[address(i - 10)] < last_run[address(i)]
+
+    # A node runs again only when it is reached over a one-way edge from a node that
+    # first ran after it, since that edge could not be followed when the node first ran.
+    # Each such edge makes its node run once more.
+    late_one_way_edges = Counter(
+        edge.f2.collection_address()
+        for edge in traversal.edges
+        if not isinstance(edge, BidirectionalEdge)
+        and first_run[edge.f2.collection_address()]
+        < first_run[edge.f1.collection_address()]
+    )
+    runs = Counter(plan.node_order)
+    assert sum(runs.values()) > len(runs)
+    for a, run_ct in runs.items():
+        assert run_ct == 1 + late_one_way_edges[a]
+
+    # every node without children ends the traversal
+    assert {
+        a for a, tn in traversal.traversal_node_dict.items() if not tn.children
+    } <= set(plan.end_nodes)
+
+
+def test_traversal_planning_visits_each_edge_a_bounded_number_of_times() -> None:
+    """Planning takes time linear in the size of the graph: over a 5000 node graph, each
+    edge is looked at no more than 4 times. Checking the remaining edges of every node
+    each step, as a scan of the whole edge set does, would look at each edge thousands of
+    times."""
+    graph = large_graph(5000)
+    visits = []
+    for edge_cls in (Edge, BidirectionalEdge):
+        for method in ("spans", "split_by_address"):
+            patcher = mock.patch.object(
+                edge_cls,
+                method,
+                autospec=True,
+                side_effect=getattr(edge_cls, method),
+            )
+            visits.append(patcher.start())
+    try:
+        traversal = Traversal(graph, {"email": "X"})
+    finally:
+        mock.patch.stopall()
+
+    assert len(traversal.plan.node_order) > 5000
+    assert sum(m.call_count for m in visits) <= 4 * len(traversal.edges)
@@ -4,7 +4,6 @@ from datetime import datetime
 from unittest import mock
 from unittest.mock import Mock
 
-import dask
 import pytest
 from bson import ObjectId
 
@@ -33,7 +32,6 @@ from ..task.traversal_data import (
     combined_mongo_posgresql_graph,
 )
 
-dask.config.set(scheduler="processes")
 policy = Policy()
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import logging
 import random
@@ -5,7 +6,6 @@ from datetime import datetime
 from unittest import mock
 from unittest.mock import Mock
 
-import dask
 import pytest
 
 from fidesops.core.config import config
@@ -30,7 +30,6 @@ from ..graph.graph_test_util import (
 )
 from ..task.traversal_data import integration_db_graph, integration_db_dataset
 
-dask.config.set(scheduler="processes")
 logger = logging.getLogger(__name__)
 sample_postgres_configuration_policy = erasure_policy(
     "system.operations",
@@ -752,6 +751,43 @@ class TestRetrievingData:
             }
         ]
 
+    @pytest.mark.integration
+    @mock.patch("fidesops.graph.traversal.TraversalNode.incoming_edges")
+    def test_retrieving_data_async(
+        self,
+        mock_incoming_edges: Mock,
+        db,
+        connector,
+        traversal_node,
+    ):
+        mock_incoming_edges.return_value = {
+            Edge(
+                FieldAddress("fake_dataset", "fake_collection", "email"),
+                FieldAddress("postgres_example_test_dataset", "customer", "email"),
+            )
+        }
+        input_data = {"email": ["customer-1@example.com", "customer-2@example.com"]}
+
+        async def retrieve_concurrently():
+            return await asyncio.gather(
+                *[
+                    connector.retrieve_data_async(traversal_node, Policy(), input_data)
+                    for _ in range(3)
+                ]
+            )
+
+        assert connector.supports_async_retrieval()
+        expected = connector.retrieve_data(traversal_node, Policy(), input_data)
+        assert len(expected) == 2
+        for results in asyncio.run(retrieve_concurrently()):
+            assert sorted(results, key=lambda row: row["id"]) == sorted(
+                expected, key=lambda row: row["id"]
+            )
+        # the connections are kept to be reused
+        assert len(connector.async_pool.idle) == 3
+        connector.close()
+        assert connector.async_pool.idle == []
+
     @pytest.mark.integration
     @mock.patch("fidesops.graph.traversal.TraversalNode.incoming_edges")
     def test_retrieving_data_no_input(
@@ -808,7 +844,9 @@ class TestRetrievingData:
 
 class TestRetryIntegration:
     @pytest.mark.integration
-    @mock.patch("fidesops.service.connectors.sql_connector.SQLConnector.retrieve_data")
+    @mock.patch(
+        "fidesops.service.connectors.sql_connector.PostgreSQLConnector.retrieve_data_async"
+    )
     def test_retry_access_request(
         self,
         mock_retrieve,
@@ -5,6 +5,7 @@ from pydantic import ValidationError
 from typing import List
 from uuid import uuid4
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from fidesops.common_exceptions import ClientUnsuccessfulException, PrivacyRequestPaused
@@ -135,6 +136,37 @@ def test_delete_privacy_request_removes_cached_data(
     assert cache.get(key) is None
 
 
+
+def test_privacy_request_cache_without_index(
+    cache: FidesopsRedis,
+    db: Session,
+    privacy_request: PrivacyRequest,
+) -> None:
+    """Keys cached before the privacy request's cache index existed are still found"""
+    key = get_identity_cache_key(
+        privacy_request_id=privacy_request.id, identity_attribute="email"
+    )
+    cache.set_with_autoexpire(key, "test@example.com")
+    assert privacy_request.get_cached_identity_data() == {"email": "test@example.com"}
+
+    privacy_request.delete(db)
+    assert cache.get(key) is None
+
+
+def test_get_cached_identity_data_skips_expired_keys(
+    cache: FidesopsRedis,
+    privacy_request: PrivacyRequest,
+) -> None:
+    privacy_request.cache_identity(
+        PrivacyRequestIdentity(email="test@example.com", phone_number="+1 234 567")
+    )
+    cache.delete(
+        get_identity_cache_key(
+            privacy_request_id=privacy_request.id, identity_attribute="phone_number"
+        )
+    )
+    assert privacy_request.get_cached_identity_data() == {"email": "test@example.com"}
+
 class TestPrivacyRequestTriggerWebhooks:
     def test_trigger_one_way_policy_webhook(
         self,
@@ -322,3 +354,46 @@ class TestPrivacyRequestTriggerWebhooks:
             )
             with pytest.raises(ValidationError):
                 privacy_request.trigger_policy_webhook(webhook)
+
+
+def test_create_all_inserts_in_one_statement(db: Session, policy: Policy) -> None:
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, executemany))
+
+    data = [
+        {
+            "policy_id": policy.id,
+            "client_id": policy.client_id,
+            "status": "pending",
+            "external_id": f"ext-{i}" if i % 2 else None,
+        }
+        for i in range(5)
+    ]
+    # rows may leave out optional columns
+    del data[0]["external_id"]
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        privacy_requests = PrivacyRequest.create_all(db=db, data=data)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    inserts = [s for s in statements if s[0].startswith("INSERT INTO privacyrequest")]
+    assert len(inserts) == 1
+    assert not inserts[0][1]
+
+    assert [pr.external_id for pr in privacy_requests] == [
+        None,
+        "ext-1",
+        None,
+        "ext-3",
+        None,
+    ]
+    # requests created together are still created in order
+    created_at = [pr.created_at for pr in privacy_requests]
+    assert created_at == sorted(set(created_at))
+
+    for privacy_request in privacy_requests:
+        privacy_request.delete(db=db)
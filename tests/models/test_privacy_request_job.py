@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from fidesops.db.session import get_db_session
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.models.privacy_request_job import PrivacyRequestJob
+
+
+def test_claim_leases_oldest_jobs(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    first = PrivacyRequestJob.enqueue(db, privacy_request.id)
+    second = PrivacyRequestJob.enqueue(db, privacy_request.id, "webhook-id")
+
+    claimed = PrivacyRequestJob.claim(db, "worker-1", 300, limit=1)
+    assert [job.id for job in claimed] == [first.id]
+    assert claimed[0].leased_by == "worker-1"
+    assert claimed[0].attempts == 1
+    assert claimed[0].lease_expires_at > datetime.now(timezone.utc)
+
+    claimed = PrivacyRequestJob.claim(db, "worker-2", 300, limit=10)
+    assert [job.id for job in claimed] == [second.id]
+    assert claimed[0].from_webhook_id == "webhook-id"
+
+    assert PrivacyRequestJob.claim(db, "worker-3", 300, limit=10) == []
+
+
+def test_claim_skips_jobs_being_claimed_by_another_worker(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    job = PrivacyRequestJob.enqueue(db, privacy_request.id)
+
+    with get_db_session()() as other_session:
+        locked = (
+            other_session.query(PrivacyRequestJob)
+            .filter(PrivacyRequestJob.id == job.id)
+            .with_for_update()
+            .all()
+        )
+        assert len(locked) == 1
+        assert PrivacyRequestJob.claim(db, "worker-1", 300, limit=10) == []
+        other_session.rollback()
+
+    assert [j.id for j in PrivacyRequestJob.claim(db, "worker-1", 300, 10)] == [job.id]
+
+
+def test_expired_lease_is_claimed_again(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    job = PrivacyRequestJob.enqueue(db, privacy_request.id)
+    PrivacyRequestJob.claim(db, "worker-1", 300, limit=10)
+    assert PrivacyRequestJob.claim(db, "worker-2", 300, limit=10) == []
+
+    job.update(
+        db=db,
+        data={"lease_expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)},
+    )
+    claimed = PrivacyRequestJob.claim(db, "worker-2", 300, limit=10)
+    assert [j.id for j in claimed] == [job.id]
+    assert claimed[0].leased_by == "worker-2"
+    assert claimed[0].attempts == 2
+
+
+def test_renew_and_finish_only_apply_to_the_leasing_worker(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    job = PrivacyRequestJob.enqueue(db, privacy_request.id)
+    PrivacyRequestJob.claim(db, "worker-1", 1, limit=10)
+    db.refresh(job)
+    lease_expires_at = job.lease_expires_at
+
+    assert PrivacyRequestJob.renew_leases(db, "worker-2", [job.id], 300) == 0
+    assert PrivacyRequestJob.renew_leases(db, "worker-1", [job.id], 300) == 1
+    db.refresh(job)
+    assert job.lease_expires_at > lease_expires_at + timedelta(seconds=200)
+
+    job_id = job.id
+    PrivacyRequestJob.finish(db, "worker-2", job_id)
+    assert PrivacyRequestJob.query(db).filter_by(id=job_id).count() == 1
+    PrivacyRequestJob.finish(db, "worker-1", job_id)
+    assert PrivacyRequestJob.query(db).filter_by(id=job_id).count() == 0
@@ -0,0 +1,117 @@
+from time import sleep
+from unittest import mock
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from fidesops.models.connectionconfig import (
+    AccessLevel,
+    ConnectionConfig,
+    ConnectionType,
+)
+from fidesops.service.connectors import PostgreSQLConnector
+from fidesops.service.connectors.connector_registry import (
+    CONNECTOR_EVICTION_TASK,
+    ConnectorRegistry,
+    get_connector_registry,
+)
+from fidesops.tasks.scheduled.scheduler import scheduler
+
+
+def postgres_config(**secrets) -> ConnectionConfig:
+    return ConnectionConfig(
+        key="my_postgres_db",
+        name="My Postgres DB",
+        connection_type=ConnectionType.postgres,
+        access=AccessLevel.write,
+        secrets={"host": "localhost", **secrets},
+    )
+
+
+class TestConnectorRegistry:
+    def test_connectors_are_shared(self) -> None:
+        registry = ConnectorRegistry(idle_timeout_seconds=600)
+        connector = registry.acquire(postgres_config(), PostgreSQLConnector)
+        registry.release(connector)
+
+        assert registry.acquire(postgres_config(), PostgreSQLConnector) is connector
+        assert connector.configuration.secrets == {"host": "localhost"}
+
+    def test_changed_settings_get_a_new_connector(self) -> None:
+        registry = ConnectorRegistry(idle_timeout_seconds=600)
+        connector = registry.acquire(postgres_config(), PostgreSQLConnector)
+
+        other = registry.acquire(postgres_config(password="new"), PostgreSQLConnector)
+        assert other is not connector
+
+        read_only = postgres_config()
+        read_only.access = AccessLevel.read
+        assert registry.acquire(read_only, PostgreSQLConnector) not in {
+            connector,
+            other,
+        }
+
+    def test_idle_connectors_are_closed(self) -> None:
+        registry = ConnectorRegistry(idle_timeout_seconds=0)
+        connector = registry.acquire(postgres_config(), PostgreSQLConnector)
+
+        with mock.patch.object(connector, "close") as close:
+            # still in use, so not idle
+            registry.acquire(postgres_config(password="new"), PostgreSQLConnector)
+            close.assert_not_called()
+
+            registry.release(connector)
+            close.assert_called_once()
+
+        assert registry.acquire(postgres_config(), PostgreSQLConnector) is not connector
+
+    def test_idle_connectors_are_closed_on_schedule(self) -> None:
+        registry = ConnectorRegistry(idle_timeout_seconds=1)
+        connector = registry.acquire(postgres_config(), PostgreSQLConnector)
+        job_scheduler = BackgroundScheduler()
+        registry.schedule_eviction(job_scheduler)
+        job_scheduler.start()
+        try:
+            with mock.patch.object(connector, "close") as close:
+                registry.release(connector)
+                close.assert_not_called()
+
+                # no further connectors are acquired or released
+                for _ in range(10):
+                    sleep(0.5)
+                    if close.called:
+                        break
+                close.assert_called_once()
+            assert registry.connectors == {}
+        finally:
+            job_scheduler.shutdown()
+
+    def test_process_registry_is_evicted_on_scheduler(self) -> None:
+        registry = get_connector_registry()
+        job = scheduler.get_job(job_id=CONNECTOR_EVICTION_TASK)
+        assert job is not None
+        assert isinstance(job.trigger, IntervalTrigger)
+        assert job.func == registry.evict_idle
+
+    def test_invalidate(self) -> None:
+        registry = ConnectorRegistry(idle_timeout_seconds=600)
+        unused = registry.acquire(postgres_config(), PostgreSQLConnector)
+        registry.release(unused)
+        in_use = registry.acquire(postgres_config(password="new"), PostgreSQLConnector)
+
+        with mock.patch.object(unused, "close") as close_unused, mock.patch.object(
+            in_use, "close"
+        ) as close_in_use:
+            registry.invalidate("my_postgres_db")
+            close_unused.assert_called_once()
+            close_in_use.assert_not_called()
+
+            # a request still using the old connector can finish with it,
+            # but new requests get a new connector
+            replacement = registry.acquire(
+                postgres_config(password="new"), PostgreSQLConnector
+            )
+            assert replacement is not in_use
+
+            registry.release(in_use)
+            close_in_use.assert_called_once()
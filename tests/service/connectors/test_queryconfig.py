@@ -1,8 +1,10 @@
+from unittest import mock
 from typing import Dict, Any, Set
 import pytest
 
-from fidesops.graph.config import CollectionAddress, FieldPath, ObjectField, ScalarField, Collection, FieldAddress
-from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.config import CollectionAddress, FieldPath, ObjectField, ScalarField, Collection, FieldAddress, \
+    Dataset
+from fidesops.graph.graph import DatasetGraph, Node
 from fidesops.graph.traversal import Traversal, TraversalNode
 from fidesops.models.datasetconfig import convert_dataset_to_graph
 from fidesops.models.policy import DataCategory
@@ -15,6 +17,9 @@ from fidesops.schemas.masking.masking_secrets import MaskingSecretCache, SecretT
 from fidesops.service.connectors.query_config import (
     QueryConfig,
     SQLQueryConfig,
+    PostgreSQLQueryConfig,
+    MicrosoftSQLServerQueryConfig,
+    SnowflakeQueryConfig,
     MongoQueryConfig,
 )
 
@@ -352,6 +357,264 @@ class TestSQLQueryConfig:
         )  # String rewrite masking strategy
 
 
+    def test_generate_update_stmts_batches_rows(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 6)
+        ]
+        # a row without a primary key value can't be updated
+        rows.append({"email": "customer-x@example.com", "name": "Customer X"})
+
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=2
+        )
+        assert [t.text for t in text_clauses] == [
+            "UPDATE customer SET name = :name WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1)",
+            "UPDATE customer SET name = :name WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1)",
+            "UPDATE customer SET name = :name WHERE id = :id",
+        ]
+        assert text_clauses[0]._bindparams["name"].value is None
+        assert text_clauses[0]._bindparams["id_in_stmt_generated_0"].value == 1
+        assert text_clauses[1]._bindparams["id_in_stmt_generated_1"].value == 4
+        assert text_clauses[2]._bindparams["id"].value == 5
+
+    def test_generate_update_stmts_different_masked_values(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo", masking_strategy=HASH, secret_type=SecretType.salt
+        )
+        cache_secret(secret, privacy_request.id)
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {"name": "John Customer", "id": 1},
+            {"name": "Jane Customer", "id": 2},
+            {"name": "John Customer", "id": 3},
+        ]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=10
+        )
+        # rows masked to different values are updated together, choosing each value by primary key
+        assert [t.text for t in text_clauses] == [
+            "UPDATE customer SET name = CASE id "
+            "WHEN :id_in_stmt_generated_0 THEN :name_case_stmt_generated_0 "
+            "WHEN :id_in_stmt_generated_1 THEN :name_case_stmt_generated_1 "
+            "WHEN :id_in_stmt_generated_2 THEN :name_case_stmt_generated_2 END "
+            "WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1, :id_in_stmt_generated_2)"
+        ]
+        params = {k: v.value for k, v in text_clauses[0]._bindparams.items()}
+        assert [params[f"id_in_stmt_generated_{i}"] for i in range(3)] == [1, 2, 3]
+        assert (
+            params["name_case_stmt_generated_0"]
+            == params["name_case_stmt_generated_2"]
+            != params["name_case_stmt_generated_1"]
+        )
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_update_stmts_different_masked_values_snowflake(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo", masking_strategy=HASH, secret_type=SecretType.salt
+        )
+        cache_secret(secret, privacy_request.id)
+
+        config = SnowflakeQueryConfig(customer_node)
+        rows = [
+            {"name": "John Customer", "id": 1},
+            {"name": "Jane Customer", "id": 2},
+        ]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=10
+        )
+        assert [t.text for t in text_clauses] == [
+            'UPDATE "customer" SET "name" = CASE "id" '
+            "WHEN :id_in_stmt_generated_0 THEN :name_case_stmt_generated_0 "
+            "WHEN :id_in_stmt_generated_1 THEN :name_case_stmt_generated_1 END "
+            'WHERE  "id" IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1)'
+        ]
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_update_stmts_within_parameter_limit(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo", masking_strategy=HASH, secret_type=SecretType.salt
+        )
+        cache_secret(secret, privacy_request.id)
+
+        config = MicrosoftSQLServerQueryConfig(customer_node)
+        rows = [{"name": f"Customer {i}", "id": i} for i in range(1, 1001)]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=1000
+        )
+        # each row takes a primary key and a value parameter, within SQL Server's limit
+        assert [len(t._bindparams) for t in text_clauses] == [1332, 668]
+        assert all(
+            len(t._bindparams) <= config.max_stmt_params for t in text_clauses
+        )
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_update_stmts_values_join(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        rule = erasure_policy.rules[0]
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        secret = MaskingSecretCache[str](
+            secret="adobo", masking_strategy=HASH, secret_type=SecretType.salt
+        )
+        cache_secret(secret, privacy_request.id)
+
+        config = PostgreSQLQueryConfig(customer_node)
+        rows = [
+            {"name": "John Customer", "id": 1},
+            {"name": "Jane Customer", "id": 2},
+            {"name": "John Customer", "id": 3},
+            # the same row retrieved twice is only updated once
+            {"name": "Jane Customer", "id": 2},
+        ]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=10
+        )
+        # rows masked to different values are updated together by joining on their values
+        assert [t.text for t in text_clauses] == [
+            "UPDATE customer SET name = masked_values.name "
+            "FROM (SELECT id, name FROM customer WHERE false "
+            "UNION ALL VALUES (:id_values_stmt_generated_0, :name_values_stmt_generated_0), "
+            "(:id_values_stmt_generated_1, :name_values_stmt_generated_1), "
+            "(:id_values_stmt_generated_2, :name_values_stmt_generated_2)) AS masked_values "
+            "WHERE customer.id = masked_values.id"
+        ]
+        params = {k: v.value for k, v in text_clauses[0]._bindparams.items()}
+        assert [params[f"id_values_stmt_generated_{i}"] for i in range(3)] == [1, 2, 3]
+        assert (
+            params["name_values_stmt_generated_0"]
+            == params["name_values_stmt_generated_2"]
+            != params["name_values_stmt_generated_1"]
+        )
+        clear_cache_secrets(privacy_request.id)
+
+    def test_generate_update_stmts_values_join_identical_values(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = PostgreSQLQueryConfig(customer_node)
+        rows = [{"name": f"Customer {i}", "id": i} for i in range(1, 4)]
+        text_clauses = config.generate_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=2
+        )
+        # rows masked to identical values don't need a join
+        assert [t.text for t in text_clauses] == [
+            "UPDATE customer SET name = :name WHERE id IN (:id_in_stmt_generated_0, :id_in_stmt_generated_1)",
+            "UPDATE customer SET name = :name WHERE id = :id",
+        ]
+
+    def test_masking_plan_compiled_once(
+        self, erasure_policy, example_datasets, integration_postgres_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+        config = SQLQueryConfig(customer_node)
+        plan = config.masking_plan(erasure_policy)
+        assert [m.string_path for m in plan.field_maskings] == ["name"]
+
+        with mock.patch(
+            "fidesops.service.connectors.query_config.get_strategy"
+        ) as get_strategy:
+            rows = [{"name": f"Customer {i}", "id": i} for i in range(1, 4)]
+            assert [
+                config.update_value_map(row, erasure_policy, privacy_request)
+                for row in rows
+            ] == [{"name": None}] * 3
+            assert config.masking_plan(erasure_policy) is plan
+            get_strategy.assert_not_called()
+
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
     def customer_details_node(self, integration_postgres_config, integration_mongodb_config):
@@ -489,3 +752,53 @@ class TestMongoQueryConfig:
         assert mongo_statement[1]["$set"]["birthday"] == HashMaskingStrategy(
             HashMaskingConfiguration(algorithm="SHA-512")
         ).mask("1988-01-10", privacy_request_id=privacy_request.id)
+
+
+class TestWideCollectionMasking:
+    @staticmethod
+    def wide_collection_node() -> TraversalNode:
+        collection = Collection(
+            name="wide",
+            fields=[ScalarField(name="id", primary_key=True)]
+            + [
+                ScalarField(
+                    name=f"field_{i}",
+                    data_categories=["user.provided.identifiable.name"],
+                    data_type_converter=str_converter,
+                )
+                for i in range(200)
+            ],
+        )
+        dataset = Dataset(
+            name="wide_dataset", collections=[collection], connection_key="wide_db"
+        )
+        collection.freeze()
+        return TraversalNode(Node(dataset, collection))
+
+    def test_erasure_on_wide_collection_reuses_indexes(self, erasure_policy):
+        """Masking a 200-field collection reuses the collection's field indexes for every row,
+        instead of rebuilding them for every row and field"""
+        rows = [
+            {"id": i, **{f"field_{j}": f"value {i}" for j in range(200)}}
+            for i in range(1, 21)
+        ]
+        node = self.wide_collection_node()
+        collection = node.node.collection
+        indexes = collection.indexes
+        assert len(indexes.field_dict) == 201
+        assert list(indexes.primary_keys) == [FieldPath("id")]
+        assert len(
+            indexes.field_paths_by_category["user.provided.identifiable.name"]
+        ) == 200
+
+        config = SQLQueryConfig(node)
+        with mock.patch.object(
+            Collection, "recursively_collect_matches"
+        ) as collect_matches:
+            stmts = config.generate_update_stmts(
+                rows, erasure_policy, privacy_request, batch_size=100
+            )
+        collect_matches.assert_not_called()
+        assert collection.indexes is indexes
+        assert len(stmts) == 1
+        assert len(stmts[0]._bindparams) == 200 + len(rows)
@@ -83,3 +83,24 @@ def test_mask_arguments_null():
     masked = masker.mask(None, request_id)
     assert expected == masked
     clear_cache_secrets(request_id)
+
+
+def test_mask_batch():
+    masker = HmacMaskingStrategy(HmacMaskingConfiguration(algorithm="SHA-256"))
+
+    secret_key = MaskingSecretCache[str](
+        secret="test_key", masking_strategy=HMAC, secret_type=SecretType.key
+    )
+    cache_secret(secret_key, request_id)
+    secret_salt = MaskingSecretCache[str](
+        secret="test_salt", masking_strategy=HMAC, secret_type=SecretType.salt
+    )
+    cache_secret(secret_salt, request_id)
+
+    values = ["my_data", None, "other_data"]
+    assert masker.mask_batch(values, request_id) == [
+        "df1e66dc2262ae3336f36294811f795b075900287e0a1add7974eacea8a52970",
+        None,
+        masker.mask("other_data", request_id),
+    ]
+    clear_cache_secrets(request_id)
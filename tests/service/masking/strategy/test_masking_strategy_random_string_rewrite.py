@@ -1,3 +1,5 @@
+import string
+
 from fidesops.schemas.masking.masking_configuration import (
     RandomStringMaskingConfiguration,
 )
@@ -22,3 +24,14 @@ def test_mask_no_value():
     config = RandomStringMaskingConfiguration(length=6)
     masker = RandomStringRewriteMaskingStrategy(configuration=config)
     assert None is masker.mask(None, request_id)
+
+
+def test_mask_batch():
+    request_id = "123432"
+    config = RandomStringMaskingConfiguration(length=6)
+    masker = RandomStringRewriteMaskingStrategy(configuration=config)
+    masked = masker.mask_batch(["one", None, "two"], request_id)
+    assert masked[1] is None
+    assert [len(masked[0]), len(masked[2])] == [6, 6]
+    assert masked[0] != masked[2]
+    assert set(masked[0] + masked[2]) <= set(string.ascii_lowercase + string.digits)
@@ -0,0 +1,153 @@
+from threading import Event
+from time import sleep
+from unittest.mock import Mock
+
+from sqlalchemy.orm import Session
+
+from fidesops.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
+from fidesops.models.privacy_request_job import PrivacyRequestJob
+from fidesops.service.privacy_request.worker import PrivacyRequestWorker
+from fidesops.util.async_util import wait_for
+
+
+def get_worker(
+    run: Mock,
+    max_workers: int = 2,
+    lease_seconds: int = 300,
+    heartbeat_seconds: int = 60,
+) -> PrivacyRequestWorker:
+    return PrivacyRequestWorker(
+        run=run,
+        max_workers=max_workers,
+        lease_seconds=lease_seconds,
+        heartbeat_seconds=heartbeat_seconds,
+        poll_seconds=5,
+        max_attempts=3,
+    )
+
+
+def queued_job_ids(db: Session, privacy_request: PrivacyRequest) -> list:
+    db.expire_all()
+    return [
+        job.id
+        for job in PrivacyRequestJob.filter(
+            db=db,
+            conditions=(PrivacyRequestJob.privacy_request_id == privacy_request.id),
+        )
+    ]
+
+
+def test_poll_runs_queued_jobs_up_to_max_workers(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    run = Mock()
+    worker = get_worker(run, max_workers=1)
+    worker.enqueue(privacy_request.id)
+    second = worker.enqueue(privacy_request.id, "webhook-id")
+
+    started = worker.poll()
+    assert len(started) == 1
+    started[0].result()
+    run.assert_called_once_with(privacy_request.id, None)
+    assert queued_job_ids(db, privacy_request) == [second]
+
+    for future in worker.poll():
+        future.result()
+    run.assert_called_with(privacy_request.id, "webhook-id")
+    assert queued_job_ids(db, privacy_request) == []
+
+
+def test_run_job_async_skips_jobs_claimed_elsewhere(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    run = Mock()
+    worker = get_worker(run)
+    job_id = worker.enqueue(privacy_request.id)
+    PrivacyRequestJob.claim(db, "another-worker", 300, limit=1, job_id=job_id)
+
+    wait_for(worker.run_job_async(job_id))
+    assert not run.called
+    assert queued_job_ids(db, privacy_request) == [job_id]
+    # the room reserved for the job is given back
+    assert worker._reserve(2) == 2
+
+
+def test_run_job_async_leaves_jobs_queued_without_capacity(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    started = Event()
+    release = Event()
+
+    def run(privacy_request_id, from_webhook_id):
+        started.set()
+        release.wait(10)
+
+    worker = get_worker(Mock(side_effect=run), max_workers=1)
+    worker.enqueue(privacy_request.id)
+    (first,) = worker.poll()
+    assert started.wait(10)
+
+    second = worker.enqueue(privacy_request.id, "webhook-id")
+    wait_for(worker.run_job_async(second))
+    assert worker.poll() == []
+    assert worker.run.call_count == 1
+    assert second in queued_job_ids(db, privacy_request)
+
+    release.set()
+    first.result()
+    for future in worker.poll():
+        future.result()
+    worker.run.assert_called_with(privacy_request.id, "webhook-id")
+    assert queued_job_ids(db, privacy_request) == []
+
+
+def test_failed_run_is_finished(db: Session, privacy_request: PrivacyRequest) -> None:
+    worker = get_worker(Mock(side_effect=ValueError("failed")))
+    job_id = worker.enqueue(privacy_request.id)
+    for future in worker.poll():
+        future.result()
+
+    assert queued_job_ids(db, privacy_request) == []
+    assert not worker.heartbeat(job_id)
+
+
+def test_lease_is_renewed_while_job_runs_past_it(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    release = Event()
+    worker = get_worker(
+        Mock(side_effect=lambda *_: release.wait(10)),
+        lease_seconds=2,
+        heartbeat_seconds=1,
+    )
+    job_id = worker.enqueue(privacy_request.id)
+    # started through run_job_async, so no serving worker is renewing leases
+    running = worker.run_job_async(job_id)
+
+    sleep(3.5)
+    with worker.session_factory() as session:
+        assert PrivacyRequestJob.claim(session, "another-worker", 300, limit=1) == []
+    db.expire_all()
+    assert PrivacyRequestJob.get(db=db, id=job_id).leased_by == worker.worker_id
+
+    release.set()
+    wait_for(running)
+    assert worker.run.call_count == 1
+    assert queued_job_ids(db, privacy_request) == []
+
+
+def test_job_is_abandoned_after_max_attempts(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    run = Mock()
+    worker = get_worker(run)
+    job_id = worker.enqueue(privacy_request.id)
+    PrivacyRequestJob.get(db=db, id=job_id).update(db=db, data={"attempts": 3})
+
+    for future in worker.poll():
+        future.result()
+
+    assert not run.called
+    assert queued_job_ids(db, privacy_request) == []
+    db.refresh(privacy_request)
+    assert privacy_request.status == PrivacyRequestStatus.error
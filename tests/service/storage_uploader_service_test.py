@@ -29,6 +29,8 @@ from fidesops.tasks.storage import (
     write_to_in_memory_buffer,
     LOCAL_FIDES_UPLOAD_DIRECTORY,
     encrypt_access_request_results,
+    upload_to_s3,
+    S3MultipartUpload,
 )
 from fidesops.common_exceptions import StorageUploadError
 from fidesops.util.encryption.aes_gcm_encryption_scheme import (
@@ -430,6 +432,111 @@ class TestWriteToInMemoryBuffer:
             ]
 
 
+class TestUploadToS3:
+    key = "test--encryption"
+    secrets = {
+        StorageSecrets.AWS_ACCESS_KEY_ID.value: "1345234524",
+        StorageSecrets.AWS_SECRET_ACCESS_KEY.value: "23451345834789",
+    }
+
+    @pytest.fixture(scope="function")
+    def s3(self) -> Generator:
+        s3 = Mock()
+        s3.create_multipart_upload.return_value = {"UploadId": "upload-id"}
+        s3.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f"etag-{kwargs['PartNumber']}"
+        }
+        with mock.patch("fidesops.tasks.storage.get_s3_session") as get_s3_session:
+            get_s3_session.return_value.client.return_value = s3
+            yield s3
+
+    @staticmethod
+    def uploaded_bytes(s3: Mock) -> bytes:
+        return b"".join(
+            call.kwargs["Body"] for call in s3.upload_part.call_args_list
+        )
+
+    def test_multipart_upload_parts(self, s3):
+        with S3MultipartUpload(s3, "some-bucket", "file.json", part_size=4) as upload:
+            upload.write(b"abcdefghij")
+
+        assert [call.kwargs["Body"] for call in s3.upload_part.call_args_list] == [
+            b"abcd",
+            b"efgh",
+            b"ij",
+        ]
+        s3.complete_multipart_upload.assert_called_once_with(
+            Bucket="some-bucket",
+            Key="file.json",
+            UploadId="upload-id",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        s3.abort_multipart_upload.assert_not_called()
+
+    def test_multipart_upload_aborted_on_error(self, s3):
+        with pytest.raises(ValueError):
+            with S3MultipartUpload(s3, "some-bucket", "file.json") as upload:
+                upload.write(b"abcd")
+                raise ValueError()
+
+        s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="some-bucket", Key="file.json", UploadId="upload-id"
+        )
+        s3.complete_multipart_upload.assert_not_called()
+
+    def test_upload_json(self, s3, privacy_request):
+        data = {"mysql:customer": [{"id": i, "email": f"{i}@bar"} for i in range(10)]}
+        url = upload_to_s3(
+            self.secrets, data, "some-bucket", "file.json", "json", privacy_request.id
+        )
+
+        assert url == "https://some-bucket.s3.amazonaws.com/file.json"
+        assert self.uploaded_bytes(s3) == json.dumps(data, indent=2).encode("utf-8")
+
+    def test_upload_encrypted_json(self, s3, privacy_request):
+        privacy_request.cache_encryption(self.key)
+        data = {
+            "mysql:customer": [
+                {"id": i, "email": f"{i}@bar", "created": datetime(2021, 1, 1)}
+                for i in range(5000)
+            ]
+        }
+        upload_to_s3(
+            self.secrets, data, "some-bucket", "file.json", "json", privacy_request.id
+        )
+
+        decrypted = decrypt_combined_nonce_and_message(
+            self.uploaded_bytes(s3).decode(config.security.ENCODING),
+            self.key.encode(config.security.ENCODING),
+        )
+        assert json.loads(decrypted)["mysql:customer"][4999] == {
+            "id": 4999,
+            "email": "4999@bar",
+            "created": "2021-01-01T00:00:00",
+        }
+
+    def test_upload_encrypted_csv(self, s3, privacy_request):
+        privacy_request.cache_encryption(self.key)
+        data = {"mysql:customer": [{"id": 1, "email": "foo@bar"}]}
+        upload_to_s3(
+            self.secrets, data, "some-bucket", "file.zip", "csv", privacy_request.id
+        )
+
+        zipfile = ZipFile(BytesIO(self.uploaded_bytes(s3)))
+        with zipfile.open("mysql:customer.csv") as customer_csv:
+            decrypted = decrypt_combined_nonce_and_message(
+                customer_csv.read().decode(config.security.ENCODING),
+                self.key.encode(config.security.ENCODING),
+            )
+        assert decrypted == "id,email\n1,foo@bar\n"
+
+
 class TestEncryptResultsPackage:
     def test_no_encryption_keys_set(self):
         data = "test data"
@@ -1,18 +1,27 @@
-import dask
 
+import asyncio
+from unittest import mock
+
+from fidesops.core.config import config
 from fidesops.graph.config import (
     CollectionAddress,
 )
 from fidesops.graph.traversal import Traversal
 from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.models.policy import Policy
-from fidesops.task.graph_task import collect_queries, TaskResources, EMPTY_REQUEST
+from fidesops.task.graph_task import (
+    ChildInputRows,
+    GraphTask,
+    collect_queries,
+    TaskResources,
+    EMPTY_REQUEST,
+)
+from fidesops.util.cache import get_cache_index_key
 from .traversal_data import sample_traversal
 from ..graph.graph_test_util import (
     MockSqlTask,
 )
 
-dask.config.set(scheduler="processes")
 
 connection_configs = [
     ConnectionConfig(key="mysql", connection_type=ConnectionType.postgres),
@@ -38,6 +47,122 @@ def test_to_dask_input_data() -> None:
     assert set(v["id"]) == {31, 32, 1, 2, 11, 22}
 
 
+def test_child_input_rows() -> None:
+    t = sample_traversal()
+    n = t.traversal_node_dict[CollectionAddress("mysql", "Customer")]
+
+    task = MockSqlTask(n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs))
+    child_input = ChildInputRows(task.child_field_paths())
+    child_input.add(
+        [
+            {"customer_id": 1, "name": "A", "contact_address_id": 31},
+            {"customer_id": 2, "name": "B"},
+        ]
+    )
+    child_input.add(
+        [
+            {"customer_id": 1, "name": "A2", "contact_address_id": 31},
+            {"customer_id": 3, "name": "C", "contact_address_id": [32, 33]},
+            {"customer_id": 3, "name": "C", "contact_address_id": [32, 33]},
+        ]
+    )
+    # only the distinct values children query on are kept
+    assert child_input.rows == [
+        {"contact_address_id": 31, "customer_id": 1},
+        {"customer_id": 2},
+        {"contact_address_id": [32, 33], "customer_id": 3},
+        {"contact_address_id": [32, 33], "customer_id": 3},
+    ]
+
+    # a node without children has nothing to hand downstream
+    leaf = t.traversal_node_dict[CollectionAddress("mysql", "User")]
+    task = MockSqlTask(leaf, TaskResources(EMPTY_REQUEST, Policy(), connection_configs))
+    child_input = ChildInputRows(task.child_field_paths())
+    child_input.add([{"id": 1, "user_id": "1", "name": "A"}])
+    assert child_input.rows == []
+
+
+@mock.patch.object(config.execution, "RESULT_BATCH_SIZE", 2)
+def test_input_batches() -> None:
+    assert GraphTask.input_batches({"id": [1, 2]}) == [{"id": [1, 2]}]
+    assert GraphTask.input_batches({"id": [1, 2, 3], "email": ["a"]}) == [
+        {"id": [1, 2]},
+        {"id": [3]},
+        {"email": ["a"]},
+    ]
+
+
+@mock.patch.object(config.execution, "RESULT_BATCH_SIZE", 2)
+def test_access_request_caches_results_in_batches(privacy_request) -> None:
+    t = sample_traversal()
+    n = t.traversal_node_dict[CollectionAddress("mysql", "Customer")]
+    resources = TaskResources(privacy_request, Policy(), connection_configs)
+    task = MockSqlTask(n, resources)
+    queried_with = []
+
+    def retrieve_data_batches(node, policy, input_data):
+        queried_with.append(input_data)
+        # every customer matches both of the emails queried for
+        yield [{"customer_id": 1, "email": "a"}, {"customer_id": 2, "email": "b"}]
+        yield [{"customer_id": 3, "email": "c"}]
+
+    task.connector = mock.Mock(retrieve_data_batches=retrieve_data_batches)
+    child_rows = task.access_request([{"email": "a"}, {"email": "b"}, {"email": "c"}])
+
+    assert queried_with == [{"email": ["a", "b"]}, {"email": ["c"]}]
+    assert child_rows == [{"customer_id": 1}, {"customer_id": 2}, {"customer_id": 3}]
+    results = resources.get_all_cached_objects()
+    assert results[str(n.address)] == [
+        {"customer_id": 1, "email": "a"},
+        {"customer_id": 2, "email": "b"},
+        {"customer_id": 3, "email": "c"},
+    ]
+
+    # batches left over from an earlier attempt are removed
+    task.connector = mock.Mock(
+        retrieve_data_batches=lambda *_: iter([[{"customer_id": 4}]])
+    )
+    task.access_request([{"email": "d"}])
+    assert resources.get_all_cached_objects()[str(n.address)] == [{"customer_id": 4}]
+    resources.cache.delete_index(get_cache_index_key(privacy_request.id))
+
+
+@mock.patch.object(config.execution, "RESULT_BATCH_SIZE", 2)
+def test_access_request_async_caches_results_in_batches(privacy_request) -> None:
+    t = sample_traversal()
+    n = t.traversal_node_dict[CollectionAddress("mysql", "Customer")]
+    resources = TaskResources(privacy_request, Policy(), connection_configs)
+    task = MockSqlTask(n, resources)
+    queried_with = []
+
+    async def retrieve_data_async(node, policy, input_data):
+        queried_with.append(input_data)
+        # every customer matches all of the emails queried for
+        return [
+            {"customer_id": 1, "email": "a"},
+            {"customer_id": 2, "email": "b"},
+            {"customer_id": 3, "email": "c"},
+        ]
+
+    task.connector = mock.Mock(
+        retrieve_data_async=retrieve_data_async,
+        supports_async_retrieval=lambda: True,
+    )
+    assert task.access_request_task() == task.access_request_async
+    child_rows = asyncio.run(
+        task.access_request_async([{"email": "a"}, {"email": "b"}, {"email": "c"}])
+    )
+
+    assert queried_with == [{"email": ["a", "b"]}, {"email": ["c"]}]
+    assert child_rows == [{"customer_id": 1}, {"customer_id": 2}, {"customer_id": 3}]
+    assert resources.get_all_cached_objects()[str(n.address)] == [
+        {"customer_id": 1, "email": "a"},
+        {"customer_id": 2, "email": "b"},
+        {"customer_id": 3, "email": "c"},
+    ]
+    resources.cache.delete_index(get_cache_index_key(privacy_request.id))
+
+
 def test_sql_dry_run_queries() -> None:
     traversal = sample_traversal()
     env = collect_queries(
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fidesops.task.task_executor import TaskExecutor, TaskExecutionError
+
+
+def test_run_passes_upstream_outputs_in_order() -> None:
+    graph = {
+        "a": (lambda: 1,),
+        "b": (lambda: 2,),
+        "c": (lambda x, y: [x, y], "b", "a"),
+        "end": (lambda *values: values, "c"),
+    }
+    assert TaskExecutor(max_workers=2).run(graph, "end") == ([2, 1],)
+
+
+def test_run_only_runs_required_tasks() -> None:
+    calls = []
+
+    def track(name: str):
+        def fn(*_):
+            calls.append(name)
+            return name
+
+        return fn
+
+    graph = {
+        "a": (track("a"),),
+        "b": (track("b"), "a"),
+        "unrelated": (track("unrelated"),),
+    }
+    assert TaskExecutor(max_workers=4).run(graph, "b") == "b"
+    assert calls == ["a", "b"]
+
+
+def test_independent_tasks_run_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_others() -> bool:
+        barrier.wait()
+        return True
+
+    graph = {
+        "a": (wait_for_others,),
+        "b": (wait_for_others,),
+        "c": (wait_for_others,),
+        "end": (lambda *values: all(values), "a", "b", "c"),
+    }
+    assert TaskExecutor(max_workers=3).run(graph, "end")
+
+
+def test_coroutine_tasks_run_concurrently_on_one_event_loop() -> None:
+    threads = []
+
+    async def wait_for_others() -> bool:
+        threads.append(threading.get_ident())
+        for _ in range(500):
+            if len(threads) == 3:
+                return True
+            await asyncio.sleep(0.01)
+        return False
+
+    graph = {
+        "a": (wait_for_others,),
+        "b": (wait_for_others,),
+        "c": (wait_for_others,),
+        "end": (lambda *values: all(values), "a", "b", "c"),
+    }
+    # the coroutines do not wait on the single worker thread
+    assert TaskExecutor(max_workers=1).run(graph, "end")
+    assert len(set(threads)) == 1
+    assert threading.get_ident() not in threads
+
+
+def test_tasks_per_group_limit() -> None:
+    lock = threading.Lock()
+    running = {"current": 0, "max": 0}
+
+    def work() -> None:
+        with lock:
+            running["current"] += 1
+            running["max"] = max(running["max"], running["current"])
+        time.sleep(0.05)
+        with lock:
+            running["current"] -= 1
+
+    graph = {f"task_{i}": (work,) for i in range(6)}
+    graph["end"] = (lambda *_: None, *[f"task_{i}" for i in range(6)])
+
+    executor = TaskExecutor(
+        max_workers=6,
+        max_tasks_per_group=2,
+        group_fn=lambda key: "connection" if key != "end" else None,
+    )
+    executor.run(graph, "end")
+    assert running["max"] == 2
+
+
+def test_task_exception_is_raised() -> None:
+    def fail() -> None:
+        raise ValueError("boom")
+
+    graph = {"a": (fail,), "b": (lambda _: 1, "a")}
+    with pytest.raises(ValueError):
+        TaskExecutor(max_workers=2).run(graph, "b")
+
+
+def test_coroutine_task_exception_cancels_running_coroutines() -> None:
+    cancelled = threading.Event()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def wait_forever() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    graph = {"a": (fail,), "b": (wait_forever,), "end": (lambda *_: None, "a", "b")}
+    with pytest.raises(ValueError):
+        TaskExecutor(max_workers=1).run(graph, "end")
+    assert cancelled.is_set()
+
+
+def test_invalid_graphs() -> None:
+    with pytest.raises(TaskExecutionError):
+        TaskExecutor(max_workers=1).run({"a": (lambda _: 1, "missing")}, "a")
+
+    with pytest.raises(TaskExecutionError):
+        TaskExecutor(max_workers=1).run({"a": (lambda: 1,)}, "missing")
+
+    cyclic = {"a": (lambda _: 1, "b"), "b": (lambda _: 1, "a")}
+    with pytest.raises(TaskExecutionError):
+        TaskExecutor(max_workers=1).run(cyclic, "a")
+
+
+def test_outputs_released_after_downstream_tasks_start() -> None:
+    released = threading.Event()
+
+    class Output:
+        def __del__(self):
+            released.set()
+
+    graph = {
+        "a": (Output,),
+        "b": (lambda _: None, "a"),
+        "c": (lambda _: released.wait(timeout=5), "b"),
+    }
+    assert TaskExecutor(max_workers=1).run(graph, "c")
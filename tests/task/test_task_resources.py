@@ -0,0 +1,142 @@
+from time import sleep
+from unittest import mock
+
+import pytest
+
+from sqlalchemy.orm import Session
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.models.policy import ActionType, Policy
+from fidesops.models.privacy_request import (
+    ExecutionLog,
+    ExecutionLogStatus,
+    PrivacyRequest,
+)
+from fidesops.task.task_resources import ExecutionLogBuffer, TaskResources
+
+
+def get_logs(db: Session, privacy_request: PrivacyRequest) -> list:
+    return (
+        ExecutionLog.query(db)
+        .filter(ExecutionLog.privacy_request_id == privacy_request.id)
+        .order_by(ExecutionLog.created_at)
+        .all()
+    )
+
+
+def test_execution_logs_are_written_in_batches_and_on_close(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    address = CollectionAddress("postgres_example", "customer")
+    statuses = [
+        ExecutionLogStatus.in_processing,
+        ExecutionLogStatus.retrying,
+        ExecutionLogStatus.in_processing,
+        ExecutionLogStatus.complete,
+    ]
+    resources = TaskResources(privacy_request, Policy(), [])
+    resources.execution_logs = ExecutionLogBuffer(batch_size=3, flush_seconds=60)
+
+    for status in statuses[:2]:
+        resources.write_execution_log(address, [], ActionType.access, status, "msg")
+    assert get_logs(db, privacy_request) == []
+
+    resources.write_execution_log(
+        address, [], ActionType.access, statuses[2], "msg"
+    )
+    assert len(get_logs(db, privacy_request)) == 3
+
+    resources.write_execution_log(
+        address,
+        [{"field_name": "email", "path": "postgres_example:customer:email"}],
+        ActionType.access,
+        statuses[3],
+        "success",
+    )
+    assert len(get_logs(db, privacy_request)) == 3
+    resources.close()
+
+    logs = get_logs(db, privacy_request)
+    assert [log.status for log in logs] == statuses
+    assert all(log.id.startswith("exe_") for log in logs)
+    assert logs[-1].fields_affected == [
+        {"field_name": "email", "path": "postgres_example:customer:email"}
+    ]
+    assert logs[-1].dataset_name == "postgres_example"
+    assert logs[-1].collection_name == "customer"
+    for log in logs:
+        log.delete(db)
+
+
+def test_execution_logs_are_written_once_the_oldest_is_due(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    address = CollectionAddress("postgres_example", "customer")
+    resources = TaskResources(privacy_request, Policy(), [])
+    resources.execution_logs = ExecutionLogBuffer(batch_size=100, flush_seconds=0)
+
+    resources.write_execution_log(
+        address, [], ActionType.erasure, ExecutionLogStatus.error, "failed"
+    )
+    logs = get_logs(db, privacy_request)
+    assert [(log.status, log.message) for log in logs] == [
+        (ExecutionLogStatus.error, "failed")
+    ]
+    logs[0].delete(db)
+
+
+def test_execution_logs_are_written_when_due_without_further_writes(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    address = CollectionAddress("postgres_example", "customer")
+    resources = TaskResources(privacy_request, Policy(), [])
+    resources.execution_logs = ExecutionLogBuffer(batch_size=100, flush_seconds=0.2)
+
+    resources.write_execution_log(
+        address, [], ActionType.access, ExecutionLogStatus.in_processing, "started"
+    )
+    assert get_logs(db, privacy_request) == []
+
+    for _ in range(50):
+        logs = get_logs(db, privacy_request)
+        if logs:
+            break
+        sleep(0.1)
+    assert [log.status for log in logs] == [ExecutionLogStatus.in_processing]
+    assert resources.execution_logs.timer is None
+    logs[0].delete(db)
+
+
+def test_closing_execution_logs_cancels_the_timer_if_they_cannot_be_written(
+    db: Session, privacy_request: PrivacyRequest
+) -> None:
+    address = CollectionAddress("postgres_example", "customer")
+    resources = TaskResources(privacy_request, Policy(), [])
+    resources.execution_logs = ExecutionLogBuffer(batch_size=100, flush_seconds=60)
+
+    resources.write_execution_log(
+        address, [], ActionType.access, ExecutionLogStatus.in_processing, "started"
+    )
+    timer = resources.execution_logs.timer
+    assert timer is not None
+
+    with mock.patch.object(
+        resources.execution_logs,
+        "SessionLocal",
+        side_effect=RuntimeError("database unavailable"),
+    ), mock.patch.object(resources.connections, "close") as close_connections:
+        with pytest.raises(RuntimeError):
+            resources.close()
+        close_connections.assert_called_once()
+    assert resources.execution_logs.timer is None
+    timer.join(1)
+    assert not timer.is_alive()
+
+    # logs written late are inserted straight away rather than waiting on a new timer
+    resources.write_execution_log(
+        address, [], ActionType.access, ExecutionLogStatus.complete, "finished"
+    )
+    assert resources.execution_logs.timer is None
+    logs = get_logs(db, privacy_request)
+    assert [log.status for log in logs] == [ExecutionLogStatus.complete]
+    logs[0].delete(db)
@@ -1,9 +1,17 @@
+import base64
+from unittest import mock
+
 import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from fidesops.util import cryptographic_util
+from fidesops.util.cryptographic_util import bytes_to_b64_str
+from fidesops.util.encryption import aes_gcm_encryption_scheme
 from fidesops.util.encryption.aes_gcm_encryption_scheme import (
+    AesGcmCipherCache,
     encrypt_verify_secret_length,
     decrypt,
+    decrypt_combined_nonce_and_message,
 )
 
 NONCE = b"B\xab\x93&\x99u\x0c\xea\xe9\xb7\x8dU"
@@ -43,3 +51,73 @@ def test_decrypt_bad_key():
             cryptographic_util.generate_secure_random_string(13).encode("UTF-8"),
             NONCE,
         )
+
+
+def test_cipher_cache_reuses_ciphers_up_to_its_size():
+    cache = AesGcmCipherCache(max_size=2)
+    other_key = cryptographic_util.generate_secure_random_string(16).encode("UTF-8")
+    third_key = cryptographic_util.generate_secure_random_string(16).encode("UTF-8")
+
+    cipher = cache.get(KEY)
+    assert cache.get(KEY) is cipher
+    assert KEY not in cache.ciphers
+    assert cache.counts() == {"hits": 1, "misses": 1, "evictions": 0}
+
+    cache.get(other_key)
+    cache.get(KEY)  # KEY is now the most recently used
+    cache.get(third_key)  # evicts other_key
+    assert len(cache.ciphers) == 2
+    assert cache.counts() == {"hits": 2, "misses": 3, "evictions": 1}
+    assert cache.get(KEY) is cipher
+    assert cache.counts()["hits"] == 3
+
+    cache.get(other_key)  # evicts third_key
+    assert len(cache.ciphers) == 2
+    assert cache.counts() == {"hits": 3, "misses": 4, "evictions": 2}
+
+    cache.clear()
+    assert not cache.ciphers
+    assert cache.counts() == {"hits": 0, "misses": 0, "evictions": 0}
+    assert cache.get(KEY) is not cipher
+
+
+def test_cipher_cache_disabled():
+    cache = AesGcmCipherCache(max_size=0)
+    assert cache.get(KEY) is not cache.get(KEY)
+    assert not cache.ciphers
+    assert cache.counts() == {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def test_cipher_cache_rejects_bad_key():
+    cache = AesGcmCipherCache(max_size=2)
+    with pytest.raises(ValueError):
+        cache.get(b"bad")
+    assert not cache.ciphers
+
+
+def test_encrypt_decrypt_builds_cipher_once_per_key():
+    """Encrypting and decrypting repeatedly with the same key builds its cipher once. A key
+    evicted from the cache has its cipher built again the next time it is used."""
+    plaintext = "Be sure to drink your Ovaltine"
+    other_key = b"0123456789abcdef"
+    with mock.patch.object(
+        aes_gcm_encryption_scheme, "_cipher_cache", AesGcmCipherCache(max_size=1)
+    ), mock.patch.object(
+        aes_gcm_encryption_scheme, "AESGCM", side_effect=AESGCM
+    ) as build_cipher:
+        for _ in range(10):
+            encrypted = encrypt_verify_secret_length(plaintext, KEY, NONCE)
+            assert decrypt(encrypted, KEY, NONCE) == plaintext
+            combined = bytes_to_b64_str(NONCE + base64.b64decode(encrypted))
+            assert decrypt_combined_nonce_and_message(combined, KEY) == plaintext
+        build_cipher.assert_called_once_with(KEY)
+
+        # using another key evicts KEY's cipher
+        encrypt_verify_secret_length(plaintext, other_key, NONCE)
+        assert decrypt(encrypted, KEY, NONCE) == plaintext
+        assert decrypt(encrypted, KEY, NONCE) == plaintext
+        assert build_cipher.call_args_list == [
+            mock.call(KEY),
+            mock.call(other_key),
+            mock.call(KEY),
+        ]
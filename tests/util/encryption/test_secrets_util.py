@@ -1,4 +1,7 @@
 from typing import List, Dict
+from unittest import mock
+
+from fidesops.models.privacy_request import PrivacyRequest
 
 from fidesops.schemas.masking.masking_secrets import (
     MaskingSecretCache,
@@ -10,6 +13,7 @@ from fidesops.service.masking.strategy.masking_strategy_hmac import (
     HMAC,
     HmacMaskingStrategy,
 )
+from fidesops.util.cache import get_cache, get_cache_index_key
 from fidesops.util.encryption.secrets_util import SecretsUtil
 from ...test_helpers.cache_secrets_helper import cache_secret, clear_cache_secrets
 
@@ -84,3 +88,41 @@ def test_build_masking_secrets_for_cache() -> None:
         masking_meta
     )
     assert len(result) == 2
+
+
+def test_prefetched_secrets() -> None:
+    privacy_request = PrivacyRequest(id="prefetch-12345")
+    masking_meta: Dict[
+        SecretType, MaskingSecretMeta
+    ] = HmacMaskingStrategy._build_masking_secret_meta()
+    for secret_type in [SecretType.key, SecretType.salt]:
+        privacy_request.cache_masking_secret(
+            MaskingSecretCache[str](
+                secret=f"test_{secret_type.value}",
+                masking_strategy=HMAC,
+                secret_type=secret_type,
+            )
+        )
+
+    with SecretsUtil.prefetched_secrets(privacy_request.id):
+        with mock.patch(
+            "fidesops.util.encryption.secrets_util.get_cache"
+        ) as get_cache_mock:
+            for secret_type in [SecretType.key, SecretType.salt]:
+                assert (
+                    SecretsUtil.get_or_generate_secret(
+                        privacy_request.id, secret_type, masking_meta[secret_type]
+                    )
+                    == f"test_{secret_type.value}"
+                )
+            get_cache_mock.assert_not_called()
+
+    # secrets are looked up in the cache again once the context exits
+    with mock.patch(
+        "fidesops.util.encryption.secrets_util.get_cache"
+    ) as get_cache_mock:
+        SecretsUtil.get_or_generate_secret(
+            privacy_request.id, SecretType.key, masking_meta[SecretType.key]
+        )
+        get_cache_mock.assert_called_once()
+    get_cache().delete_index(get_cache_index_key(privacy_request.id))
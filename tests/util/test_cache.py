@@ -1,8 +1,18 @@
 import random
 from typing import List, Any
+from unittest import mock
 
+import pytest
+import redis
+
+from fidesops.common_exceptions import RedisConnectionError
 from fidesops.core.config import config
-from fidesops.util.cache import FidesopsRedis
+from fidesops.util.cache import (
+    FidesopsRedis,
+    CacheHealthCheck,
+    get_result_batch_key,
+    join_result_batches,
+)
 from ..fixtures import faker
 
 
@@ -70,3 +80,142 @@ def test_scan(cache: FidesopsRedis) -> List:
     cache.delete_keys_by_prefix(f"EN_{prefix}")
     keys = cache.get_keys_by_prefix(f"EN_{prefix}")
     assert len(keys) == 0
+
+
+def test_encode_decode_binary() -> None:
+    test_obj = CacheTestObject(random.random(), faker.name())
+    encoded = FidesopsRedis.encode_obj_binary(test_obj)
+    assert FidesopsRedis.decode_obj(encoded) == test_obj
+    # base64 encoded objects can still be decoded, whether read as bytes or str
+    assert FidesopsRedis.decode_obj(FidesopsRedis.encode_obj(test_obj)) == test_obj
+    assert (
+        FidesopsRedis.decode_obj(FidesopsRedis.encode_obj(test_obj).decode())
+        == test_obj
+    )
+
+
+def test_encode_binary_compression() -> None:
+    rows = [{"email": faker.email(), "name": faker.name()} for _ in range(50)] * 10
+    uncompressed = FidesopsRedis.encode_obj_binary(rows)
+
+    original_threshold = config.redis.COMPRESSION_THRESHOLD_BYTES
+    config.redis.COMPRESSION_THRESHOLD_BYTES = 1024
+    try:
+        compressed = FidesopsRedis.encode_obj_binary(rows)
+        small = FidesopsRedis.encode_obj_binary("small")
+    finally:
+        config.redis.COMPRESSION_THRESHOLD_BYTES = original_threshold
+
+    assert len(compressed) < len(uncompressed)
+    assert FidesopsRedis.decode_obj(compressed) == rows
+    assert small == FidesopsRedis.encode_obj_binary("small")
+
+
+def test_get_encoded_objects_in_index(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    index = f"idx-{prefix}results"
+    test_data = {
+        f"{prefix}{i}": CacheTestObject(f"{prefix}{i}", random.random())
+        for i in range(10)
+    }
+    for k, v in test_data.items():
+        cache.set_encoded_object(k, v, index=index)
+    # objects outside of the index are not returned
+    cache.set_encoded_object(f"{prefix}other", CacheTestObject("other"))
+
+    assert cache.get_encoded_objects_in_index(index) == {
+        f"EN_{k}": v for k, v in test_data.items()
+    }
+    assert cache.ttl(index) > 0
+    assert cache.get_encoded_objects_in_index(f"idx-{prefix}missing") == {}
+
+
+def test_index(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    index = f"idx-{prefix}"
+    for i in range(3):
+        cache.set_with_autoexpire(f"{prefix}identity-{i}", f"value-{i}", index=index)
+    cache.set_encoded_object(f"{prefix}result", CacheTestObject(1), index=index)
+
+    ttl_range = range(
+        config.redis.DEFAULT_TTL_SECONDS - 2, config.redis.DEFAULT_TTL_SECONDS + 1
+    )
+    assert cache.ttl(index) in ttl_range
+    assert cache.ttl(f"{prefix}identity-0") in ttl_range
+    assert cache.get_index_members(index, f"{prefix}identity-") == [
+        f"{prefix}identity-0",
+        f"{prefix}identity-1",
+        f"{prefix}identity-2",
+    ]
+    assert len(cache.get_index_members(index)) == 4
+
+    cache.delete_index(index)
+    assert cache.get_index_members(index) == []
+    assert cache.get(f"{prefix}identity-0") is None
+    assert cache.get_encoded_by_key(f"EN_{prefix}result") is None
+
+
+def test_set_all_with_autoexpire(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    indexes = [f"idx-{prefix}0", f"idx-{prefix}1"]
+    cache.set_all_with_autoexpire(
+        {
+            indexes[0]: {f"{prefix}a": "value-a", f"{prefix}b": "value-b"},
+            indexes[1]: {f"{prefix}c": "value-c"},
+            f"idx-{prefix}empty": {},
+        }
+    )
+
+    ttl_range = range(
+        config.redis.DEFAULT_TTL_SECONDS - 2, config.redis.DEFAULT_TTL_SECONDS + 1
+    )
+    assert cache.ttl(f"{prefix}b") in ttl_range
+    assert cache.ttl(indexes[1]) in ttl_range
+    assert cache.get(f"{prefix}c") == "value-c"
+    assert cache.get_index_members(indexes[0]) == [f"{prefix}a", f"{prefix}b"]
+    assert cache.get_index_members(indexes[1]) == [f"{prefix}c"]
+
+    for index in indexes:
+        cache.delete_index(index)
+    assert cache.get(f"{prefix}a") is None
+    cache.set_all_with_autoexpire({})
+
+
+def test_join_result_batches() -> None:
+    key = "EN_pri_1__access_request__a:b"
+    values = {
+        get_result_batch_key(key, 2): [{"id": 5}],
+        get_result_batch_key(key, 0): [{"id": 1}, {"id": 2}],
+        get_result_batch_key(key, 10): [{"id": 6}],
+        get_result_batch_key(key, 1): [{"id": 3}, {"id": 4}],
+        "EN_pri_1__access_request__a:c": [{"id": 7}],
+    }
+    assert get_result_batch_key(key, 0) == key
+    assert join_result_batches(values) == {
+        key: [{"id": i} for i in range(1, 7)],
+        "EN_pri_1__access_request__a:c": [{"id": 7}],
+    }
+
+
+def test_health_check() -> None:
+    health_check = CacheHealthCheck()
+    connection = mock.Mock()
+    connection.ping.return_value = True
+
+    health_check.check(connection, interval_seconds=60)
+    health_check.check(connection, interval_seconds=60)
+    assert connection.ping.call_count == 1
+    assert health_check.counts() == {"performed": 1, "skipped": 1}
+
+    # an interval of 0 checks on every call
+    health_check.check(connection, interval_seconds=0)
+    assert connection.ping.call_count == 2
+
+    connection.ping.side_effect = redis.exceptions.ConnectionError()
+    with pytest.raises(RedisConnectionError):
+        health_check.check(connection, interval_seconds=0)
+
+    # after a failed check, the next call checks again
+    connection.ping.side_effect = None
+    health_check.check(connection, interval_seconds=60)
+    assert health_check.counts() == {"performed": 4, "skipped": 1}
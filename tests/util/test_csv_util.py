@@ -0,0 +1,66 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from fidesops.util.csv_util import csv_lines, flatten_row
+
+
+def test_flatten_row() -> None:
+    assert flatten_row({"a": {"b": 1, "c": {"d": 2}}, "e": 3}) == {
+        "e": 3,
+        "a.b": 1,
+        "a.c.d": 2,
+    }
+    assert list(flatten_row({"a": {"b": 1, "c": {"d": 2}}, "e": 3})) == [
+        "e",
+        "a.b",
+        "a.c.d",
+    ]
+    assert flatten_row({"a": {}, "b": [{"c": 1}]}) == {"b": [{"c": 1}]}
+
+
+utc = timezone.utc
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [],
+        [{"uuid": "xyz-112-333", "name": "foo", "email": "foo@bar"}],
+        [{"_id": 1, "customer": {"x": 1, "y": [1, 2]}, "z": {}}],
+        [
+            {"a": 1, "n": {"x": 1, "y": {"z": 2}, "w": 3}, "b": None},
+            {"b": 'quoted, "value"', "c": [1, 2], "a": 2.5, "n": {"x": None}},
+            {"d": True, "s": "", "multiline": "a\nb"},
+        ],
+        [{"a": 1}, {"b": 2}],
+        [{"i": 1, "f": 0.1}, {"i": True, "f": 1}],
+        [{"f": 1e20}, {"f": 1}, {"f": 1.5e-7}, {"f": float("nan")}],
+        [{"b": True}, {"b": None}, {"b": False}],
+        [{"t": date(2021, 1, 1), "d": Decimal("1.50"), "i": 2 ** 63}, {"x": 1}],
+        [{"t": datetime(2021, 1, 1)}, {"t": None}],
+        [{"t": datetime(2021, 1, 1)}, {"t": datetime(2021, 1, 2, 3, 4, 5, 6)}],
+        [{"t": datetime(2021, 1, 1)}, {"t": datetime(2021, 1, 2, tzinfo=utc)}],
+        [{"t": datetime(2021, 1, 1)}, {"t": "not a date"}],
+        [
+            {"t": datetime(2021, 1, 1, tzinfo=utc)},
+            {"t": datetime(2021, 1, 2, 3, 4, 5, 6, tzinfo=utc)},
+        ],
+        [
+            {"t": datetime(2021, 1, 1, tzinfo=utc)},
+            {"t": datetime(2021, 1, 2, tzinfo=timezone(timedelta(hours=2)))},
+        ],
+    ],
+)
+def test_csv_lines_match_pandas(rows) -> None:
+    assert "".join(csv_lines(rows)) == pd.json_normalize(rows).to_csv(index=False)
+
+
+def test_csv_lines_are_yielded_per_row() -> None:
+    assert list(csv_lines([{"id": 1, "email": "foo@bar"}, {"id": 2}])) == [
+        "id,email\n",
+        "1,foo@bar\n",
+        "2,\n",
+    ]
@@ -3,12 +3,22 @@ from datetime import datetime
 from unittest import mock
 from unittest.mock import Mock
 
+import pytest
+
+from fidesops.common_exceptions import AuthorizationError
 from fidesops.schemas.jwt import (
     JWE_PAYLOAD_CLIENT_ID,
     JWE_ISSUED_AT,
     JWE_PAYLOAD_SCOPES,
 )
-from fidesops.util.oauth_util import generate_jwe, extract_payload, is_token_expired
+from fidesops.util.oauth_util import (
+    OAuthClientCache,
+    TokenClaims,
+    generate_jwe,
+    extract_payload,
+    get_token_claims,
+    is_token_expired,
+)
 
 
 def test_jwe_create_and_extract() -> None:
@@ -39,3 +49,63 @@ def test_token_expired(oauth_client):
     access_token = oauth_client.create_access_code_jwe()
     extracted = json.loads(extract_payload(access_token))
     assert is_token_expired(datetime.fromisoformat(extracted[JWE_ISSUED_AT])) is False
+
+
+def test_get_token_claims(oauth_client):
+    claims = get_token_claims(oauth_client.create_access_code_jwe())
+    assert claims.client_id == oauth_client.id
+    assert claims.scopes == oauth_client.scopes
+    assert is_token_expired(claims.issued_at) is False
+
+    access_token = generate_jwe(json.dumps({JWE_PAYLOAD_SCOPES: []}))
+    with pytest.raises(AuthorizationError):
+        get_token_claims(access_token)
+
+
+def test_oauth_client_cache():
+    cache = OAuthClientCache(max_size=2, ttl_seconds=60)
+    claims = TokenClaims("client_a", ["client:read"], datetime.now())
+
+    assert cache.get_token_claims("token_a") is None
+    cache.set_token_claims("token_a", claims)
+    assert cache.get_token_claims("token_a") is claims
+    assert cache.get_client_scopes("client_a") is None
+    cache.set_client_scopes("client_a", ["client:read"])
+    assert cache.get_client_scopes("client_a") == ["client:read"]
+    assert cache.counts() == {
+        "token_hits": 1,
+        "token_misses": 1,
+        "client_hits": 1,
+        "client_misses": 1,
+    }
+
+    # The least recently used entries are evicted once the cache is full
+    cache.set_client_scopes("client_b", [])
+    cache.set_client_scopes("client_c", [])
+    assert list(cache.clients) == ["client_b", "client_c"]
+
+    cache.set_client_scopes("client_a", ["client:read"])
+    cache.invalidate_client("client_a")
+    assert cache.get_token_claims("token_a") is None
+    assert cache.get_client_scopes("client_a") is None
+
+    cache.clear()
+    assert cache.counts()["token_misses"] == 0
+
+
+def test_oauth_client_cache_expiry():
+    cache = OAuthClientCache(max_size=2, ttl_seconds=60)
+    with mock.patch("fidesops.util.oauth_util.monotonic", return_value=0):
+        cache.set_client_scopes("client_a", [])
+    with mock.patch("fidesops.util.oauth_util.monotonic", return_value=59):
+        assert cache.get_client_scopes("client_a") == []
+    with mock.patch("fidesops.util.oauth_util.monotonic", return_value=60):
+        assert cache.get_client_scopes("client_a") is None
+    assert cache.clients == {}
+
+
+def test_oauth_client_cache_disabled():
+    cache = OAuthClientCache(max_size=0, ttl_seconds=60)
+    cache.set_client_scopes("client_a", [])
+    assert cache.get_client_scopes("client_a") is None
+    assert cache.counts()["client_misses"] == 0